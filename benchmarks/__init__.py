@@ -0,0 +1,7 @@
+"""
+Reproducible benchmarks of the py2mappr build pipeline on seeded synthetic
+maps. Run them with `python -m benchmarks --scales 10000 100000`.
+"""
+
+from .generate import generate_links, generate_map, generate_nodes
+from .run import compare, run, run_scale
@@ -0,0 +1,140 @@
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+_categories = ["Research", "Industry", "Policy", "Education", "Media"]
+_words = [
+    "network",
+    "climate",
+    "energy",
+    "health",
+    "data",
+    "design",
+    "ocean",
+    "urban",
+    "finance",
+    "water",
+    "policy",
+    "learning",
+]
+
+
+def _zipf_weights(n: int, exponent: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def generate_nodes(n: int, seed: int = 0, n_tags: int = 500) -> pd.DataFrame:
+    """
+    Generates a synthetic node frame with the column kinds found in real
+    maps: the node id and label, x/y coordinates, numeric columns (years,
+    integers and floats with missing values), a categorical string column, a
+    `|` separated liststring column and a markdown description.
+
+    Parameters
+    ----------
+    n : int. The number of nodes.
+
+    seed : int, optional. The seed of the random generator, by default 0.
+    The same seed always generates the same frame.
+
+    n_tags : int, optional. The size of the tag vocabulary of the liststring
+    column, by default 500. The tags are zipf distributed.
+
+    Returns
+    -------
+    pd.DataFrame. The node frame.
+    """
+    rng = np.random.default_rng(seed)
+
+    tags = np.array([f"tag {i}" for i in range(n_tags)])
+    tag_counts = rng.integers(1, 6, size=n)
+    tag_values = rng.choice(
+        tags, size=tag_counts.sum(), p=_zipf_weights(n_tags, 1.1)
+    )
+    liststrings = [
+        "|".join(values)
+        for values in np.split(tag_values, np.cumsum(tag_counts)[:-1])
+    ]
+
+    words = rng.choice(_words, size=(n, 3))
+    descriptions = [
+        f"**{a.title()}** work on {b} and [{c}](https://example.org/{i})."
+        for i, (a, b, c) in enumerate(words)
+    ]
+
+    score = rng.random(n)
+    score[rng.random(n) < 0.1] = np.nan
+
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "label": [f"Node {i}" for i in range(n)],
+            "X": rng.normal(size=n),
+            "Y": rng.normal(size=n),
+            "year": rng.integers(1950, 2024, size=n),
+            "citations": rng.zipf(2.0, size=n),
+            "score": score,
+            "category": rng.choice(_categories, size=n),
+            "keywords": liststrings,
+            "description": descriptions,
+        }
+    )
+
+
+def generate_links(
+    n_nodes: int,
+    avg_degree: float = 4,
+    exponent: float = 1.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates a synthetic edge list between the nodes of
+    :func:`generate_nodes`. The endpoints are drawn with zipf weights over a
+    random ranking of the nodes, so the degrees follow a power law. Self
+    loops are dropped.
+
+    Parameters
+    ----------
+    n_nodes : int. The number of nodes.
+
+    avg_degree : float, optional. The average number of links per node
+    before the self loops are dropped, by default 4.
+
+    exponent : float, optional. The exponent of the zipf weights, by default
+    1.0. Higher exponents concentrate the links on fewer hubs.
+
+    seed : int, optional. The seed of the random generator, by default 0.
+
+    Returns
+    -------
+    pd.DataFrame. The edge list with the `source`, `target`, `weight` and
+    `kind` columns.
+    """
+    rng = np.random.default_rng(seed)
+    n_links = int(n_nodes * avg_degree)
+
+    ranking = rng.permutation(n_nodes)
+    weights = _zipf_weights(n_nodes, exponent)
+    source = ranking[rng.choice(n_nodes, size=n_links, p=weights)]
+    target = ranking[rng.choice(n_nodes, size=n_links, p=weights)]
+    keep = source != target
+
+    return pd.DataFrame(
+        {
+            "source": source[keep],
+            "target": target[keep],
+            "weight": rng.random(n_links)[keep],
+            "kind": rng.choice(["cites", "mentions"], size=n_links)[keep],
+        }
+    )
+
+
+def generate_map(
+    n: int, avg_degree: float = 4, seed: int = 0
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generates the node frame and the edge list of a synthetic map, see
+    :func:`generate_nodes` and :func:`generate_links`.
+    """
+    return generate_nodes(n, seed), generate_links(n, avg_degree, seed=seed)
@@ -0,0 +1,246 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, List, TypedDict
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import py2mappr as mappr
+import py2mappr._project_manager as project_manager
+from py2mappr._builder import build_map, get_build_report
+from py2mappr._builder._profiler import _peak_rss
+from .generate import generate_map
+
+# bump when the layout of the results changes
+RESULTS_VERSION = 1
+
+default_scales = [10_000, 100_000, 1_000_000]
+
+
+class Timing(TypedDict):
+    min: float
+    median: float
+
+
+class ScaleResult(TypedDict):
+    nodes: int
+    links: int
+    timings: Dict[str, Timing]
+    output_bytes: Dict[str, int]
+    peak_rss: int
+
+
+def _timing(samples: List[float]) -> Timing:
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _create_map(nodes: pd.DataFrame, links: pd.DataFrame):
+    project_manager._current_project = None
+    return mappr.create_map(nodes, links)
+
+
+def _inference(
+    project, mode: str = "full", network: bool = False
+) -> Callable[[], Any]:
+    # the column statistics cached by the project are dropped, so that every
+    # run profiles the columns again
+    def infer():
+        project.inference = mode
+        if network:
+            project.network_profile.invalidate()
+            project._set_network_attributes()
+        else:
+            project.profile.invalidate()
+            project._set_attributes()
+        project.inference = "full"
+
+    return infer
+
+
+def run_scale(
+    n: int,
+    repeat: int = 3,
+    seed: int = 0,
+    avg_degree: float = 4,
+    out_dir: Path = None,
+) -> ScaleResult:
+    """
+    Benchmarks the build pipeline on a synthetic map with `n` nodes. Every
+    step runs `repeat` times on the same generated data.
+
+    The timed steps are `create_map`, the full and the sampled attribute
+    inference of the nodes, the attribute inference of the links, the whole
+    `build_map` and every build stage recorded by the build profiler, e.g.
+    `datapoints`, `links`, `settings` and `validation`.
+
+    Parameters
+    ----------
+    n : int. The number of nodes.
+
+    repeat : int, optional. The number of runs of every step, by default 3.
+
+    seed : int, optional. The seed of the data generator, by default 0.
+
+    avg_degree : float, optional. The average number of links per node, by
+    default 4.
+
+    out_dir : Path, optional. The output folder of the builds, by default a
+    temporary folder.
+
+    Returns
+    -------
+    ScaleResult. The min and median time in seconds of every step and the
+    output bytes of every build stage.
+    """
+    nodes, links = generate_map(n, avg_degree, seed)
+    samples: Dict[str, List[float]] = {}
+    output_bytes: Dict[str, int] = {}
+
+    def record(name: str, seconds: float):
+        samples.setdefault(name, []).append(seconds)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_dir = Path(out_dir or tmp_dir) / f"build_{n}"
+        for _ in range(repeat):
+            record("create_map", _timed(lambda: _create_map(nodes, links)))
+            project = project_manager.get_project()
+            record("attribute_inference", _timed(_inference(project)))
+            record(
+                "sampled_attribute_inference",
+                _timed(_inference(project, "sample")),
+            )
+            record(
+                "network_attribute_inference",
+                _timed(_inference(project, network=True)),
+            )
+
+            record(
+                "build_map",
+                _timed(
+                    lambda: build_map(
+                        project, out_folder=build_dir, profile=True
+                    )
+                ),
+            )
+            for stage in get_build_report()["stages"]:
+                record(f"stage:{stage['stage']}", stage["wall_time"])
+                output_bytes[stage["stage"]] = stage["output_bytes"]
+
+    project_manager._current_project = None
+
+    return {
+        "nodes": len(nodes),
+        "links": len(links),
+        "timings": {name: _timing(values) for name, values in samples.items()},
+        "output_bytes": output_bytes,
+        "peak_rss": _peak_rss(),
+    }
+
+
+def run(
+    scales: List[int] = default_scales,
+    repeat: int = 3,
+    seed: int = 0,
+    avg_degree: float = 4,
+    out_dir: Path = None,
+) -> Dict[str, Any]:
+    """
+    Benchmarks the build pipeline at every scale, see :func:`run_scale`.
+
+    Returns
+    -------
+    Dict[str, Any]. The results, with the environment and the parameters of
+    the run in `meta` and the result of every scale in `results`.
+    """
+    results = []
+    for n in scales:
+        print(f">> benchmarking {n} nodes", file=sys.stderr)
+        results.append(run_scale(n, repeat, seed, avg_degree, out_dir))
+
+    return {
+        "meta": {
+            "version": RESULTS_VERSION,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "seed": seed,
+            "repeat": repeat,
+            "avg_degree": avg_degree,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Compares the median timings of two result files, scale by scale.
+
+    Returns
+    -------
+    List[str]. The report lines, one per step with the baseline and current
+    times and the speedup.
+    """
+    baseline_results = {res["nodes"]: res for res in baseline["results"]}
+    lines = []
+    for res in current["results"]:
+        base = baseline_results.get(res["nodes"])
+        if base is None:
+            continue
+        lines.append(f"{res['nodes']} nodes")
+        for name, timing in res["timings"].items():
+            if name not in base["timings"]:
+                continue
+            before = base["timings"][name]["median"]
+            after = timing["median"]
+            speedup = before / after if after > 0 else float("inf")
+            lines.append(
+                f"  {name:<32} {before:10.4f}s {after:10.4f}s {speedup:7.2f}x"
+            )
+    return lines
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks the py2mappr build pipeline offline.",
+    )
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=default_scales
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--avg-degree", type=float, default=4)
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmark_results.json")
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="results to compare the run with"
+    )
+    parser.add_argument(
+        "--out-dir", type=Path, help="keep the builds in this folder"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.scales, args.repeat, args.seed, args.avg_degree, args.out_dir
+    )
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f">> results written to {args.output}", file=sys.stderr)
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            print("\n".join(compare(json.load(f), results)))
@@ -1,10 +1,25 @@
-from typing import Any, Dict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Tuple, TypedDict
 import pandas as pd
 import numpy as np
 from .attr_types import ATTR_TYPE, RENDER_TYPE
+from .profile import ColumnProfile, FrameProfile
 
+INFERENCE_MODE = Literal["full", "sample"]
+PARALLEL_BACKEND = Literal["thread", "process"]
 
-def calculate_attr_types(df: pd.DataFrame) -> Dict[str, ATTR_TYPE]:
+# the number of cells searched at once by the string checks, which stop at
+# the first chunk that decides the result
+_chunk_size = 65536
+# the tag counting starts with smaller chunks, free text columns usually
+# pass the render type thresholds within their first cells
+_first_chunk_size = 256
+
+
+def calculate_attr_types(
+    df: pd.DataFrame, profile: FrameProfile = None
+) -> Dict[str, ATTR_TYPE]:
     """
     Calculates the attribute types of the columns of the given data frame.
     Based on the data type of the column, the attribute type is determined. If
@@ -28,33 +43,58 @@ def calculate_attr_types(df: pd.DataFrame) -> Dict[str, ATTR_TYPE]:
     ----------
     df: DataFrame. The data frame to be analyzed.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    whose statistics are reused and completed. A new profile by default.
+
     Returns
     -------
     `Dict[str, ATTR_TYPE]`: A dictionary with the column names as keys and the
     attribute types as values.
     """
+    if profile is None:
+        profile = FrameProfile(df, track_changes=False)
+
     attr_types = dict()
     # for each column, determine the type of attribute it is
     for column in df.columns.values:
-        if df[column].dtype == np.number or df[column].dtype == np.int64:
-            attr_types[column] = _detect_number_column(df, column)
-        elif df[column].apply(lambda x: "|" in str(x)).any():
-            attr_types[column] = "liststring"
-        else:
-            attr_types[column] = "string"
+        attr_types[column] = _detect_attr_type(profile[column])
 
     return attr_types
 
 
-def _detect_number_column(df: pd.DataFrame, column: str) -> ATTR_TYPE:
-    if df[column].min() >= 1800 and df[column].max() <= 2100:
+def _detect_attr_type(profile: ColumnProfile) -> ATTR_TYPE:
+    if _is_number_column(profile.values):
+        return _detect_number_column(profile)
+    elif profile.has_list_values:
+        return "liststring"
+    else:
+        return "string"
+
+
+def _is_number_column(values: pd.Series) -> bool:
+    # float64 and int64 columns, i.e. what `dtype == np.number` matched
+    # before numpy 2
+    return values.dtype == np.float64 or values.dtype == np.int64
+
+
+def _has_list_values(values: pd.Series) -> bool:
+    cells = values.to_numpy(dtype=object)
+    for start in range(0, len(cells), _chunk_size):
+        # the cells are searched at once, joined into a single string
+        chunk = cells[start : start + _chunk_size]
+        if "|" in "\n".join(map(str, chunk)):
+            return True
+    return False
+
+
+def _detect_number_column(profile: ColumnProfile) -> ATTR_TYPE:
+    min, max = profile.min_max
+
+    if min >= 1800 and max <= 2100:
         return "year"
-    if df[column].min() >= 1000000000 and df[column].max() <= 9999999999:
+    if min >= 1000000000 and max <= 9999999999:
         return "timestamp"
 
-    min = df[column].min()
-    max = df[column].max()
-
     if max - min == 1:
         return "float"
 
@@ -65,7 +105,9 @@ def _detect_number_column(df: pd.DataFrame, column: str) -> ATTR_TYPE:
 
 
 def calculate_render_type(
-    df: pd.DataFrame, attr_types: Dict[str, ATTR_TYPE]
+    df: pd.DataFrame,
+    attr_types: Dict[str, ATTR_TYPE],
+    profile: FrameProfile = None,
 ) -> Dict[str, RENDER_TYPE]:
     """
     Calculates the render types of the columns of the given data frame. Based
@@ -99,42 +141,325 @@ def calculate_render_type(
     ATTR_TYPE]. A dictionary with the column names as keys and the attribute
     types as values.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    whose statistics are reused and completed. A new profile by default.
+
     Returns
     -------
     `Dict[str, RENDER_TYPE]`: A dictionary with the column names as keys and
     the render types as values.
     """
+    if profile is None:
+        profile = FrameProfile(df, track_changes=False)
+
     render_types = dict()
     # for each column, determine the type of attribute it is
     for column in df.columns.values:
-        if (
-            attr_types[column] == "integer"
-            or attr_types[column] == "float"
-            or attr_types[column] == "year"
-        ):
-            render_types[column] = "histogram"
-        elif (
-            attr_types[column] == "liststring"
-            or attr_types[column] == "string"
-        ):
-            render_types[column] = _detect_string_render_type(df, column)
-        else:
-            render_types[column] = "text"
+        render_types[column] = _detect_render_type(
+            profile[column], attr_types[column]
+        )
 
     return render_types
 
 
-def _detect_string_render_type(df: pd.DataFrame, column: str) -> RENDER_TYPE:
-    str_set = set()
-    df[column].apply(lambda x: str_set.update(str(x).split("|")))
+def _detect_render_type(
+    profile: ColumnProfile, attr_type: ATTR_TYPE
+) -> RENDER_TYPE:
+    if attr_type == "integer" or attr_type == "float" or attr_type == "year":
+        return "histogram"
+    elif attr_type == "liststring" or attr_type == "string":
+        return _detect_string_render_type(profile)
+    else:
+        return "text"
+
+
+def count_distinct_tags(values: pd.Series, limit: int = None) -> int:
+    """
+    Counts the distinct `|` separated tags of the cells. The cells are read
+    in growing chunks and the count stops as soon as it exceeds the limit,
+    so deciding that a free text column has more than 100 tags only reads its
+    first cells.
+
+    Parameters
+    ----------
+    values : pd.Series. The cells of the column.
+
+    limit : int, optional. The count above which the counting stops, by
+    default None (all the cells are read).
+
+    Returns
+    -------
+    int. The count of distinct tags, any count above the limit once it is
+    passed.
+    """
+    tags = set()
+    start, size = 0, _first_chunk_size
+    while start < len(values):
+        chunk = values.iloc[start : start + size].to_numpy(dtype=object)
+        try:
+            chunk = pd.unique(chunk)
+        except TypeError:
+            pass
+        chunk_tags = "|".join(map(str, chunk)).split("|")
+        start, size = start + size, min(2 * size, _chunk_size)
+
+        tags.update(chunk_tags)
+        if limit is not None and len(tags) > limit:
+            return len(tags)
 
-    if len(str_set) > 100:
+    return len(tags)
+
+
+def _detect_string_render_type(profile: ColumnProfile) -> RENDER_TYPE:
+    return _tags_render_type(profile.tag_count(100))
+
+
+def _tags_render_type(tag_count: int) -> RENDER_TYPE:
+    if tag_count > 100:
         return "tag-cloud"
-    elif len(str_set) > 80:
+    elif tag_count > 80:
         return "tag-cloud_3"
-    elif len(str_set) > 60:
+    elif tag_count > 60:
         return "tag-cloud_2"
-    elif len(str_set) > 40:  # typical string length rather than number of tags
+    elif tag_count > 40:  # typical string length rather than number of tags
         return "wide-tag-cloud"
     else:
         return "horizontal-bars"
+
+
+class AttributeInference(TypedDict):
+    """
+    The inferred types of a column and how they were inferred. A sampled
+    column only looked at `sample_size` of the `population` rows for its
+    render type, unless the sample was ambiguous and the column was
+    `escalated` to a full scan. The confidence is the share of the tag
+    occurrences of the column estimated to be seen by the sample, 1 for the
+    scanned columns. The attribute type is always exact: the number columns
+    are typed from their min and max, and the `|` separator of a liststring
+    is searched in every row when the sample has none.
+    """
+
+    attrType: ATTR_TYPE
+    renderType: RENDER_TYPE
+    population: int
+    sample_size: int
+    escalated: bool
+    confidence: float
+
+
+def stratified_sample(
+    df: pd.DataFrame, sample_size: int, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Returns a sample of the rows of the data frame, in their order: the first
+    and the last quarter of the sample are the head and the tail of the data
+    frame, the rest is drawn at random from the rows in between.
+
+    Parameters
+    ----------
+    df : pd.DataFrame. The data frame to sample.
+
+    sample_size : int. The number of sampled rows.
+
+    seed : int, optional. The seed of the random rows, by default 0.
+
+    Returns
+    -------
+    pd.DataFrame. The sampled rows, the whole data frame if it is not larger
+    than the sample.
+    """
+    if sample_size >= len(df):
+        return df
+
+    edge = sample_size // 4
+    middle = np.random.default_rng(seed).choice(
+        len(df) - 2 * edge, size=sample_size - 2 * edge, replace=False
+    )
+    positions = np.concatenate(
+        [
+            np.arange(edge),
+            np.sort(middle) + edge,
+            np.arange(len(df) - edge, len(df)),
+        ]
+    )
+    return df.iloc[positions]
+
+
+def _tag_coverage(values: pd.Series) -> Tuple[float, int]:
+    # the Good-Turing estimate of the share of the tag occurrences whose tag
+    # was seen, one minus the share of the tags seen once, and the tag count
+    cells = values.to_numpy(dtype=object)
+    tags = Counter("|".join(map(str, cells)).split("|"))
+    singletons = sum(1 for count in tags.values() if count == 1)
+    return 1.0 - singletons / sum(tags.values()), len(tags)
+
+
+def _infer_sampled_column(
+    profile: ColumnProfile,
+    sample: pd.Series,
+    min_confidence: float,
+) -> AttributeInference:
+    population = len(profile.values)
+    inference = {
+        "population": population,
+        "sample_size": len(sample),
+        "escalated": False,
+        "confidence": 1.0,
+    }
+
+    # the min and max of a number column are exact at C speed
+    if _is_number_column(profile.values):
+        attr_type = _detect_number_column(profile)
+        return {
+            **inference,
+            "attrType": attr_type,
+            "renderType": "text" if attr_type == "timestamp" else "histogram",
+        }
+
+    # a sampled `|` decides a liststring, otherwise the separator is
+    # searched in every row, the sample misses the rare lists
+    if _has_list_values(sample) or profile.has_list_values:
+        attr_type = "liststring"
+    else:
+        attr_type = "string"
+
+    # more than 100 sampled tags decide a tag cloud, fewer are decisive only
+    # if the sample saw nearly every tag of the column
+    coverage, tag_count = _tag_coverage(sample)
+    if tag_count <= 100 and coverage < min_confidence:
+        inference["escalated"] = True
+        tag_count = profile.tag_count(100)
+    elif tag_count <= 100:
+        inference["confidence"] *= coverage
+
+    return {
+        **inference,
+        "attrType": attr_type,
+        "renderType": _tags_render_type(tag_count),
+    }
+
+
+def infer_attributes(
+    df: pd.DataFrame,
+    mode: INFERENCE_MODE = "full",
+    sample_size: int = 10000,
+    min_confidence: float = 0.99,
+    seed: int = 0,
+    profile: FrameProfile = None,
+    workers: int = 1,
+    backend: PARALLEL_BACKEND = "thread",
+) -> Dict[str, AttributeInference]:
+    """
+    Infers the attribute and the render types of the columns of the data
+    frame, see :func:`calculate_attr_types` and
+    :func:`calculate_render_type`.
+
+    In the "sample" mode, the string columns are first inferred from a
+    stratified sample of the rows, see :func:`stratified_sample`. A column
+    is escalated to a full scan of its tags when the sample is ambiguous,
+    i.e. when the share of its tags seen by the sample is below
+    `min_confidence`. The attribute types are exact: the number columns are
+    typed from their min and max, and the `|` separator is searched in every
+    row of the string columns whose sample has none.
+
+    Parameters
+    ----------
+    df : pd.DataFrame. The data frame to be analyzed.
+
+    mode : INFERENCE_MODE, optional. "full" scans every row, "sample" starts
+    from a sample, by default "full".
+
+    sample_size : int, optional. The number of sampled rows, by default
+    10000.
+
+    min_confidence : float, optional. The confidence below which a sampled
+    column is escalated to a full scan, by default 0.99.
+
+    seed : int, optional. The seed of the sample, by default 0.
+
+    profile : FrameProfile, optional. The column profiles of the data frame,
+    whose statistics are reused and completed. A new profile by default.
+
+    workers : int, optional. The number of threads or processes the columns
+    are split across, by default 1 (infer in this thread). The result is the
+    same whatever the number of workers.
+
+    backend : PARALLEL_BACKEND, optional. "thread" shares the columns with a
+    thread pool, which runs the vectorized pandas code in parallel, "process"
+    sends them to a process pool, which also runs the python loops of the
+    string checks in parallel, by default "thread".
+
+    Returns
+    -------
+    Dict[str, AttributeInference]. The inferred types of every column, with
+    the sample size and the confidence of their inference.
+    """
+    if mode not in ["full", "sample"]:
+        raise ValueError(f"Unknown inference mode: {mode}")
+
+    if profile is None:
+        profile = FrameProfile(df, track_changes=False)
+
+    if backend not in ["thread", "process"]:
+        raise ValueError(f"Unknown parallel backend: {backend}")
+
+    columns = df.columns.values
+    profiles = [profile[column] for column in columns]
+    if mode == "full" or sample_size >= len(df):
+        tasks = [
+            (_infer_column, column_profile) for column_profile in profiles
+        ]
+    else:
+        sample = stratified_sample(df, sample_size, seed)
+        tasks = [
+            (
+                _infer_sampled_column,
+                column_profile,
+                sample[column],
+                min_confidence,
+            )
+            for column, column_profile in zip(columns, profiles)
+        ]
+
+    if workers > 1 and len(tasks) > 1 and backend == "process":
+        # the columns are sent in a few chunks per process
+        chunk_size = max(1, -(-len(tasks) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_run_column_task, tasks, chunksize=chunk_size)
+            )
+    elif workers > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_column_task, tasks))
+    else:
+        results = [_run_column_task(task) for task in tasks]
+
+    inferences = {}
+    for column, column_profile, (inference, task_profile) in zip(
+        columns, profiles, results
+    ):
+        # the statistics computed by another process are kept by the profile
+        if task_profile is not column_profile:
+            column_profile.merge(task_profile)
+        inferences[column] = inference
+    return inferences
+
+
+def _infer_column(profile: ColumnProfile) -> AttributeInference:
+    attr_type = _detect_attr_type(profile)
+    return {
+        "attrType": attr_type,
+        "renderType": _detect_render_type(profile, attr_type),
+        "population": len(profile.values),
+        "sample_size": len(profile.values),
+        "escalated": False,
+        "confidence": 1.0,
+    }
+
+
+def _run_column_task(
+    task: Tuple[Callable[..., AttributeInference], ColumnProfile, Any],
+) -> Tuple[AttributeInference, ColumnProfile]:
+    # runs in the pool, the profile is returned with its new statistics
+    infer, profile, *args = task
+    return infer(profile, *args), profile
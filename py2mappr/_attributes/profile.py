@@ -0,0 +1,306 @@
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+import hashlib
+import numpy as np
+import pandas as pd
+
+
+def _is_copy_on_write() -> bool:
+    # with copy on write, the buffer of a column is never written while
+    # another column shares it
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
+
+_copy_on_write = _is_copy_on_write()
+
+
+def _shares_buffer(a: pd.Series, b: pd.Series) -> bool:
+    # only numpy backed columns are compared by buffer, the arrays of the
+    # extension dtypes, e.g. Int64 with missing values or tz-aware datetimes,
+    # are converted to temporary copies whose addresses may be reused
+    x, y = a._values, b._values
+    if type(x) is not np.ndarray or type(y) is not np.ndarray:
+        return False
+    return (
+        x.dtype == y.dtype
+        and x.shape == y.shape
+        and x.strides == y.strides
+        and x.__array_interface__["data"] == y.__array_interface__["data"]
+        and np.shares_memory(x, y)
+    )
+
+
+def hash_column(values: pd.Series) -> Union[str, None]:
+    """
+    Fingerprints the content of a column, i.e. its dtype, length and values.
+
+    Parameters
+    ----------
+    values : pd.Series. The column to fingerprint.
+
+    Returns
+    -------
+    Union[str, None]. The fingerprint, None if the column has values that
+    cannot be hashed.
+    """
+    h = hashlib.sha1(f"{values.dtype}:{len(values)}".encode("utf-8"))
+    try:
+        h.update(
+            pd.util.hash_pandas_object(
+                values, index=False, categorize=False
+            ).values.tobytes()
+        )
+    except TypeError:
+        return None
+    return h.hexdigest()
+
+
+class ColumnProfile:
+    """
+    The statistics of a column read by the attribute inference and the layout
+    heuristics, e.g. its null count, min and max, distinct values and tags.
+    Every statistic is computed on its first use and kept.
+
+    When the changes are tracked, the content of the column is fingerprinted,
+    so that a new version of the column can be compared with the profiled
+    one, see :meth:`FrameProfile.set_frame`. The fingerprint is taken with
+    the first statistic, or when it is first needed if pandas copies on
+    write, as the profiled values are then never modified.
+
+    Parameters
+    ----------
+    values : pd.Series. The column.
+
+    track_changes : bool, optional. Whether to fingerprint the column, by
+    default True.
+    """
+
+    def __init__(self, values: pd.Series, track_changes: bool = True):
+        self.values = values
+        self.track_changes = track_changes
+        self._fingerprint: Union[str, None] = None
+        self._stats: Dict[Any, Any] = {}
+
+    def _stat(self, key: Any, compute) -> Any:
+        if key not in self._stats:
+            if not self._stats and self.track_changes and not _copy_on_write:
+                self._fingerprint = hash_column(self.values)
+            self._stats[key] = compute()
+        return self._stats[key]
+
+    @property
+    def fingerprint(self) -> Union[str, None]:
+        """
+        The fingerprint of the profiled values, None if the changes are not
+        tracked or the values cannot be hashed.
+        """
+        if self._fingerprint is None and self.track_changes:
+            if _copy_on_write and self.is_profiled:
+                self._fingerprint = hash_column(self.values)
+        return self._fingerprint
+
+    def is_unchanged(self, values: pd.Series) -> bool:
+        """
+        Whether the values are the same as the profiled ones.
+        """
+        if not self.track_changes:
+            return False
+        if _copy_on_write and _shares_buffer(self.values, values):
+            return True
+        return self.fingerprint is not None and (
+            self.fingerprint == hash_column(values)
+        )
+
+    def merge(self, other: "ColumnProfile"):
+        """
+        Adds the statistics of another profile of the same values, e.g. a
+        copy profiled by another process.
+        """
+        if not self._stats and other._fingerprint is not None:
+            self._fingerprint = other._fingerprint
+        for key, value in other._stats.items():
+            self._stats.setdefault(key, value)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    @property
+    def is_profiled(self) -> bool:
+        """
+        Whether any statistic of the column was computed.
+        """
+        return len(self._stats) > 0
+
+    @property
+    def null_count(self) -> int:
+        return self._stat(
+            "null_count", lambda: int(self.values.isnull().sum())
+        )
+
+    @property
+    def min_max(self) -> Tuple[Any, Any]:
+        return self._stat(
+            "min_max", lambda: (self.values.min(), self.values.max())
+        )
+
+    @property
+    def nunique(self) -> int:
+        return self._stat("nunique", self.values.nunique)
+
+    @property
+    def has_list_values(self) -> bool:
+        from .calculate import _has_list_values
+
+        return self._stat(
+            "has_list_values", lambda: _has_list_values(self.values)
+        )
+
+    def tag_count(self, limit: int = None) -> int:
+        """
+        Returns the count of distinct `|` separated tags, see
+        :func:`py2mappr._attributes.calculate.count_distinct_tags`.
+        """
+        from .calculate import count_distinct_tags
+
+        return self._stat(
+            ("tag_count", limit),
+            lambda: count_distinct_tags(self.values, limit),
+        )
+
+
+class FrameProfile:
+    """
+    The column profiles of a data frame, shared by the attribute inference
+    and the layout heuristics of a project so that every column is scanned
+    once. The profile of a column is created on its first use. The results
+    of the layout heuristics are memoized by the profile too, until the
+    columns of the data frame change.
+
+    The profile cannot notice the changes made in place to the data frame,
+    e.g. `df["x"] = ...`, which must be followed by :meth:`set_frame`, i.e.
+    `set_data` of the project, or by :meth:`invalidate`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame. The data frame to profile.
+
+    track_changes : bool, optional. Whether the profiled columns are
+    fingerprinted, so that their statistics can be kept by
+    :meth:`set_frame`, by default True.
+    """
+
+    def __init__(self, df: pd.DataFrame, track_changes: bool = True):
+        self.df = df
+        self.track_changes = track_changes
+        self._columns: Dict[str, ColumnProfile] = {}
+        self._memo: Dict[Hashable, Any] = {}
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        if column not in self._columns:
+            self._columns[column] = ColumnProfile(
+                self.df[column], self.track_changes
+            )
+        return self._columns[column]
+
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the memoized result of a computation on the data frame, e.g.
+        a layout heuristic, computing it on the first call.
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def profiled_columns(self) -> List[str]:
+        """
+        Returns the columns with computed statistics. After
+        :meth:`set_frame`, these are the columns known to be unchanged.
+        """
+        return [
+            column
+            for column, profile in self._columns.items()
+            if profile.is_profiled
+        ]
+
+    def null_counts(self, columns: List[str]) -> pd.Series:
+        """
+        Returns the null counts of the columns, indexed by column.
+        """
+        return pd.Series(
+            [self[column].null_count for column in columns],
+            index=columns,
+            dtype=np.int64,
+        )
+
+    def set_frame(self, df: pd.DataFrame) -> List[str]:
+        """
+        Replaces the profiled data frame. The statistics of the columns with
+        the same dtype, length and content are kept, the others are dropped.
+        The memoized results are kept only if the new data frame has the
+        same columns and every one of them is verified to be unchanged,
+        by its buffer or its fingerprint.
+
+        Parameters
+        ----------
+        df : pd.DataFrame. The new version of the data frame.
+
+        Returns
+        -------
+        List[str]. The columns whose statistics were dropped.
+        """
+        unchanged = []
+        dropped = []
+        for column, profile in list(self._columns.items()):
+            if not profile.is_profiled:
+                del self._columns[column]
+                continue
+
+            if column in df.columns and profile.is_unchanged(df[column]):
+                profile.values = df[column]
+                unchanged.append(column)
+                continue
+
+            del self._columns[column]
+            dropped.append(column)
+
+        if self._memo and not self._is_same_frame(df, unchanged):
+            self._memo.clear()
+        self.df = df
+        return dropped
+
+    def _is_same_frame(self, df: pd.DataFrame, unchanged: List[str]) -> bool:
+        if not (
+            df.columns.equals(self.df.columns)
+            and df.dtypes.equals(self.df.dtypes)
+        ):
+            return False
+        for column in df.columns:
+            if column in unchanged:
+                continue
+            # a column modified in place, in the same data frame, cannot be
+            # compared with its previous values
+            if df is self.df or not self.track_changes:
+                return False
+            old, new = self.df[column], df[column]
+            if _shares_buffer(old, new):
+                continue
+            fingerprint = hash_column(old)
+            if fingerprint is None or fingerprint != hash_column(new):
+                return False
+        return True
+
+    def invalidate(self, columns: List[str] = None):
+        """
+        Drops the profiles of the columns, of all the columns by default. To
+        be called after a column was modified in place.
+        """
+        self._memo.clear()
+        if columns is None:
+            self._columns.clear()
+        for column in columns or []:
+            self._columns.pop(column, None)
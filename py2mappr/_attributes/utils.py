@@ -1,20 +1,56 @@
-from typing import List, Tuple, Union
+from typing import Callable, List, Tuple, Union
+import functools
+import inspect
 import pandas as pd
 import numpy as np
 import warnings
+from .profile import FrameProfile
 
 images = ["image", "picture", "photo", "img", "img_url", "imgurl"]
 labels = ["originallabel", "name", "title", "label"]
 
 
-def _find_most_filled_column(df: pd.DataFrame, column_names: List[str]) -> str:
-    non_empty = df[column_names]
-    non_empty = non_empty.isnull().sum()
+def _find_most_filled_column(
+    profile: FrameProfile, column_names: List[str]
+) -> str:
+    non_empty = profile.null_counts(column_names)
 
     return non_empty.sort_values(ascending=True).index[0]
 
 
-def find_node_image_attr(df: pd.DataFrame) -> str:
+def _get_profile(df: pd.DataFrame, profile: FrameProfile) -> FrameProfile:
+    if profile is None:
+        return FrameProfile(df, track_changes=False)
+    return profile
+
+
+def _memoized(heuristic: Callable[..., str]) -> Callable[..., str]:
+    # the results are memoized by the profile of the data frame, the other
+    # arguments are part of the key
+    signature = inspect.signature(heuristic)
+
+    @functools.wraps(heuristic)
+    def memoized(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        profile: FrameProfile = bound.arguments["profile"]
+        if profile is None:
+            return heuristic(*args, **kwargs)
+
+        key = (heuristic.__name__,) + tuple(
+            tuple(value) if isinstance(value, list) else value
+            for name, value in bound.arguments.items()
+            if name not in ["df", "profile"]
+        )
+        return profile.memo(key, lambda: heuristic(*args, **kwargs))
+
+    return memoized
+
+
+@_memoized
+def find_node_image_attr(
+    df: pd.DataFrame, profile: FrameProfile = None
+) -> str:
     """
     Finds the most likely column to be used as the image attribute for nodes.
     The column is determined by the following criteria:
@@ -28,6 +64,10 @@ def find_node_image_attr(df: pd.DataFrame) -> str:
     ----------
     df: DataFrame. The data frame to be analyzed.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    e.g. the profiles shared by a project, which also memoize the result. A
+    new profile by default.
+
     Returns
     -------
     `str`: The name of the column that is most likely to be used as the image
@@ -41,10 +81,13 @@ def find_node_image_attr(df: pd.DataFrame) -> str:
     if len(match_columns) == 0:
         return None
 
-    return _find_most_filled_column(df, match_columns)
+    return _find_most_filled_column(_get_profile(df, profile), match_columns)
 
 
-def find_node_label_attr(df: pd.DataFrame) -> str:
+@_memoized
+def find_node_label_attr(
+    df: pd.DataFrame, profile: FrameProfile = None
+) -> str:
     """
     Finds the most likely column to be used as the label attribute for nodes.
     The column is determined by the following criteria:
@@ -58,6 +101,10 @@ def find_node_label_attr(df: pd.DataFrame) -> str:
     ----------
     df: DataFrame. The data frame to be analyzed.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    e.g. the profiles shared by a project, which also memoize the result. A
+    new profile by default.
+
     Returns
     -------
     `str`: The name of the column that is most likely to be used as the label
@@ -70,10 +117,13 @@ def find_node_label_attr(df: pd.DataFrame) -> str:
     if len(match_columns) == 0:
         return None
 
-    return _find_most_filled_column(df, match_columns)
+    return _find_most_filled_column(_get_profile(df, profile), match_columns)
 
 
-def find_node_size_attr(df: pd.DataFrame, exclude: List[str] = []) -> str:
+@_memoized
+def find_node_size_attr(
+    df: pd.DataFrame, exclude: List[str] = [], profile: FrameProfile = None
+) -> str:
     """
     Finds the most likely column to be used as the size attribute for nodes.
     The column is determined by the following criteria:
@@ -88,6 +138,10 @@ def find_node_size_attr(df: pd.DataFrame, exclude: List[str] = []) -> str:
 
     exclude: List[str]. A list of column names to exclude from the search.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    e.g. the profiles shared by a project, which also memoize the result. A
+    new profile by default.
+
     Returns
     -------
     `str`: The name of the column that is most likely to be used as the size
@@ -102,10 +156,13 @@ def find_node_size_attr(df: pd.DataFrame, exclude: List[str] = []) -> str:
     if len(columns) == 0:
         return None
 
-    return _find_most_filled_column(df, columns)
+    return _find_most_filled_column(_get_profile(df, profile), columns)
 
 
-def find_node_color_attr(df: pd.DataFrame) -> str:
+@_memoized
+def find_node_color_attr(
+    df: pd.DataFrame, profile: FrameProfile = None
+) -> str:
     """
     Finds the most likely column to be used as the color attribute for nodes.
     The column is determined by the following criteria:
@@ -118,18 +175,27 @@ def find_node_color_attr(df: pd.DataFrame) -> str:
     ----------
     df: DataFrame. The data frame to be analyzed.
 
+    profile: FrameProfile, optional. The column profiles of the data frame,
+    e.g. the profiles shared by a project, which also memoize the result. A
+    new profile by default.
+
     Returns
     -------
     `str`: The name of the column that is most likely to be used as the color
     attribute for nodes.
     """
-    unique_counts = df.nunique()
+    profile = _get_profile(df, profile)
+    unique_counts = pd.Series(
+        [profile[column].nunique for column in df.columns],
+        index=df.columns,
+        dtype=np.int64,
+    )
     lowest_distinct = unique_counts.min()
     lowest_distinct_columns = unique_counts[
         unique_counts == lowest_distinct
     ].index.tolist()
 
-    return _find_most_filled_column(df, lowest_distinct_columns)
+    return _find_most_filled_column(profile, lowest_distinct_columns)
 
 
 def find_node_xy_attr(
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import List, Literal
+import gzip
+import shutil
+
+COMPRESSION = Literal["gzip", "br"]
+
+# file suffix of the precompressed copy for every content encoding
+compression_suffixes = {"gzip": ".gz", "br": ".br"}
+
+_chunk_size = 1024 * 1024
+
+
+def check_compression(encodings: List[COMPRESSION]):
+    """
+    Ensures the requested content encodings are supported. The brotli
+    encoding requires the optional `brotli` package.
+
+    Parameters
+    ----------
+    encodings : List[COMPRESSION]. The requested content encodings.
+
+    Exceptions
+    ----------
+    ValueError. If an encoding is unknown.
+
+    ImportError. If `br` is requested and brotli is not installed.
+    """
+    for encoding in encodings:
+        if encoding not in compression_suffixes:
+            raise ValueError(f"Unknown compression: {encoding}")
+
+    if "br" in encodings:
+        try:
+            import brotli  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The brotli package is required for br compression, "
+                "install it with `pip install brotli`"
+            )
+
+
+def __write_gzip(path: Path, out_path: Path):
+    with open(path, "rb") as src, open(out_path, "wb") as dst:
+        # mtime is fixed so that unchanged files produce the same bytes
+        with gzip.GzipFile(
+            filename="", mode="wb", fileobj=dst, compresslevel=9, mtime=0
+        ) as gz:
+            shutil.copyfileobj(src, gz, _chunk_size)
+
+
+def __write_brotli(path: Path, out_path: Path):
+    import brotli
+
+    compressor = brotli.Compressor()
+    with open(path, "rb") as src, open(out_path, "wb") as dst:
+        for chunk in iter(lambda: src.read(_chunk_size), b""):
+            dst.write(compressor.process(chunk))
+        dst.write(compressor.finish())
+
+
+def write_precompressed(path: Path, encodings: List[COMPRESSION]):
+    """
+    Writes the precompressed copies of the file next to it, e.g.
+    `nodes.json.gz` and `nodes.json.br`. The copies left by previous builds
+    for the encodings that are not requested are removed, so they are never
+    served instead of the new file.
+
+    Parameters
+    ----------
+    path : Path. The file to be compressed.
+
+    encodings : List[COMPRESSION]. The content encodings to write.
+    """
+    path = Path(path)
+    for encoding, suffix in compression_suffixes.items():
+        out_path = Path(f"{path}{suffix}")
+        if encoding not in encodings:
+            if out_path.exists():
+                out_path.unlink()
+        elif encoding == "gzip":
+            __write_gzip(path, out_path)
+        else:
+            __write_brotli(path, out_path)
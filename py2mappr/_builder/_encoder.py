@@ -0,0 +1,179 @@
+from typing import Any, Literal, Tuple
+import datetime
+import json
+import re
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = Literal["auto", "orjson", "json"]
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Converts the values that are not natively supported by the json encoders
+    """
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class NpEncoder(json.JSONEncoder):
+    """
+    Special json encoder for numpy types
+    """
+
+    def default(self, obj):
+        try:
+            return _encode_default(obj)
+        except TypeError:
+            return super(NpEncoder, self).default(obj)
+
+
+class JsonEncoder:
+    """
+    The base class for the json encoders of the data files.
+
+    Parameters
+    ----------
+    indent : int. The indentation of the encoded documents, None for a
+    single line.
+
+    item_separator : str. The separator between the items.
+
+    key_separator : str. The separator between the keys and the values.
+    """
+
+    def __init__(self, indent: int, item_separator: str, key_separator: str):
+        self.indent = indent
+        self.item_separator = item_separator
+        self.key_separator = key_separator
+
+    def encode(self, obj: Any) -> str:
+        raise NotImplementedError()
+
+
+class StdlibJsonEncoder(JsonEncoder):
+    """
+    Encodes the documents with the standard library `json` module.
+    """
+
+    def __init__(self, indent: int = 4, separators: Tuple[str, str] = None):
+        self._encoder = NpEncoder(indent=indent, separators=separators)
+        super().__init__(
+            indent, self._encoder.item_separator, self._encoder.key_separator
+        )
+
+    def encode(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+
+class OrjsonEncoder(JsonEncoder):
+    """
+    Encodes the documents with `orjson`. Numpy scalars and arrays and
+    datetimes are serialized natively. orjson only indents by 2, so the other
+    indentations are produced by widening the indented lines.
+
+    The output is not byte-identical to the standard library encoder, which
+    is why orjson is opt-in: NaN and infinities are written as `null` rather
+    than `NaN` and `Infinity`, non-ASCII characters are written as UTF-8
+    rather than `\\u` escapes, and some floats are formatted differently,
+    e.g. `0.00006212866548627183` rather than `6.212866548627183e-05`.
+    """
+
+    def __init__(self, indent: int = 4):
+        if indent is None:
+            super().__init__(None, ",", ":")
+        else:
+            super().__init__(indent, ",", ": ")
+
+        self._option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            self._option |= orjson.OPT_INDENT_2
+
+    def _reindent(self, encoded: str) -> str:
+        return re.sub(
+            r"\n((?:  )+)",
+            lambda m: "\n" + " " * (len(m.group(1)) // 2 * self.indent),
+            encoded,
+        )
+
+    def encode(self, obj: Any) -> str:
+        encoded = orjson.dumps(
+            obj, default=_encode_default, option=self._option
+        ).decode("utf-8")
+        if self.indent is not None and self.indent != 2:
+            encoded = self._reindent(encoded)
+        return encoded
+
+
+def _orjson_supports(indent: int, separators: Tuple[str, str]) -> bool:
+    if indent is None:
+        return tuple(separators or ()) == (",", ":")
+    return separators is None or tuple(separators) == (",", ": ")
+
+
+def get_encoder(
+    indent: int = 4,
+    separators: Tuple[str, str] = None,
+    backend: JSON_BACKEND = "json",
+) -> JsonEncoder:
+    """
+    Returns the json encoder for the data files.
+
+    Parameters
+    ----------
+    indent : int, optional. The indentation of the documents, by default 4.
+
+    separators : Tuple[str, str], optional. The item and key separators, by
+    default the `json.dump` ones.
+
+    backend : JSON_BACKEND, optional. The encoding backend, by default
+    "json", the standard library `json` module. "orjson" requires orjson,
+    whose output differs, see :class:`OrjsonEncoder`. "auto" uses orjson when
+    it is installed and supports the formatting, otherwise `json`.
+
+    Returns
+    -------
+    JsonEncoder. The json encoder.
+
+    Exceptions
+    ----------
+    ValueError. If the backend is unknown or orjson is requested for a
+    formatting it doesn't support.
+
+    ImportError. If orjson is requested and it is not installed.
+    """
+    if backend not in ["auto", "orjson", "json"]:
+        raise ValueError(f"Unknown json backend: {backend}")
+
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError(
+                "The orjson package is required for the orjson backend, "
+                "install it with `pip install orjson`"
+            )
+        if not _orjson_supports(indent, separators):
+            raise ValueError(
+                f"orjson doesn't support the separators {separators}"
+            )
+
+    if backend != "json" and orjson is not None:
+        if _orjson_supports(indent, separators):
+            return OrjsonEncoder(indent)
+
+    return StdlibJsonEncoder(indent, separators)
@@ -0,0 +1,182 @@
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, List, TypedDict, Union
+import hashlib
+import json
+import pandas as pd
+
+MANIFEST_FILE = ".build_manifest.json"
+# bump to invalidate the manifests written by older versions of the builder
+MANIFEST_VERSION = 2
+
+
+class StageManifest(TypedDict):
+    """
+    The fingerprint of the inputs of a build stage and the files it wrote,
+    relative to the output folder.
+    """
+
+    fingerprint: str
+    files: List[str]
+
+
+def hash_frame(df: pd.DataFrame) -> Union[str, None]:
+    """
+    Fingerprints the content of the data frame, i.e. its columns, dtypes,
+    index and values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame. The data frame to fingerprint.
+
+    Returns
+    -------
+    Union[str, None]. The fingerprint, None if the data frame has values that
+    cannot be hashed.
+    """
+    if df is None:
+        return "none"
+
+    h = hashlib.sha1()
+    h.update(
+        json.dumps(
+            [[f"{col}", f"{dtype}"] for col, dtype in df.dtypes.items()]
+        ).encode("utf-8")
+    )
+    try:
+        h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    except TypeError:
+        return None
+
+    return h.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    # the configurations stored as overlays are fingerprinted as the dicts
+    # they stand for
+    if isinstance(value, Mapping):
+        return dict(value.items())
+    return str(value)
+
+
+def hash_config(config: Any) -> str:
+    """
+    Fingerprints a json-like configuration.
+
+    Parameters
+    ----------
+    config : Any. The configuration to fingerprint.
+
+    Returns
+    -------
+    str. The fingerprint.
+    """
+    encoded = json.dumps(config, sort_keys=True, default=_json_default)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def fingerprint(*parts: Union[str, None]) -> Union[str, None]:
+    """
+    Combines the fingerprints of the inputs of a build stage.
+
+    Returns
+    -------
+    Union[str, None]. The fingerprint of the stage, None if any of the inputs
+    could not be fingerprinted.
+    """
+    if any(part is None for part in parts):
+        return None
+    return hash_config([MANIFEST_VERSION, *parts])
+
+
+def stage_files(out_dir: Path, *paths: Path) -> List[str]:
+    """
+    Lists the files written by a build stage, relative to the output folder.
+
+    Parameters
+    ----------
+    out_dir : Path. The output folder.
+
+    *paths : Path. The files and the folders written by the stage, the
+    missing ones are left out.
+
+    Returns
+    -------
+    List[str]. The files, and the files of the folders.
+    """
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(file for file in path.rglob("*") if file.is_file())
+        elif path.exists():
+            files.append(path)
+    return sorted(Path(file).relative_to(out_dir).as_posix() for file in files)
+
+
+def is_stage_unchanged(
+    out_dir: Path,
+    manifest: Dict[str, StageManifest],
+    stage: str,
+    stage_fingerprint: Union[str, None],
+) -> bool:
+    """
+    Checks that the inputs of the stage are unchanged since the previous
+    build and that all the files it wrote are still in the output folder.
+    """
+    entry = manifest.get(stage)
+    return (
+        stage_fingerprint is not None
+        and entry is not None
+        and entry["fingerprint"] == stage_fingerprint
+        and all((Path(out_dir) / file).exists() for file in entry["files"])
+    )
+
+
+def load_manifest(out_dir: Path) -> Dict[str, StageManifest]:
+    """
+    Loads the stage fingerprints of the previous build in the output folder.
+
+    Parameters
+    ----------
+    out_dir : Path. The output folder.
+
+    Returns
+    -------
+    Dict[str, StageManifest]. The fingerprint and the files of every stage,
+    empty if there is no manifest.
+    """
+    try:
+        with open(Path(out_dir) / MANIFEST_FILE, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # the entries written by older versions of the builder are dropped
+    return {
+        stage: entry
+        for stage, entry in manifest.items()
+        if isinstance(entry, dict)
+    }
+
+
+def save_manifest(out_dir: Path, manifest: Dict[str, StageManifest]):
+    """
+    Stores the stage fingerprints of the build in the output folder.
+
+    Parameters
+    ----------
+    out_dir : Path. The output folder.
+
+    manifest : Dict[str, StageManifest]. The fingerprint and the files of
+    every stage.
+    """
+    with open(Path(out_dir) / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=4)
+
+
+def clear_manifest(out_dir: Path):
+    """
+    Removes the manifest of the output folder, e.g. when a build rewrites
+    the files without recording their fingerprints.
+    """
+    (Path(out_dir) / MANIFEST_FILE).unlink(missing_ok=True)
@@ -0,0 +1,249 @@
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, TypedDict, Union
+import json
+import os
+import sys
+import time
+from ._stream import RecordStream
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# the number of records of a stream that are produced and timed at once
+PROFILE_BATCH_SIZE = 1024
+
+
+class StageProfile(TypedDict):
+    """
+    The measurements of a build stage. The times exclude the nested stages,
+    e.g. the validation done while the settings are built. `rss_delta` is
+    the change of the resident set size over the stage, negative when the
+    stage frees memory. Where the current RSS cannot be read (outside of
+    linux) it is the growth of the process high-water mark instead, which
+    stays 0 for the stages after the most memory-heavy one.
+    """
+
+    stage: str
+    calls: int
+    wall_time: float
+    cpu_time: float
+    rss_delta: int
+    output_bytes: int
+
+
+class BuildReport(TypedDict):
+    """
+    The per-stage measurements of a build.
+    """
+
+    out_dir: str
+    wall_time: float
+    cpu_time: float
+    stages: List[StageProfile]
+
+
+def _peak_rss() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _current_rss() -> int:
+    """
+    The current resident set size of the process in bytes, read from
+    `/proc/self/statm`. Falls back to the high-water mark of the process
+    when the file is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return _peak_rss()
+    return resident * os.sysconf("SC_PAGE_SIZE")
+
+
+class BuildProfiler:
+    """
+    Records the wall time, cpu time, RSS change and output bytes of the build
+    stages.
+
+    Parameters
+    ----------
+    out_dir : Path. The output folder of the build.
+
+    report_path : Union[Path, str], optional. The file the report is written
+    to by :meth:`save`, by default None.
+    """
+
+    def __init__(self, out_dir: Path, report_path: Union[Path, str] = None):
+        self.report_path = report_path
+        self._stages: Dict[str, StageProfile] = {}
+        self._children: List[List[float]] = []
+        self._report: BuildReport = {
+            "out_dir": str(out_dir),
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "stages": [],
+        }
+
+    def _stage(self, name: str) -> StageProfile:
+        if name not in self._stages:
+            self._stages[name] = StageProfile(
+                stage=name,
+                calls=0,
+                wall_time=0.0,
+                cpu_time=0.0,
+                rss_delta=0,
+                output_bytes=0,
+            )
+            self._report["stages"].append(self._stages[name])
+        return self._stages[name]
+
+    def _record(self, name: str, wall: float, cpu: float, rss: int = 0):
+        # the time spent in the nested stages is excluded from this stage
+        # and added to the time of the enclosing one
+        child_wall, child_cpu = self._children.pop()
+        stage = self._stage(name)
+        stage["calls"] += 1
+        stage["wall_time"] += wall - child_wall
+        stage["cpu_time"] += cpu - child_cpu
+        stage["rss_delta"] += rss
+        if self._children:
+            self._children[-1][0] += wall
+            self._children[-1][1] += cpu
+        else:
+            self._report["wall_time"] += wall
+            self._report["cpu_time"] += cpu
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measures the enclosed block as the build stage `name`.
+        """
+        self._children.append([0.0, 0.0])
+        wall, cpu = time.perf_counter(), time.process_time()
+        rss = _current_rss()
+        try:
+            yield
+        finally:
+            self._record(
+                name,
+                time.perf_counter() - wall,
+                time.process_time() - cpu,
+                _current_rss() - rss,
+            )
+
+    def stream(self, stream: RecordStream, name: str) -> RecordStream:
+        """
+        Measures the production of the records of the stream as the build
+        stage `name`, e.g. the nodes that are built while `links.json` is
+        written. The records are produced and timed in batches of
+        `PROFILE_BATCH_SIZE`, every batch is a call of the stage.
+        """
+
+        def factory() -> Iterator:
+            records = iter(stream)
+            while True:
+                self._children.append([0.0, 0.0])
+                wall, cpu = time.perf_counter(), time.process_time()
+                batch = list(islice(records, PROFILE_BATCH_SIZE))
+                if not batch:
+                    self._children.pop()
+                    return
+                self._record(
+                    name,
+                    time.perf_counter() - wall,
+                    time.process_time() - cpu,
+                )
+                yield from batch
+
+        return RecordStream(factory, len(stream))
+
+    def add_output(self, name: str, *paths: Path):
+        """
+        Adds the size of the files (and of the shard folders) written by the
+        build stage `name`.
+        """
+        stage = self._stage(name)
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                stage["output_bytes"] += sum(
+                    file.stat().st_size for file in path.rglob("*")
+                )
+            elif path.exists():
+                stage["output_bytes"] += path.stat().st_size
+
+    def report(self) -> BuildReport:
+        return self._report
+
+    def save(self):
+        """
+        Writes the report to `report_path`, if it is set.
+        """
+        if self.report_path is None:
+            return
+        with open(self.report_path, "w") as f:
+            json.dump(self._report, f, indent=4)
+
+
+_profiler: BuildProfiler = None
+
+
+def start_profiler(
+    out_dir: Path, report_path: Union[Path, str] = None
+) -> BuildProfiler:
+    """
+    Starts profiling a new build. The profiler stays active after the build
+    so that the publishing of the build is recorded in the same report.
+    """
+    global _profiler
+    _profiler = BuildProfiler(out_dir, report_path)
+    return _profiler
+
+
+def stop_profiler():
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Union[BuildProfiler, None]:
+    return _profiler
+
+
+@contextmanager
+def profile_stage(name: str):
+    """
+    Measures the enclosed block as the build stage `name` when the build is
+    profiled, otherwise it does nothing.
+    """
+    if _profiler is None:
+        yield
+        return
+    with _profiler.stage(name):
+        yield
+
+
+def profile_stream(stream: RecordStream, name: str) -> RecordStream:
+    """
+    Measures the production of the records of the stream as the build stage
+    `name` when the build is profiled.
+    """
+    if _profiler is None:
+        return stream
+    return _profiler.stream(stream, name)
+
+
+def profile_output(name: str, *paths: Path):
+    """
+    Adds the size of the files to the build stage `name` when the build is
+    profiled.
+    """
+    if _profiler is not None:
+        _profiler.add_output(name, *paths)
@@ -0,0 +1,248 @@
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, Tuple
+import shutil
+from ._encoder import JSON_BACKEND, JsonEncoder, get_encoder
+
+# the number of rows converted at once by the chunked record streams
+STREAM_CHUNK_SIZE = 65536
+
+
+class RecordStream:
+    """
+    A re-iterable sequence of records. The records are produced on demand by
+    the factory every time the stream is iterated, so the whole list is never
+    kept in memory.
+
+    Parameters
+    ----------
+    factory : Callable[[], Iterator[Dict[str, Any]]]. Creates a new iterator
+    over the records.
+
+    length : int. The number of records produced by the factory.
+    """
+
+    def __init__(
+        self, factory: Callable[[], Iterator[Dict[str, Any]]], length: int
+    ):
+        self._factory = factory
+        self._length = length
+
+    @classmethod
+    def chunked(
+        cls,
+        build_chunk: Callable[[int, int], Iterable[Dict[str, Any]]],
+        length: int,
+        chunk_size: int = None,
+    ) -> "RecordStream":
+        """
+        Returns the stream of the records built chunk by chunk, so that the
+        values of at most `chunk_size` rows are converted at once.
+
+        Parameters
+        ----------
+        build_chunk : Callable[[int, int], Iterable[Dict[str, Any]]]. Builds
+        the records of the rows from `start` to `stop`.
+
+        length : int. The number of records.
+
+        chunk_size : int, optional. The number of rows of every chunk, by
+        default `STREAM_CHUNK_SIZE`.
+        """
+        chunk_size = chunk_size or STREAM_CHUNK_SIZE
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for start in range(0, length, chunk_size):
+                yield from build_chunk(start, min(start + chunk_size, length))
+
+        return cls(records, length)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._factory()
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _has_stream(obj: Any) -> bool:
+    if isinstance(obj, RecordStream):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_stream(val) for val in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_stream(val) for val in obj)
+    return False
+
+
+def _encode_nested(
+    obj: Any, encoder: JsonEncoder, indent: int, level: int
+) -> str:
+    # the nested documents are encoded as a whole and shifted to the current
+    # level, json strings never contain raw newlines
+    encoded = encoder.encode(obj)
+    if indent is not None and level > 0:
+        encoded = encoded.replace("\n", "\n" + " " * (indent * level))
+    return encoded
+
+
+def _iter_json(
+    obj: Any, encoder: JsonEncoder, indent: int, level: int
+) -> Iterator[str]:
+    if not isinstance(obj, RecordStream) and not _has_stream(obj):
+        yield _encode_nested(obj, encoder, indent, level)
+        return
+
+    item_separator = encoder.item_separator
+    key_separator = encoder.key_separator
+    if indent is None:
+        newline, closing = "", ""
+    else:
+        newline = "\n" + " " * (indent * (level + 1))
+        closing = "\n" + " " * (indent * level)
+
+    if isinstance(obj, dict):
+        items = iter(obj.items())
+        opening, ending = "{", "}"
+    else:
+        items = iter(obj)
+        opening, ending = "[", "]"
+
+    empty = True
+    if isinstance(obj, RecordStream):
+        # the records of a stream never hold streams, they are encoded
+        # without searching them
+        for item in items:
+            yield (opening if empty else item_separator) + newline
+            empty = False
+            yield _encode_nested(item, encoder, indent, level + 1)
+        yield opening + ending if empty else closing + ending
+        return
+
+    for item in items:
+        yield (opening if empty else item_separator) + newline
+        empty = False
+        if isinstance(obj, dict):
+            key, item = item
+            yield encoder.encode(key) + key_separator
+        yield from _iter_json(item, encoder, indent, level + 1)
+
+    yield opening + ending if empty else closing + ending
+
+
+def dump_json(
+    obj: Any,
+    f: IO[str],
+    indent: int = 4,
+    separators: Tuple[str, str] = None,
+    backend: JSON_BACKEND = "json",
+):
+    """
+    Writes the json document to the file. Any `RecordStream` in the document
+    is written record by record as it is produced, the output is the same as
+    encoding the fully materialized document. The records of a stream are
+    encoded as they are, they must not hold streams themselves.
+
+    Parameters
+    ----------
+    obj : Any. The document to be written.
+
+    f : IO[str]. The file to write to.
+
+    indent : int, optional. The indentation of the document, by default 4.
+
+    separators : Tuple[str, str], optional. The item and key separators, by
+    default the `json.dump` ones.
+
+    backend : JSON_BACKEND, optional. The encoding backend, see
+    :func:`get_encoder`, by default "json".
+    """
+    encoder = get_encoder(indent, separators, backend)
+    for chunk in _iter_json(obj, encoder, indent, 0):
+        f.write(chunk)
+
+
+def check_shard_size(shard_size: int):
+    """
+    Ensures the shard size is unset or a positive number of records.
+
+    Exceptions
+    ----------
+    ValueError. If the shard size is smaller than 1.
+    """
+    if shard_size is not None and shard_size < 1:
+        raise ValueError(f"Invalid shard size: {shard_size}")
+
+
+def write_shards(
+    records: Iterable[Dict[str, Any]],
+    out_data_dir: Path,
+    name: str,
+    shard_size: int = None,
+    indent: int = 4,
+    separators: Tuple[str, str] = None,
+    backend: JSON_BACKEND = "json",
+) -> Dict[str, Any]:
+    """
+    Splits the records into shards of `shard_size` records and writes every
+    shard as a json array to `<out_data_dir>/<name>/<index>.json`. The shards
+    left by previous builds are removed, when `shard_size` is not set only
+    the cleanup is done.
+
+    Parameters
+    ----------
+    records : Iterable[Dict[str, Any]]. The records to be written.
+
+    out_data_dir : Path. The data directory of the player.
+
+    name : str. The name of the shards directory.
+
+    shard_size : int, optional. The number of records in every shard, by
+    default None (no shards are written).
+
+    indent, separators, backend : optional. The formatting of the shard
+    files, see :func:`dump_json`. The records must not hold streams.
+
+    Returns
+    -------
+    Dict[str, Any]. The shards manifest with the total count of the records,
+    the shard size and the list of shards. Every shard lists its file
+    (relative to the data directory), the index of its first record, its
+    record count and its size in bytes. None if no shards are written.
+    """
+    # the previous shards are only removed once the size is known to be valid
+    check_shard_size(shard_size)
+    shards_dir = Path(out_data_dir) / name
+    if shards_dir.exists():
+        shutil.rmtree(shards_dir)
+
+    if shard_size is None:
+        return None
+
+    shards_dir.mkdir(parents=True)
+    # the shards only hold records, they are encoded as a whole
+    encoder = get_encoder(indent, separators, backend)
+    records = iter(records)
+    shards = []
+    offset = 0
+    while True:
+        shard = list(islice(records, shard_size))
+        if len(shard) == 0:
+            break
+
+        shard_file = f"{name}/{len(shards):05d}.json"
+        with open(
+            Path(out_data_dir) / shard_file, mode="w", encoding="utf-8"
+        ) as f:
+            f.write(encoder.encode(shard))
+
+        shards.append(
+            {
+                "file": shard_file,
+                "offset": offset,
+                "count": len(shard),
+                "bytes": (Path(out_data_dir) / shard_file).stat().st_size,
+            }
+        )
+        offset += len(shard)
+
+    return {"count": offset, "shardSize": shard_size, "shards": shards}
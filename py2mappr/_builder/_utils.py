@@ -1,17 +1,195 @@
-from typing import Any, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+import hashlib
+import json
 import markdown
+import numpy as np
+import pandas as pd
 from markdown3_newtab import NewTabExtension
 
+# maximum number of rendered markdown values kept in memory and on disk
+MD_CACHE_SIZE = 50000
+_md_cache_file = "markdown_cache.json"
+# minimum number of values not found in the cache to start a process pool
+MD_PARALLEL_THRESHOLD = 1000
+
+_md_renderer: markdown.Markdown = None
+_md_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _get_md_renderer() -> markdown.Markdown:
+    global _md_renderer
+    if _md_renderer is None:
+        # tab_length is set to 80 to prevent the markdown parser from
+        # converting indented text to code blocks
+        _md_renderer = markdown.Markdown(
+            extensions=["fenced_code", NewTabExtension()], tab_length=80
+        )
+    return _md_renderer
+
+
+def _md_hash(md: str) -> str:
+    return hashlib.sha1(md.encode("utf-8")).hexdigest()
+
 
 def md_to_html(md: str) -> str:
+    """
+    Renders the markdown text to html. The rendered values are kept in a
+    bounded LRU cache keyed by the content hash, so every distinct text is
+    only rendered once.
+
+    Parameters
+    ----------
+    md : str. The markdown text.
+
+    Returns
+    -------
+    str. The rendered html.
+    """
     if md is None:
         return ""
 
-    # tab_length is set to 80 to prevent the markdown parser from
-    # converting indented text to code blocks
-    return markdown.markdown(
-        md, extensions=["fenced_code", NewTabExtension()], tab_length=80
-    )
+    if not isinstance(md, str):
+        return _get_md_renderer().reset().convert(md)
+
+    key = _md_hash(md)
+    html = _md_cache.get(key)
+    if html is not None:
+        _md_cache.move_to_end(key)
+        return html
+
+    html = _get_md_renderer().reset().convert(md)
+    _cache_md(key, html)
+
+    return html
+
+
+def _cache_md(key: str, html: str):
+    _md_cache[key] = html
+    if len(_md_cache) > MD_CACHE_SIZE:
+        _md_cache.popitem(last=False)
+
+
+def _render_md_chunk(chunk: List[str]) -> List[str]:
+    renderer = _get_md_renderer()
+    return [renderer.reset().convert(md) for md in chunk]
+
+
+def _render_md_parallel(values: List[str], workers: int) -> Dict[str, str]:
+    chunk_size = max(1, -(-len(values) // (workers * 4)))
+    chunks = [
+        values[idx : idx + chunk_size]
+        for idx in range(0, len(values), chunk_size)
+    ]
+    rendered = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk, htmls in zip(chunks, pool.map(_render_md_chunk, chunks)):
+            for md, html in zip(chunk, htmls):
+                _cache_md(_md_hash(md), html)
+                rendered[md] = html
+
+    return rendered
+
+
+def md_to_html_many(values: Iterable[Any], workers: int = 1) -> List[str]:
+    """
+    Renders a sequence of markdown texts to html. Each distinct value is
+    rendered once and the results are returned in the input order.
+
+    Parameters
+    ----------
+    values : Iterable[Any]. The markdown texts.
+
+    workers : int, optional. The number of processes used to render the
+    values that are not cached yet, by default 1 (render in this process).
+    The pool is only started when at least `MD_PARALLEL_THRESHOLD` values are
+    missing from the cache.
+
+    Returns
+    -------
+    List[str]. The rendered html for every value.
+    """
+    values = list(values)
+    rendered = {}
+    if workers > 1:
+        missing = list(
+            {
+                val: None
+                for val in values
+                if isinstance(val, str) and _md_hash(val) not in _md_cache
+            }
+        )
+        if len(missing) >= MD_PARALLEL_THRESHOLD:
+            rendered = _render_md_parallel(missing, workers)
+
+    for val in values:
+        if isinstance(val, str) and val not in rendered:
+            rendered[val] = md_to_html(val)
+
+    return [
+        rendered[val] if isinstance(val, str) else md_to_html(val)
+        for val in values
+    ]
+
+
+def load_md_cache(cache_dir: Union[Path, str]):
+    """
+    Loads the rendered markdown values stored by :func:`save_md_cache`. The
+    cache is discarded if it was written by another markdown version.
+
+    Parameters
+    ----------
+    cache_dir : Union[Path, str]. The directory containing the cache file.
+    """
+    cache_path = Path(cache_dir) / _md_cache_file
+    if not cache_path.exists():
+        return
+
+    try:
+        with open(cache_path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    if data.get("version") != markdown.__version__:
+        return
+
+    # the stored values are older than anything rendered in this process
+    for key, html in reversed(list(data.get("entries", {}).items())):
+        if key not in _md_cache:
+            _md_cache[key] = html
+            _md_cache.move_to_end(key, last=False)
+    while len(_md_cache) > MD_CACHE_SIZE:
+        _md_cache.popitem(last=False)
+
+
+def save_md_cache(cache_dir: Union[Path, str]):
+    """
+    Stores the rendered markdown values so that the next build can skip
+    rendering the unchanged texts.
+
+    Parameters
+    ----------
+    cache_dir : Union[Path, str]. The directory to write the cache file to.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_dir / _md_cache_file, "w") as f:
+        json.dump(
+            {"version": markdown.__version__, "entries": dict(_md_cache)}, f
+        )
+
+
+def row_dtype(df: pd.DataFrame) -> np.dtype:
+    """
+    Returns the dtype every cell is upcast to when a row is taken out of the
+    data frame, i.e. object for mixed frames and float64 for int/float only
+    frames. The column-wise builders convert the columns to it so that they
+    produce the same values as building the records row by row.
+    """
+    return df.iloc[:0].to_numpy().dtype
 
 
 def flatten(l: List[List[Any]]) -> List[Any]:
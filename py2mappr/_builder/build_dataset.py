@@ -1,9 +1,11 @@
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Any, List, Dict, TypedDict
+from typing import Any, Iterator, List, Dict, TypedDict
 
 from py2mappr._core.config import AttributeConfig, default_attr_config
-from py2mappr._builder._utils import md_to_html
+from py2mappr._builder._utils import md_to_html_many, row_dtype
+from py2mappr._builder._stream import RecordStream
 import copy
 
 
@@ -32,7 +34,7 @@ def build_attr_descriptor(column: str, override: pd.Series) -> AttributeConfig:
     -------
     AttributeConfig. The attribute descriptor.
     """
-    attrs: AttributeConfig = dict(copy.deepcopy(default_attr_config))
+    attrs: AttributeConfig = dict(default_attr_config)
 
     # if title doesnt exist. copy from id.
     attrs["id"] = column
@@ -44,6 +46,12 @@ def build_attr_descriptor(column: str, override: pd.Series) -> AttributeConfig:
             if key in attrs:
                 attrs[key] = val
 
+    # the nested fields, e.g. the metadata, are copied so that the descriptor
+    # never shares them with the defaults or the project attributes
+    for key, val in attrs.items():
+        if isinstance(val, (dict, list)):
+            attrs[key] = copy.deepcopy(val)
+
     return attrs
 
 
@@ -72,45 +80,97 @@ def build_attrDescriptors(
     return attrDescriptors
 
 
-def __build_datapoint(
-    dp: pd.Series,
+def __to_liststring(val: Any) -> Any:
+    # check if value is NaN or not string type
+    if not isinstance(val, str):
+        return ""
+
+    # convert any liststring attr into a list
+    return [x.strip() for x in val.split("|")] if "|" in val else [val]
+
+
+def __build_column(
+    values: np.ndarray,
+    attr_type: str,
+    render_type: str,
+    render_md: bool = True,
+    workers: int = 1,
+) -> List[Any]:
+    # validate the attr vals based on type.
+    if attr_type == "liststring":
+        return [__to_liststring(val) for val in values.tolist()]
+
+    result = values.astype(object)
+    result[pd.isna(values)] = ""
+
+    if attr_type == "string" and render_type == "text" and render_md:
+        return md_to_html_many(result.tolist(), workers)
+
+    return result.tolist()
+
+
+def stream_datapoints(
+    df_datapoints: pd.DataFrame,
     dpAttribTypes: Dict[str, str],
     dpRenderTypes: Dict[str, str],
     exclude_md_attrs: List[str] = [],
-) -> Datapoint:
-    attrs: Dict[str, Any] = dict(dp)
+    workers: int = 1,
+    ids: List[str] = None,
+) -> RecordStream:
+    """
+    Build the datapoints for the dataset as a stream. The datapoints are
+    only built while the stream is iterated, in chunks of
+    `STREAM_CHUNK_SIZE` rows whose attributes are processed one column at a
+    time, so that the python values of at most one chunk are in memory.
 
-    # validate the attr vals based on type.
-    for key, val in attrs.items():
-        if dpAttribTypes[key] == "liststring":
-            # check if value is NaN or not string type
-            if isinstance(val, str):
-                # convert any liststring attr into a list
-                attrs[key] = (
-                    [x.strip() for x in val.split("|")]
-                    if "|" in val
-                    else [val]
-                )
-            else:
-                attrs[key] = ""
-        elif (
-            dpAttribTypes[key] == "float"
-            or dpAttribTypes[key] == "integer"
-            or dpAttribTypes[key] == "year"
-        ):
-            attrs[key] = val if not pd.isna(attrs[key]) else ""
+    Parameters
+    ----------
+    df_datapoints : pd.DataFrame. The dataframe containing the datapoints.
+
+    dpAttribTypes : Dict[str, str]. The attribute types for the datapoints.
+
+    dpRenderTypes : Dict[str, str]. The render types for the datapoints.
+
+    exclude_md_attrs : List[str], optional. The attributes that are never
+    rendered from markdown, by default empty list.
+
+    workers : int, optional. The number of processes used to render the
+    markdown attributes, by default 1.
+
+    ids : List[str], optional. The datapoint ids, by default computed from
+    the dataframe like the node ids.
+
+    Returns
+    -------
+    RecordStream The datapoints for the dataset.
+    """
+    dtype = row_dtype(df_datapoints)
+    keys = df_datapoints.columns.tolist()
+
+    def build_chunk(start: int, stop: int) -> Iterator[Datapoint]:
+        chunk = df_datapoints.iloc[start:stop]
+        columns = [
+            __build_column(
+                chunk.iloc[:, idx].to_numpy(dtype=dtype),
+                dpAttribTypes[key],
+                dpRenderTypes[key],
+                key not in exclude_md_attrs,
+                workers,
+            )
+            for idx, key in enumerate(keys)
+        ]
+        if ids is None:
+            chunk_ids = [f"{val}" for val in chunk["id"].to_numpy(dtype)]
         else:
-            attrs[key] = val if not pd.isna(attrs[key]) else ""
+            chunk_ids = ids[start:stop]
 
-        if (
-            dpAttribTypes[key] == "string"
-            and dpRenderTypes[key] == "text"
-            and key not in exclude_md_attrs
-        ):
-            attrs[key] = md_to_html(attrs[key])
+        # merge attrs with template
+        return (
+            {"id": dp_id, "attr": dict(zip(keys, row))}
+            for dp_id, row in zip(chunk_ids, zip(*columns))
+        )
 
-    # merge attrs with template
-    return {"id": f'{dp["id"]}', "attr": attrs}
+    return RecordStream.chunked(build_chunk, len(df_datapoints))
 
 
 def build_datapoints(
@@ -118,9 +178,10 @@ def build_datapoints(
     dpAttribTypes: Dict[str, str],
     dpRenderTypes: Dict[str, str],
     exclude_md_attrs: List[str] = [],
+    workers: int = 1,
 ) -> List[Dict[str, Any]]:
     """
-    Build the datapoints for the dataset.
+    Build the datapoints for the dataset. See :func:`stream_datapoints`.
 
     Parameters
     ----------
@@ -129,13 +190,23 @@ def build_datapoints(
     dpAttribTypes : Dict[str, str]. The attribute types for the datapoints.
 
     dpRenderTypes : Dict[str, str]. The render types for the datapoints.
+
+    exclude_md_attrs : List[str], optional. The attributes that are never
+    rendered from markdown, by default empty list.
+
+    workers : int, optional. The number of processes used to render the
+    markdown attributes, by default 1.
+
     Returns
     -------
     List[Dict[str, Any]] The datapoints for the dataset.
     """
-    datapoints = [
-        __build_datapoint(dp, dpAttribTypes, dpRenderTypes, exclude_md_attrs)
-        for _, dp in df_datapoints.iterrows()
-    ]
-
-    return datapoints
+    return list(
+        stream_datapoints(
+            df_datapoints,
+            dpAttribTypes,
+            dpRenderTypes,
+            exclude_md_attrs,
+            workers,
+        )
+    )
@@ -1,35 +1,118 @@
+from itertools import repeat
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Any, List, Dict, Union
+from typing import Any, Iterator, List, Dict, Tuple, Union
 
 from py2mappr._core.config import AttributeConfig
+from py2mappr._builder._stream import RecordStream
+from py2mappr._builder._utils import row_dtype
 
 _from_keys = ["source", "Source", "from", "From"]
 _to_keys = ["target", "Target", "to", "To"]
 
 
-def __build_node(
-    node: pd.Series, attr_map: Dict[str, AttributeConfig]
-) -> Dict[str, Any]:
-    # form the final datapoint with template
+_label_keys = ["label", "id", "OriginalLabel"]
 
-    title = (
-        node.get("label")
-        or node.get("id")
-        or node.get("OriginalLabel")
-        or "Node"
-    )
 
-    nd = {
-        "dataPointId": f'{node["id"]}',
-        "id": f'{node["id"]}',
-        "attr": {
-            "OriginalLabel": title,
-            "OriginalX": node.get(attr_map.get("OriginalX", ""), 0),
-            "OriginalY": node.get(attr_map.get("OriginalY", ""), 0),
-        },
-    }
-    return nd
+def __truthy(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind in "iufb":
+        # NaN is truthy like in python
+        return values != 0
+    return np.fromiter(map(bool, values.tolist()), bool, len(values))
+
+
+def __node_titles(df: pd.DataFrame, dtype: np.dtype) -> List[Any]:
+    # the first truthy of label, id and OriginalLabel, otherwise "Node"
+    titles = np.full(len(df), "Node", dtype=object)
+    resolved = np.zeros(len(df), dtype=bool)
+    for key in _label_keys:
+        if key not in df.columns:
+            continue
+        values = df[key].to_numpy(dtype)
+        take = __truthy(values) & ~resolved
+        titles[take] = values[take]
+        resolved |= take
+    return titles.tolist()
+
+
+def __coordinates(
+    df: pd.DataFrame,
+    dtype: np.dtype,
+    attr_map: Dict[str, AttributeConfig],
+    key: str,
+) -> List[Any]:
+    column = attr_map.get(key, "")
+    if isinstance(column, str) and column in df.columns:
+        return df[column].to_numpy(dtype).tolist()
+    return [0] * len(df)
+
+
+def node_ids(df_datapoints: pd.DataFrame) -> List[str]:
+    """
+    Returns the ids of the nodes built from the dataframe of datapoints, in
+    the order of the nodes.
+
+    Parameters
+    ----------
+    df_datapoints : pd.DataFrame. Dataframe of datapoints
+
+    Returns
+    -------
+    List[str]. The node ids
+    """
+    dtype = row_dtype(df_datapoints)
+    return [f"{val}" for val in df_datapoints["id"].to_numpy(dtype)]
+
+
+def stream_nodes(
+    df_datapoints: pd.DataFrame,
+    attr_map: Dict[str, AttributeConfig],
+    ids: List[str] = None,
+) -> RecordStream:
+    """
+    Build nodes from a dataframe of datapoints as a stream, the nodes are
+    only created while the stream is iterated, in chunks of
+    `STREAM_CHUNK_SIZE` rows.
+
+    Parameters
+    ----------
+    df_datapoints : pd.DataFrame. Dataframe of datapoints
+
+    attr_map : Dict[str, AttributeConfig]. Attribute map for the nodes
+
+    ids : List[str], optional. The node ids, see :func:`node_ids`, by default
+    computed from the dataframe.
+
+    Returns
+    -------
+    RecordStream. Stream of nodes
+    """
+    dtype = row_dtype(df_datapoints)
+
+    def build_chunk(start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        # the columns of the chunk are resolved once, the nodes are
+        # assembled from them
+        chunk = df_datapoints.iloc[start:stop]
+        chunk_ids = node_ids(chunk) if ids is None else ids[start:stop]
+        titles = __node_titles(chunk, dtype)
+        xs = __coordinates(chunk, dtype, attr_map, "OriginalX")
+        ys = __coordinates(chunk, dtype, attr_map, "OriginalY")
+
+        return (
+            {
+                "dataPointId": node_id,
+                "id": node_id,
+                "attr": {
+                    "OriginalLabel": title,
+                    "OriginalX": x,
+                    "OriginalY": y,
+                },
+            }
+            for node_id, title, x, y in zip(chunk_ids, titles, xs, ys)
+        )
+
+    return RecordStream.chunked(build_chunk, len(df_datapoints))
 
 
 def build_nodes(
@@ -52,41 +135,144 @@ def build_nodes(
     ----------
     ValueError. If the dataframe does not contain the source and target keys.
     """
-    nodes = [__build_node(dp, attr_map) for _, dp in df_datapoints.iterrows()]
+    return list(stream_nodes(df_datapoints, attr_map))
 
-    return nodes
 
+def __to_node_ids(values: np.ndarray) -> List[str]:
+    # the node ids of the link ends are always formatted as integers
+    if values.dtype.kind in "iu":
+        return values.astype(str).tolist()
+    # the floats beyond the int64 range and NaN are converted one by one,
+    # NaN fails like it does for a single link
+    if values.dtype.kind in "fb" and np.all(np.abs(values) < 2.0**63):
+        return values.astype(np.int64).astype(str).tolist()
+    return [f"{int(val)}" for val in values.tolist()]
 
-def __build_link(idx, link: pd.Series, attr_map: Dict[str, str]):
-    edgeAttrs: Dict[str, Any] = dict(link)
-    otherAttrs = {
-        at: val
-        for at, val in edgeAttrs.items()
-        if at.lower() not in ["id", "source", "target", "isdirectional"]
-    }
 
-    source_key = next((k for k in _from_keys if k in edgeAttrs), None)
-    target_key = next((k for k in _to_keys if k in edgeAttrs), None)
+def __check_columns(df_links: pd.DataFrame):
+    duplicated = df_links.columns[df_links.columns.duplicated()].tolist()
+    if duplicated:
+        raise ValueError(
+            f"Edge attributes must have unique names. Duplicated: {duplicated}"
+        )
+
+
+def link_ends(
+    df_links: pd.DataFrame,
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Returns the ids and the source and target node ids of the links built
+    from the dataframe of edges, in the order of the links.
+
+    Parameters
+    ----------
+    df_links : pd.DataFrame. Dataframe of edges
+
+    Returns
+    -------
+    Tuple[List[str], List[str], List[str]]. The link ids, the source node ids
+    and the target node ids
+
+    Exceptions
+    ----------
+    ValueError. If the dataframe does not contain the source and target
+    keys, or has duplicated column names.
+    """
+    __check_columns(df_links)
+    keys = df_links.columns.tolist()
+    source_key = next((k for k in _from_keys if k in keys), None)
+    target_key = next((k for k in _to_keys if k in keys), None)
+
+    if len(df_links) == 0:
+        return [], [], []
 
     if source_key is None or target_key is None:
         raise ValueError(
-            f"Source or Target key not found in edge attributes. Keys found: {edgeAttrs.keys()}"
+            f"Source or Target key not found in edge attributes. Keys found: {keys}"
         )
 
-    result_link = {
-        "id": f"{idx}",
-        "source": f"{int(edgeAttrs[source_key])}",
-        "target": f"{int(edgeAttrs[target_key])}",
-        "isDirectional": edgeAttrs.get(
-            attr_map.get("isDirectional", ""), False
-        ),
-        "attr": {
-            "OriginalLabel": f"{idx}",
-            **otherAttrs,
-        },
-    }
+    dtype = row_dtype(df_links)
+    return (
+        [f"{idx}" for idx in df_links.index],
+        __to_node_ids(df_links[source_key].to_numpy(dtype)),
+        __to_node_ids(df_links[target_key].to_numpy(dtype)),
+    )
 
-    return result_link
+
+def stream_links(
+    df_links: pd.DataFrame,
+    attr_map: Dict[str, str],
+    ends: Tuple[List[str], List[str], List[str]] = None,
+) -> RecordStream:
+    """
+    Build links from a dataframe of edges as a stream, the links are only
+    created while the stream is iterated, in chunks of `STREAM_CHUNK_SIZE`
+    rows. The link ends are resolved for all the links at once.
+
+    Parameters
+    ----------
+    df_links : pd.DataFrame. Dataframe of edges
+
+    attr_map : Dict[str, str]. Attribute map for the links
+
+    ends : Tuple[List[str], List[str], List[str]], optional. The link ids
+    and the source and target node ids, see :func:`link_ends`, by default
+    computed from the dataframe.
+
+    Returns
+    -------
+    RecordStream. Stream of links
+
+    Exceptions
+    ----------
+    ValueError. If the dataframe does not contain the source and target
+    keys, or has duplicated column names.
+    """
+    __check_columns(df_links)
+    ids, sources, targets = ends if ends is not None else link_ends(df_links)
+
+    keys = df_links.columns.tolist()
+    dtype = row_dtype(df_links)
+    other_keys = [
+        key
+        for key in keys
+        if key.lower() not in ["id", "source", "target", "isdirectional"]
+    ]
+    directional_key = attr_map.get("isDirectional", "")
+    if not (isinstance(directional_key, str) and directional_key in keys):
+        directional_key = None
+
+    def build_chunk(start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        # the columns of the chunk are resolved once, the links are
+        # assembled from them
+        chunk = df_links.iloc[start:stop]
+        other_columns = [
+            chunk[key].to_numpy(dtype=dtype).tolist() for key in other_keys
+        ]
+        if directional_key is not None:
+            directional = chunk[directional_key].to_numpy(dtype).tolist()
+        else:
+            directional = repeat(False)
+
+        rows = zip(*other_columns) if other_keys else repeat(())
+        for link_id, source, target, is_directional, row in zip(
+            ids[start:stop],
+            sources[start:stop],
+            targets[start:stop],
+            directional,
+            rows,
+        ):
+            attr = {"OriginalLabel": link_id}
+            attr.update(zip(other_keys, row))
+            yield {
+                "id": link_id,
+                "source": source,
+                "target": target,
+                "isDirectional": is_directional,
+                "attr": attr,
+            }
+
+    return RecordStream.chunked(build_chunk, len(df_links))
 
 
 def build_links(
@@ -105,10 +291,7 @@ def build_links(
     -------
     List[Dict[str, Any]]. List of links
     """
-    links = [
-        __build_link(idx, link, attr_map) for idx, link in df_links.iterrows()
-    ]
-    return links
+    return list(stream_links(df_links, attr_map))
 
 
 def build_nodeAttrDescriptors() -> List[Dict[str, Any]]:
@@ -1,20 +1,25 @@
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Union
 from py2mappr._layout import Layout
 
 from py2mappr._core.config import ProjectConfig
+from py2mappr._validation.coverage import AttributeCoverage
+from py2mappr._validation.results import VALIDATION_LEVEL, record_check
 from py2mappr._validation.validate_attributes import (
     validate_nodes,
     validate_links,
 )
 from py2mappr._validation.validate_settings import validate_settings
-from ._utils import md_to_html
+from ._utils import md_to_html, md_to_html_many
+from ._profiler import profile_stage
 
 
 def build_settings(
     snapshots: List[Layout] = [],
     playerSettings: ProjectConfig = {},
-    datapoints: List[Dict[str, Any]] = [],
-    links: List[Dict[str, Any]] = [],
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage] = [],
+    links: Union[List[Dict[str, Any]], AttributeCoverage] = [],
+    workers: int = 1,
+    validation: VALIDATION_LEVEL = "full",
 ) -> Dict[str, Any]:
     """
     Builds the settings.json file for the project.
@@ -27,6 +32,20 @@ def build_settings(
     playerSettings: ProjectConfig, optional. The player settings to be added to
     the project. The default is empty dict.
 
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage], optional. The
+    datapoints, or the missing values of their attributes, to validate the
+    snapshots with. The default is empty list.
+
+    links: Union[List[Dict[str, Any]], AttributeCoverage], optional. The
+    links, or the missing values of their attributes, to validate the
+    snapshots with. The default is empty list.
+
+    workers: int, optional. The number of processes used to render the
+    snapshot descriptions. The default is 1.
+
+    validation: VALIDATION_LEVEL, optional. The validation of the snapshots
+    and of the settings schema, "off" to skip it. The default is "full".
+
     Returns
     -------
     Dict[str, Any]. The settings file data for the project.
@@ -40,6 +59,10 @@ def build_settings(
             "No snapshots found. Please add at least one snapshot to the project."
         )
 
+    snapshot_descrs = md_to_html_many(
+        [snapshot.descr for snapshot in snapshots], workers
+    )
+
     settings = {
         "dataset": {"ref": "id=dataset_ref_id"},
         "settings": {
@@ -62,15 +85,24 @@ def build_settings(
             },
         },
         "snapshots": [
-            {**snapshot.toDict(), "descr": md_to_html(snapshot.descr)}
-            for snapshot in snapshots
+            {**snapshot.toDict(), "descr": descr}
+            for snapshot, descr in zip(snapshots, snapshot_descrs)
         ],
     }
 
-    for snapshot in settings["snapshots"]:
-        validate_nodes(snapshot, datapoints)
-        validate_links(snapshot, links)
+    if validation == "off":
+        return settings
+
+    with profile_stage("validation"):
+        for name, coverage in [("datapoints", datapoints), ("links", links)]:
+            if isinstance(coverage, AttributeCoverage):
+                record_check(
+                    f"{name} attributes", coverage.population, len(coverage)
+                )
+        for snapshot in settings["snapshots"]:
+            validate_nodes(snapshot, datapoints)
+            validate_links(snapshot, links)
 
-    validate_settings(settings)
+        validate_settings(settings)
 
     return settings
@@ -1,39 +1,70 @@
 import re
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Literal, Tuple, Union
 from pathlib import Path
 import shutil
-import json
 import os
 import pandas as pd
-import numpy as np
 from py2mappr._core.config import AttributeConfig
 from py2mappr._core.project import OpenmapprProject
-from py2mappr._validation.validate_links import validate_source_target
+from py2mappr._validation.coverage import AttributeCoverage
+from py2mappr._validation.node_index import NodeIndex
+from py2mappr._validation.results import (
+    VALIDATION_LEVEL,
+    ValidationResults,
+    check_validation_level,
+    get_validation_results,
+    record_skipped_stage,
+    start_validation,
+)
+from py2mappr._validation.validate_links import validate_link_ends
 from .._layout import Layout
-from .build_dataset import build_attrDescriptors, build_datapoints
+from .build_dataset import build_attrDescriptors, stream_datapoints
 from .build_network import (
-    build_nodes,
-    build_links,
+    link_ends,
+    node_ids,
+    stream_nodes,
+    stream_links,
     build_nodeAttrDescriptors,
     build_linkAttrDescriptors,
 )
 from .build_settings import build_settings
-from ._utils import flatten
-
+from ._utils import flatten, load_md_cache, save_md_cache
+from ._stream import RecordStream, check_shard_size, dump_json, write_shards
+from ._compress import (
+    COMPRESSION,
+    check_compression,
+    compression_suffixes,
+    write_precompressed,
+)
+from ._encoder import JSON_BACKEND, NpEncoder, get_encoder
+from ._profiler import (
+    BuildReport,
+    get_profiler,
+    profile_output,
+    profile_stage,
+    profile_stream,
+    start_profiler,
+    stop_profiler,
+)
+from ._manifest import (
+    StageManifest,
+    clear_manifest,
+    fingerprint,
+    hash_config,
+    hash_frame,
+    is_stage_unchanged,
+    load_manifest,
+    save_manifest,
+    stage_files,
+)
 
-class NpEncoder(json.JSONEncoder):
-    """
-    Special json encoder for numpy types
-    """
+OUTPUT_PROFILE = Literal["pretty", "compact"]
 
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super(NpEncoder, self).default(obj)
+# json formatting of the data files for every output profile
+output_profiles: Dict[OUTPUT_PROFILE, Dict[str, Any]] = {
+    "pretty": {"indent": 4, "separators": None},
+    "compact": {"indent": None, "separators": (",", ":")},
+}
 
 
 def __noop_printer(*args, **kwargs):
@@ -63,6 +94,72 @@ _debug_print = None
 template_path = Path(
     os.path.join(os.path.dirname(__file__), "..", "_templates")
 )
+__template_files = [
+    "index.html",
+    "run_local.sh",
+    "ga_template.html",
+    "og_template.html",
+]
+
+
+def __precompress(
+    out_data_dir: Path, name: str, precompress: List[COMPRESSION]
+):
+    """
+    Writes the precompressed copies of the data file `<name>.json` and of
+    its shards.
+    """
+    with profile_stage("precompression"):
+        write_precompressed(out_data_dir / f"{name}.json", precompress)
+        if (out_data_dir / name).is_dir():
+            for shard in (out_data_dir / name).glob("*.json"):
+                write_precompressed(shard, precompress)
+
+
+def __data_files(
+    out_data_dir: Path, name: str, precompress: List[COMPRESSION]
+) -> List[Path]:
+    """
+    Returns the data file `<name>.json`, its precompressed copies and its
+    shards folder.
+    """
+    path = out_data_dir / f"{name}.json"
+    return [
+        path,
+        *(Path(f"{path}{compression_suffixes[enc]}") for enc in precompress),
+        out_data_dir / name,
+    ]
+
+
+def __collect_datapoints(
+    df_datapoints: pd.DataFrame,
+    datapointAttrs: Dict[str, AttributeConfig],
+    exclude_md_attrs: List[str] = [],
+    workers: int = 1,
+    index: NodeIndex = None,
+) -> Tuple[List[AttributeConfig], RecordStream]:
+    """
+    Collects the attribute descriptors and the datapoints of the dataset
+    """
+    with profile_stage("attribute descriptors"):
+        datapointAttribs = build_attrDescriptors(df_datapoints, datapointAttrs)
+    datapointAttrTypes = {
+        row["id"]: row["attrType"] for row in datapointAttribs
+    }
+    datapointRenderTypes = {
+        row["id"]: row["renderType"] for row in datapointAttribs
+    }
+
+    datapoints = stream_datapoints(
+        df_datapoints,
+        datapointAttrTypes,
+        datapointRenderTypes,
+        exclude_md_attrs,
+        workers,
+        index.order if index is not None else None,
+    )
+
+    return datapointAttribs, datapoints
 
 
 def __write_dataset_file(
@@ -70,9 +167,16 @@ def __write_dataset_file(
     datapointAttrs: Dict[str, AttributeConfig],
     out_data_dir: Path,
     exclude_md_attrs: List[str] = [],
+    workers: int = 1,
+    profile: OUTPUT_PROFILE = "pretty",
+    backend: JSON_BACKEND = "json",
+    shard_size: int = None,
+    index: NodeIndex = None,
 ):
     """
-    Writes the dataset file `nodes.json` to the output directory
+    Writes the dataset file `nodes.json` to the output directory. If
+    `shard_size` is set, the datapoints are written to the shard files and
+    `nodes.json` only holds the shards manifest.
 
     Parameters
     ----------
@@ -83,33 +187,58 @@ def __write_dataset_file(
         The attribute configurations for the datapoints
     out_data_dir : Path
         The output directory to write the file to
-    """
-    # collect datapoint attributes
-    datapointAttribs = build_attrDescriptors(df_datapoints, datapointAttrs)
-    datapointAttrTypes = {
-        row["id"]: row["attrType"] for row in datapointAttribs
-    }
-    datapointRenderTypes = {
-        row["id"]: row["renderType"] for row in datapointAttribs
-    }
 
-    # collect datapoints
-    datapoints = build_datapoints(
-        df_datapoints,
-        datapointAttrTypes,
-        datapointRenderTypes,
-        exclude_md_attrs,
+    exclude_md_attrs : List[str], optional
+        The attributes that are never rendered from markdown
+
+    workers : int, optional
+        The number of processes used to render the markdown attributes
+
+    profile : OUTPUT_PROFILE, optional
+        The json formatting of the file, by default "pretty"
+
+    backend : JSON_BACKEND, optional
+        The json encoding backend, by default "json"
+
+    shard_size : int, optional
+        The number of datapoints in every shard file, by default None (no
+        sharding)
+
+    index : NodeIndex, optional
+        The index of the node ids shared by the build, by default computed
+        from the data frame
+    """
+    # collect datapoint attributes and datapoints, the datapoints are
+    # produced while the file is written
+    datapointAttribs, datapoints = __collect_datapoints(
+        df_datapoints, datapointAttrs, exclude_md_attrs, workers, index
     )
 
     _debug_print(
-        f"\t- processed {len(datapoints)} datapoints with {datapoints[0].keys()} where attr={list(datapointAttrs.keys())}"
+        f"\t- processed {len(datapoints)} datapoints where attr={list(datapointAttrs.keys())}"
+    )
+
+    shards = write_shards(
+        datapoints,
+        out_data_dir,
+        "nodes",
+        shard_size,
+        backend=backend,
+        **output_profiles[profile],
     )
 
     # merge into dataset
     data = {"attrDescriptors": datapointAttribs, "datapoints": datapoints}
+    if shards is not None:
+        data = {
+            "attrDescriptors": datapointAttribs,
+            "datapoints": [],
+            "datapointShards": shards,
+        }
 
-    with open(Path(out_data_dir) / "nodes.json", mode="w+") as f:
-        json.dump(data, f, indent=4, cls=NpEncoder)
+    nodes_path = Path(out_data_dir) / "nodes.json"
+    with open(nodes_path, mode="w+", encoding="utf-8") as f:
+        dump_json(data, f, backend=backend, **output_profiles[profile])
 
     return datapoints
 
@@ -120,9 +249,17 @@ def __write_network_file(
     df_links: pd.DataFrame,
     linkAttrs: Dict[str, Any],
     out_data_dir: Path,
+    profile: OUTPUT_PROFILE = "pretty",
+    backend: JSON_BACKEND = "json",
+    shard_size: int = None,
+    validation: VALIDATION_LEVEL = "full",
+    validation_sample_size: int = None,
+    index: NodeIndex = None,
 ):
     """
-    Writes the network file `links.json` to the output directory
+    Writes the network file `links.json` to the output directory. If
+    `shard_size` is set, the links are written to the shard files and
+    `links.json` only holds the shards manifest in place of the links.
 
     Parameters
     ----------
@@ -142,31 +279,65 @@ def __write_network_file(
 
     out_data_dir : Path
         The output directory to write the file to
+
+    profile : OUTPUT_PROFILE, optional
+        The json formatting of the file, by default "pretty"
+
+    backend : JSON_BACKEND, optional
+        The json encoding backend, by default "json"
+
+    shard_size : int, optional
+        The number of links in every shard file, by default None (no
+        sharding)
+
+    validation : VALIDATION_LEVEL, optional
+        The validation of the link ends, by default "full"
+
+    validation_sample_size : int, optional
+        The number of links checked by the "fast" validation
+
+    index : NodeIndex, optional
+        The index of the node ids shared by the build, by default computed
+        from the data frame
     """
-    # collect nodes
-    nodes = build_nodes(df_datapoints, datapointAttrs)
-    _debug_print(
-        f"\t- processed {len(nodes)} nodes with {nodes[0].keys()} where attr={list(nodes[0]['attr'].keys())}"
+    if index is None:
+        index = NodeIndex(node_ids(df_datapoints))
+
+    # collect nodes and links, they are produced while the file is written
+    nodes = profile_stream(
+        stream_nodes(df_datapoints, datapointAttrs, index.order), "nodes"
     )
+    _debug_print(f"\t- processed {len(nodes)} nodes")
 
-    # collect links
-    links = build_links(df_links, linkAttrs)
+    # the link ends are resolved once for the links and their validation
+    ends = link_ends(df_links)
+    links = stream_links(df_links, linkAttrs, ends)
     _debug_print(
-        f"\t- processed {len(links)} links with {links[0].keys()} where attr={list(links[0]['attr'].keys())}"
+        f"\t- processed {len(links)} links where attr={df_links.columns.tolist()}"
     )
 
-    # collect node attributes
-    nodeAttribs = build_nodeAttrDescriptors()
+    with profile_stage("attribute descriptors"):
+        # collect node attributes
+        nodeAttribs = build_nodeAttrDescriptors()
+        # collect link attribs
+        linkAttribs = build_linkAttrDescriptors(linkAttrs)
+
     _debug_print(
         f"\t- processed {len(nodeAttribs)} node attributes {[at['id'] for at in nodeAttribs]}"
     )
-
-    # collect link attribs
-    linkAttribs = build_linkAttrDescriptors(linkAttrs)
     _debug_print(
         f"\t- processed {len(linkAttribs)} link attributes {[at['id'] for at in linkAttribs]}"
     )
 
+    shards = write_shards(
+        links,
+        out_data_dir,
+        "links",
+        shard_size,
+        backend=backend,
+        **output_profiles[profile],
+    )
+
     # write network file
     data = {
         "id": "",
@@ -177,11 +348,20 @@ def __write_network_file(
         "nodeAttrDescriptors": nodeAttribs,
         "linkAttrDescriptors": linkAttribs,
     }
+    if shards is not None:
+        data = {**data, "links": [], "linkShards": shards}
 
-    with open(out_data_dir / "links.json", mode="w") as f:
-        json.dump([data], f, indent=4, cls=NpEncoder)
+    links_path = out_data_dir / "links.json"
+    with open(links_path, mode="w", encoding="utf-8") as f:
+        dump_json([data], f, backend=backend, **output_profiles[profile])
 
-    validate_source_target(links, nodes)
+    if validation != "off":
+        with profile_stage("validation"):
+            validate_link_ends(
+                *ends,
+                index,
+                validation_sample_size if validation == "fast" else None,
+            )
 
     return links
 
@@ -189,9 +369,13 @@ def __write_network_file(
 def __write_settings_file(
     snapshots: List[Dict],
     playerSettings: Dict[str, Any],
-    datapoints: List[Dict[str, Any]],
-    links: List[Dict[str, Any]],
+    datapoints: AttributeCoverage,
+    links: AttributeCoverage,
     out_data_dir: Path,
+    workers: int = 1,
+    profile: OUTPUT_PROFILE = "pretty",
+    backend: JSON_BACKEND = "json",
+    validation: VALIDATION_LEVEL = "full",
 ):
     """
     Writes the settings file `settings.json` to the output directory
@@ -204,12 +388,35 @@ def __write_settings_file(
     playerSettings : Dict[str, Any]
         The player settings to be used in the project.
 
+    datapoints : AttributeCoverage
+        The missing values of the datapoint attributes, for the validation
+        of the snapshots
+
+    links : AttributeCoverage
+        The missing values of the link attributes, for the validation of the
+        snapshots
+
     out_data_dir : Path
         The output directory to write the file to
+
+    workers : int, optional
+        The number of processes used to render the markdown descriptions
+
+    profile : OUTPUT_PROFILE, optional
+        The json formatting of the file, by default "pretty"
+
+    backend : JSON_BACKEND, optional
+        The json encoding backend, by default "json"
+
+    validation : VALIDATION_LEVEL, optional
+        The validation of the snapshots and of the schema, by default "full"
     """
-    data = build_settings(snapshots, playerSettings, datapoints, links)
-    with open(out_data_dir / "settings.json", mode="w") as f:
-        json.dump(data, f, indent=4, cls=NpEncoder)
+    data = build_settings(
+        snapshots, playerSettings, datapoints, links, workers, validation
+    )
+    settings_path = out_data_dir / "settings.json"
+    with open(settings_path, mode="w", encoding="utf-8") as f:
+        dump_json(data, f, backend=backend, **output_profiles[profile])
     return data
 
 
@@ -267,6 +474,28 @@ def __extract_sentence(text: str):
     return clear_text
 
 
+def __find_images(out_dir: Path) -> List[Path]:
+    """
+    Utility method to find the images in the project folder
+
+    Parameters
+    ----------
+    out_dir : Path
+        The project folder
+
+    Returns
+    -------
+    List[Path]
+        The paths of the images
+    """
+    return [
+        *list(out_dir.rglob("*.jpg")),
+        *list(out_dir.rglob("*.jpeg")),
+        *list(out_dir.rglob("*.png")),
+        *list(out_dir.rglob("*.gif")),
+    ]
+
+
 def __set_opengraph_tags(index_path: str, player_settings: Dict[str, Any]):
     """
     Sets the opengraph tags (`og:title`, `og:description`, `og:image`) in the
@@ -288,12 +517,7 @@ def __set_opengraph_tags(index_path: str, player_settings: Dict[str, Any]):
     description = __extract_sentence(player_settings.get("headerSubtitle"))
 
     # find if there is an image in the project folder
-    images = [
-        *list(Path(index_path).parent.rglob("*.jpg")),
-        *list(Path(index_path).parent.rglob("*.jpeg")),
-        *list(Path(index_path).parent.rglob("*.png")),
-        *list(Path(index_path).parent.rglob("*.gif")),
-    ]
+    images = __find_images(Path(index_path).parent)
 
     image_url = (
         player_settings.get("sharingLogoUrl") or images[0].name
@@ -323,6 +547,17 @@ def build_map(
     start=False,
     PORT=8080,
     detach: List[Layout] = [],
+    md_cache_dir: Union[Path, str] = None,
+    workers: int = 1,
+    output_profile: OUTPUT_PROFILE = "pretty",
+    precompress: List[COMPRESSION] = [],
+    json_backend: JSON_BACKEND = "json",
+    shard_size: int = None,
+    incremental: bool = False,
+    profile: bool = False,
+    profile_path: Union[Path, str] = None,
+    validation: VALIDATION_LEVEL = "full",
+    validation_sample_size: int = 10000,
 ):
     """
     Builds the map and saves it to the output folder
@@ -345,6 +580,71 @@ def build_map(
 
     detach : List[Layout], optional
         The list of layouts to detach from the project, by default empty list
+
+    md_cache_dir : Union[Path, str], optional
+        The directory to persist the rendered markdown between builds, by
+        default None (rendered values are only cached in memory)
+
+    workers : int, optional
+        The number of processes used to render the markdown text attributes,
+        by default 1. Scripts using more than one worker must guard the build
+        with `if __name__ == "__main__":` on platforms that spawn processes.
+
+    output_profile : OUTPUT_PROFILE, optional
+        The json formatting of the data files, by default "pretty" (indented).
+        "compact" writes minified json.
+
+    precompress : List[COMPRESSION], optional
+        The content encodings ("gzip", "br") of the precompressed copies
+        written next to the data files, by default empty list. The local
+        server and the s3 publisher serve these copies as they are. "br"
+        requires the brotli package.
+
+    json_backend : JSON_BACKEND, optional
+        The json encoding backend of the data files, by default "json", the
+        standard library encoder. "orjson" is faster but its output differs,
+        see :class:`OrjsonEncoder`, and "auto" uses orjson when it is
+        installed.
+
+    shard_size : int, optional
+        The number of datapoints and links in every shard file, by default
+        None. When set, the datapoints of `nodes.json` and the links of
+        `links.json` are split into `data/nodes/*.json` and
+        `data/links/*.json` shards, and the files only hold the manifest
+        (`datapointShards` and `linkShards`) with the shard list, counts and
+        sizes.
+
+    incremental : bool, optional
+        Whether to skip the build stages (dataset, network, settings, index)
+        whose inputs are unchanged since the previous build in the output
+        folder, by default False. The incremental builds record the
+        fingerprints of the inputs and the written files of every stage in
+        the `.build_manifest.json` file of the output folder, once the files
+        of the stage are completely written. A stage whose files are missing
+        is rebuilt. The other builds neither fingerprint the inputs nor keep
+        the manifest. The checks of the skipped stages do not run again, the
+        stages are listed in the `skipped` validation results.
+
+    profile : bool, optional
+        Whether to record the wall time, cpu time, RSS change and output
+        bytes of every build stage, by default False. The report is returned
+        by :func:`get_build_report`.
+
+    profile_path : Union[Path, str], optional
+        The json file to write the build report to, by default None. Setting
+        it turns on the profiling.
+
+    validation : VALIDATION_LEVEL, optional
+        The validation of the link ends, of the snapshot attributes and of
+        the settings schema, by default "full". "fast" only checks a sample
+        of `validation_sample_size` datapoints and links, and estimates the
+        issue counts. "off" skips the validation. The checks and the issues
+        are returned by :func:`get_validation_results`.
+
+    validation_sample_size : int, optional
+        The number of datapoints and links checked by the "fast" validation,
+        by default 10000.
+
     Returns
     -------
     str
@@ -353,6 +653,14 @@ def build_map(
     global _debug_print
     if not _debug_print:
         _debug_print = _printer(project)
+    if output_profile not in output_profiles:
+        raise ValueError(f"Unknown output profile: {output_profile}")
+    check_compression(precompress)
+    check_shard_size(shard_size)
+    check_validation_level(validation)
+    # fail before writing anything if the backend is not available
+    get_encoder(backend=json_backend)
+
     # create folders and copy the index file
     _debug_print(f">> creating folders")
 
@@ -362,61 +670,265 @@ def build_map(
     if not os.path.exists(Path(out_data_dir)):
         os.makedirs(Path(out_data_dir))
 
-    # copy the index and run scripts to out directory
-    shutil.copy(template_path / "index.html", out_dir)
-    _debug_print(f"\t- copied {out_dir}/index.html")
+    if profile or profile_path is not None:
+        start_profiler(out_dir, profile_path)
+    else:
+        stop_profiler()
+    start_validation(validation)
+    sample_size = validation_sample_size if validation == "fast" else None
+
+    # the manifest on disk only lists the stages whose files are complete,
+    # the entry of a stage is dropped before its files are rewritten. The
+    # manifest of an earlier incremental build is removed by the other
+    # builds, it no longer describes the files they write.
+    manifest: Dict[str, StageManifest] = {}
+    if incremental:
+        manifest = load_manifest(out_dir)
+    else:
+        clear_manifest(out_dir)
+
+    def is_unchanged(stage: str, stage_fingerprint: str):
+        unchanged = is_stage_unchanged(
+            out_dir, manifest, stage, stage_fingerprint
+        )
+        if not unchanged and stage in manifest:
+            del manifest[stage]
+            save_manifest(out_dir, manifest)
+        return unchanged
+
+    def stage_done(stage: str, stage_fingerprint: str, *paths: Path):
+        if not incremental:
+            return
+        manifest[stage] = {
+            "fingerprint": stage_fingerprint,
+            "files": stage_files(out_dir, *paths),
+        }
+        save_manifest(out_dir, manifest)
+
+    # the node ids are indexed once, for the datapoints, the nodes and the
+    # validation of the links, and only by the stages that are rebuilt
+    node_index: NodeIndex = None
+
+    def get_node_index() -> NodeIndex:
+        nonlocal node_index
+        if node_index is None:
+            node_index = NodeIndex(node_ids(project.dataFrame))
+        return node_index
+
+    # only the incremental builds fingerprint the inputs, the stages of the
+    # other builds have no fingerprint and are always written
+    output_options = data_hash = network_hash = attributes_hash = None
+    if incremental:
+        with profile_stage("fingerprints"):
+            output_options = hash_config(
+                [output_profile, json_backend, shard_size, precompress]
+            )
+            data_hash = hash_frame(project.dataFrame)
+            network_hash = hash_frame(project.network)
+            attributes_hash = hash_config(project.attributes)
+    exclude_md_attrs = flatten(
+        [
+            [
+                snapshot.settings["labelAttr"],
+                snapshot.settings["labelHoverAttr"],
+            ]
+            for snapshot in project.snapshots
+        ]
+    )
+    publish_snapshots = [
+        snapshot for snapshot in project.snapshots if snapshot not in detach
+    ]
 
-    shutil.copy(template_path / "run_local.sh", out_dir)
-    _debug_print(f"\t- copied {out_dir}/run_local.sh\n")
+    if md_cache_dir is not None:
+        load_md_cache(md_cache_dir)
 
     # write the files
     _debug_print(f">> building dataset")
-    exclude_md_attrs = [
-        [snapshot.settings["labelAttr"], snapshot.settings["labelHoverAttr"]]
-        for snapshot in project.snapshots
-    ]
-
-    out_nodes = __write_dataset_file(
-        project.dataFrame,
-        project.attributes,
-        out_data_dir,
-        flatten(exclude_md_attrs),
-    )
-    _debug_print(
-        f"\t- new dataset file written to {out_data_dir / 'nodes.json'}.\n"
+    nodes_fingerprint = (
+        fingerprint(
+            data_hash,
+            attributes_hash,
+            hash_config(exclude_md_attrs),
+            output_options,
+        )
+        if incremental
+        else None
     )
+    if is_unchanged("nodes", nodes_fingerprint):
+        _debug_print(f"\t- dataset is unchanged, skipped.\n")
+    else:
+        with profile_stage("datapoints"):
+            __write_dataset_file(
+                project.dataFrame,
+                project.attributes,
+                out_data_dir,
+                exclude_md_attrs,
+                workers,
+                output_profile,
+                json_backend,
+                shard_size,
+                get_node_index(),
+            )
+        profile_output(
+            "datapoints", out_data_dir / "nodes.json", out_data_dir / "nodes"
+        )
+        __precompress(out_data_dir, "nodes", precompress)
+        stage_done(
+            "nodes",
+            nodes_fingerprint,
+            *__data_files(out_data_dir, "nodes", precompress),
+        )
+        _debug_print(
+            f"\t- new dataset file written to {out_data_dir / 'nodes.json'}.\n"
+        )
 
     _debug_print(f">> building network")
-    out_links = __write_network_file(
-        project.dataFrame,
-        project.attributes,
-        project.network,
-        project.network_attributes,
-        out_data_dir,
-    )
-    _debug_print(
-        f"\t- new network file written to {out_data_dir / 'links.json'}.\n"
+    links_fingerprint = (
+        fingerprint(
+            data_hash,
+            attributes_hash,
+            network_hash,
+            hash_config(project.network_attributes),
+            output_options,
+        )
+        if incremental
+        else None
     )
+    if is_unchanged("links", links_fingerprint):
+        record_skipped_stage("links")
+        _debug_print(f"\t- network is unchanged, skipped.\n")
+    else:
+        with profile_stage("links"):
+            __write_network_file(
+                project.dataFrame,
+                project.attributes,
+                project.network,
+                project.network_attributes,
+                out_data_dir,
+                output_profile,
+                json_backend,
+                shard_size,
+                validation,
+                validation_sample_size,
+                get_node_index(),
+            )
+        profile_output(
+            "links", out_data_dir / "links.json", out_data_dir / "links"
+        )
+        __precompress(out_data_dir, "links", precompress)
+        stage_done(
+            "links",
+            links_fingerprint,
+            *__data_files(out_data_dir, "links", precompress),
+        )
+        _debug_print(
+            f"\t- new network file written to {out_data_dir / 'links.json'}.\n"
+        )
 
     _debug_print(f">> building settings")
-    publish_snapshots = [
-        snapshot for snapshot in project.snapshots if snapshot not in detach
-    ]
-    __write_settings_file(
-        publish_snapshots,
-        project.configuration,
-        out_nodes,
-        out_links,
-        out_data_dir,
-    )
-    _debug_print(
-        f"\t- new settings file written to {out_data_dir / 'settings.json'}.\n"
+    settings_fingerprint = (
+        fingerprint(
+            nodes_fingerprint,
+            links_fingerprint,
+            hash_config([snapshot.toDict() for snapshot in publish_snapshots]),
+            hash_config(project.configuration),
+            output_options,
+        )
+        if incremental
+        else None
     )
+    if is_unchanged("settings", settings_fingerprint):
+        record_skipped_stage("settings")
+        _debug_print(f"\t- settings are unchanged, skipped.\n")
+    else:
+        with profile_stage("settings"):
+            __write_settings_file(
+                publish_snapshots,
+                project.configuration,
+                AttributeCoverage(project.dataFrame, sample_size),
+                AttributeCoverage(project.network, sample_size),
+                out_data_dir,
+                workers,
+                output_profile,
+                json_backend,
+                validation,
+            )
+        profile_output("settings", out_data_dir / "settings.json")
+        __precompress(out_data_dir, "settings", precompress)
+        stage_done(
+            "settings",
+            settings_fingerprint,
+            *__data_files(out_data_dir, "settings", precompress),
+        )
+        _debug_print(
+            f"\t- new settings file written to {out_data_dir / 'settings.json'}.\n"
+        )
+
+    if md_cache_dir is not None:
+        save_md_cache(md_cache_dir)
+
+    _debug_print(f">> building index")
+    index_fingerprint = None
+    if incremental:
+        with profile_stage("fingerprints"):
+            index_fingerprint = fingerprint(
+                hash_config(
+                    [
+                        (template_path / name).read_text()
+                        for name in __template_files
+                    ]
+                ),
+                hash_config(project.publish_settings),
+                hash_config(project.configuration),
+                hash_config(
+                    sorted(img.name for img in __find_images(out_dir))
+                ),
+            )
+    if is_unchanged("index", index_fingerprint):
+        _debug_print(f"\t- index is unchanged, skipped.\n")
+    else:
+        with profile_stage("template injection"):
+            # copy the index and run scripts to out directory
+            shutil.copy(template_path / "index.html", out_dir)
+            _debug_print(f"\t- copied {out_dir}/index.html")
+
+            shutil.copy(template_path / "run_local.sh", out_dir)
+            _debug_print(f"\t- copied {out_dir}/run_local.sh\n")
+
+            if project.publish_settings.get("gtag_id"):
+                gtag_id = project.publish_settings.get("gtag_id")
+                __add_analytics(out_dir / "index.html", gtag_id)
+
+            __set_opengraph_tags(out_dir / "index.html", project.configuration)
+        profile_output(
+            "template injection",
+            out_dir / "index.html",
+            out_dir / "run_local.sh",
+        )
+        stage_done(
+            "index",
+            index_fingerprint,
+            out_dir / "index.html",
+            out_dir / "run_local.sh",
+        )
+
+    if get_profiler() is not None:
+        get_profiler().save()
 
-    if project.publish_settings.get("gtag_id"):
-        gtag_id = project.publish_settings.get("gtag_id")
-        __add_analytics(out_dir / "index.html", gtag_id)
+    return out_dir
 
-    __set_opengraph_tags(out_dir / "index.html", project.configuration)
 
-    return out_dir
+def get_build_report() -> Union[BuildReport, None]:
+    """
+    Returns the stage report of the last build made with profiling, see
+    :func:`build_map`. The publishing of the build through
+    `publisher.run(..)` is added to the report as the "publish" stage.
+
+    Returns
+    -------
+    Union[BuildReport, None]
+        The report, None if the last build was not profiled
+    """
+    if get_profiler() is None:
+        return None
+    return get_profiler().report()
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Literal, TypedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Literal, TypedDict
+import copy
 
 from py2mappr._attributes.attr_types import ATTR_TYPE, RENDER_TYPE
 
@@ -204,3 +206,91 @@ default_net_attr_config: NetworkAttributeConfig = {
     "visibleInProfile": False,
     "metadata": {},
 }
+
+
+class ConfigOverlay(MutableMapping):
+    """
+    A configuration stored as the fields overriding shared defaults, e.g. an
+    attribute of the project over `default_attr_config`. The other fields are
+    read from the defaults, so that thousands of attributes do not copy the
+    same defaults. It is read and updated like the dict it stands for, e.g.
+    `project.attributes["year"]["attrType"] = "year"`, but it is not a dict:
+    :meth:`to_dict` converts it, e.g. for `json.dumps`.
+
+    A mutable default, e.g. the metadata, is copied to the overrides when it
+    is read, so that updating it in place never changes the defaults.
+    Deleting a field, e.g. with `pop` or `clear`, resets it to its default.
+
+    Parameters
+    ----------
+    defaults : Dict[str, Any]. The shared default fields.
+
+    overrides : Dict[str, Any], optional. The fields that differ from the
+    defaults, by default none.
+    """
+
+    __slots__ = ("defaults", "overrides")
+
+    def __init__(
+        self, defaults: Dict[str, Any], overrides: Dict[str, Any] = None
+    ):
+        self.defaults = defaults
+        self.overrides = dict(overrides or {})
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.overrides:
+            return self.overrides[key]
+        value = self.defaults[key]
+        if isinstance(value, (dict, list)):
+            value = self.overrides[key] = copy.deepcopy(value)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self.overrides[key] = value
+
+    def __delitem__(self, key: str):
+        # the field is reset to its default, a field that is not overridden
+        # already is
+        if key in self.overrides:
+            del self.overrides[key]
+        elif key not in self.defaults:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.defaults
+        for key in self.overrides:
+            if key not in self.defaults:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.defaults) + sum(
+            1 for key in self.overrides if key not in self.defaults
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.overrides or key in self.defaults
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def popitem(self):
+        """
+        Resets the last overridden field to its default and returns it.
+        """
+        if not self.overrides:
+            raise KeyError("popitem(): no overridden fields")
+        return self.overrides.popitem()
+
+    def clear(self):
+        """
+        Resets all the fields to their defaults.
+        """
+        self.overrides.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the configuration as a dict, like `dict(overlay)`. The nested
+        fields are read through the overlay, so they are never shared with
+        the defaults.
+        """
+        return {key: self[key] for key in self}
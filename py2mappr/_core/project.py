@@ -1,6 +1,7 @@
 from typing import Dict, List, Literal, Tuple, TypedDict, Union
 from .config import (
     AttributeConfig,
+    ConfigOverlay,
     FeedbackInfo,
     ProjectConfig,
     SponsorInfo,
@@ -9,12 +10,14 @@ from .config import (
     default_net_attr_config,
 )
 from py2mappr._attributes.calculate import (
-    calculate_attr_types,
-    calculate_render_type,
+    INFERENCE_MODE,
+    PARALLEL_BACKEND,
+    AttributeInference,
+    infer_attributes,
 )
+from py2mappr._attributes.profile import FrameProfile
 from py2mappr._layout import Layout, LayoutSettings
 from pandas import DataFrame
-import copy
 
 
 class PublishConfig(TypedDict):
@@ -60,22 +63,53 @@ class OpenmapprProject:
     of the project.
 
     network_attributes : Dict[str, AttributeConfig]. The attributes for the
-    edges in the project.
+    edges in the project, inferred when they are first read, e.g. by the
+    build.
 
     publish_settings : PublishConfig. The settings for publishing the project.
 
     snapshots : List[Layout]. The snapshots of the project.
 
+    inference : INFERENCE_MODE. How the attribute types are inferred, "full"
+    scans every row, "sample" starts from a sample of
+    `inference_sample_size` rows, see
+    :func:`py2mappr._attributes.calculate.infer_attributes`.
+
+    inference_workers : int. The number of threads or processes, depending
+    on `inference_backend`, the columns are inferred with. 1 by default, more
+    workers pay off on wide data frames and give the same attributes.
+
+    attribute_inference : Dict[str, AttributeInference]. How the types of
+    every attribute were inferred, with the sample size and the confidence.
+
+    network_attribute_inference : Dict[str, AttributeInference]. How the
+    types of every edge attribute were inferred, set with the network
+    attributes.
+
+    profile : FrameProfile. The column statistics of the data, shared by the
+    attribute inference and the layouts.
+
+    network_profile : FrameProfile. The column statistics of the network
+    data.
+
     debug : bool. Whether to print debug messages.
     """
 
     dataFrame: DataFrame
     network: Union[DataFrame, None] = None
-    network_attributes: Dict[str, AttributeConfig]
+    _network_attributes: Union[Dict[str, AttributeConfig], None] = None
     attributes: Dict[str, AttributeConfig]
     configuration: ProjectConfig
     publish_settings: PublishConfig = {}
     snapshots: List[Layout] = []
+    inference: INFERENCE_MODE = "full"
+    inference_sample_size: int = 10000
+    inference_workers: int = 1
+    inference_backend: PARALLEL_BACKEND = "thread"
+    attribute_inference: Dict[str, AttributeInference] = {}
+    network_attribute_inference: Dict[str, AttributeInference] = {}
+    profile: FrameProfile
+    network_profile: Union[FrameProfile, None] = None
 
     debug: bool = False
 
@@ -84,13 +118,26 @@ class OpenmapprProject:
         dataFrame: DataFrame,
         networkDataFrame: DataFrame = None,
         config: ProjectConfig = base_config,
+        inference: INFERENCE_MODE = "full",
     ):
         self.dataFrame = dataFrame
         self.network = networkDataFrame
         self.configuration = config
-        self.attributes = self._set_attributes()
+        self.inference = inference
+        self.profile = FrameProfile(dataFrame)
         if networkDataFrame is not None:
-            self.network_attributes = self._set_network_attributes()
+            self.network_profile = FrameProfile(networkDataFrame)
+        self.attributes = self._set_attributes()
+
+    @property
+    def network_attributes(self) -> Dict[str, AttributeConfig]:
+        if self._network_attributes is None and self.network is not None:
+            self._network_attributes = self._set_network_attributes()
+        return self._network_attributes
+
+    @network_attributes.setter
+    def network_attributes(self, attributes: Dict[str, AttributeConfig]):
+        self._network_attributes = attributes
 
     def set_debug(self, debug: bool):
         """
@@ -105,30 +152,50 @@ class OpenmapprProject:
     def set_data(self, dataFrame: DataFrame):
         """
         Set the data for the project. Once set, the attributes for all existing
-        layouts will be recalculated.
+        layouts will be recalculated when they are next read, e.g. by the
+        build.
+
+        Only the attributes of the new columns and of the columns whose dtype
+        or content changed are inferred again. The other attributes are kept
+        with their changes, e.g. made by :meth:`update_attributes`. A changed
+        column keeps its changes too, except for an inferred attribute or
+        render type that was not changed.
+
+        The data frame of the project must not be modified in place, e.g.
+        `project.dataFrame["x"] = ...`, without calling `set_data` afterwards,
+        otherwise the cached column statistics and layout heuristics are
+        stale.
 
         Parameters
         ----------
         dataFrame : pandas.DataFrame. The data to be visualized.
         """
         self.dataFrame = dataFrame
-        self.attributes = self._set_attributes()
+        self.profile.set_frame(dataFrame)
+        self.attributes = self._update_attributes(
+            self.profile.profiled_columns()
+        )
         for layout in self.snapshots:
-            layout.calculate_layout(self)
+            layout.mark_dirty(self)
 
     def set_network(self, network: DataFrame):
         """
         Set the network data for the project. Once set, the attributes for all
-        existing layouts will be recalculated.
+        existing layouts and the network attributes will be recalculated when
+        they are next read, e.g. by the build.
 
         Parameters
         ----------
         network : pandas.DataFrame. The network data to be visualized.
         """
         self.network = network
-        self.network_attributes = self._set_network_attributes()
+        if self.network_profile is None:
+            self.network_profile = FrameProfile(network)
+        else:
+            self.network_profile.set_frame(network)
+        self._network_attributes = None
         for layout in self.snapshots:
-            layout.calculate_layout(self)
+            layout.mark_dirty(self)
 
     def set_display_data(
         self,
@@ -222,34 +289,95 @@ class OpenmapprProject:
             }
         )
 
+    def _infer_attributes(
+        self, df: DataFrame, profile: FrameProfile
+    ) -> Dict[str, AttributeInference]:
+        return infer_attributes(
+            df,
+            self.inference,
+            self.inference_sample_size,
+            profile=profile,
+            workers=self.inference_workers,
+            backend=self.inference_backend,
+        )
+
+    def _attribute_config(
+        self, column: str, inference: AttributeInference
+    ) -> AttributeConfig:
+        # only the fields set by the inference are stored with the attribute
+        return ConfigOverlay(
+            default_attr_config,
+            {
+                "id": column,
+                "title": column,
+                "attrType": inference["attrType"],
+                "renderType": inference["renderType"],
+            },
+        )
+
     def _set_attributes(self) -> Dict[str, AttributeConfig]:
         attributes = dict()
-        attr_types = calculate_attr_types(self.dataFrame)
-        render_types = calculate_render_type(self.dataFrame, attr_types)
+        self.attribute_inference = self._infer_attributes(
+            self.dataFrame, self.profile
+        )
 
         for column in self.dataFrame.columns:
-            attributes[column] = {
-                **copy.deepcopy(default_attr_config),
-                "id": column,
-                "title": column,
-                "attrType": attr_types[column],
-                "renderType": render_types[column],
-            }
+            attributes[column] = self._attribute_config(
+                column, self.attribute_inference[column]
+            )
 
         return attributes
 
+    def _update_attributes(
+        self, unchanged: List[str]
+    ) -> Dict[str, AttributeConfig]:
+        previous = self.attribute_inference
+        changed = [
+            column
+            for column in self.dataFrame.columns
+            if column not in unchanged
+            or column not in self.attributes
+            or column not in previous
+        ]
+        inferred = self._infer_attributes(
+            self.dataFrame[changed], self.profile
+        )
+
+        attributes = dict()
+        for column in self.dataFrame.columns:
+            if column not in inferred:
+                attributes[column] = self.attributes[column]
+            elif column in self.attributes and column in previous:
+                # the inferred types are replaced, unless they were changed
+                attributes[column] = self.attributes[column]
+                for field in ["attrType", "renderType"]:
+                    if attributes[column][field] == previous[column][field]:
+                        attributes[column][field] = inferred[column][field]
+            else:
+                attributes[column] = self._attribute_config(
+                    column, inferred[column]
+                )
+
+        self.attribute_inference = {
+            column: inferred.get(column, previous.get(column))
+            for column in self.dataFrame.columns
+        }
+        return attributes
+
     def _set_network_attributes(self) -> Dict[str, AttributeConfig]:
         attributes = dict()
-        attr_types = calculate_attr_types(self.network)
-        render_types = calculate_render_type(self.network, attr_types)
+        self.network_attribute_inference = self._infer_attributes(
+            self.network, self.network_profile
+        )
 
         for column in self.network.columns:
+            inference = self.network_attribute_inference[column]
             attributes[column] = {
                 **default_net_attr_config,
                 "id": column,
                 "title": column,
-                "attrType": attr_types[column],
-                "renderType": render_types[column],
+                "attrType": inference["attrType"],
+                "renderType": inference["renderType"],
             }
 
         return attributes
@@ -6,6 +6,27 @@ import copy
 PLOT_TYPE = Literal["clustered", "scatterplot", "clustered-scatterplot", "geo"]
 
 
+class CalculatedField:
+    """
+    A layout field set by `calculate_layout`. Reading or writing the field of
+    a layout marked dirty recalculates the layout first, see
+    :meth:`Layout.mark_dirty`.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.field = "_" + name
+
+    def __get__(self, layout: "Layout", owner=None) -> Any:
+        if layout is None:
+            return self
+        layout.refresh()
+        return getattr(layout, self.field)
+
+    def __set__(self, layout: "Layout", value: Any):
+        layout.refresh()
+        setattr(layout, self.field, value)
+
+
 class Layout:
     """
     The Layout class is the base class for all layouts. It contains the
@@ -19,9 +40,11 @@ class Layout:
     image: str
     is_enabled: bool = True
     plot_type: PLOT_TYPE
-    x_axis: str
-    y_axis: str
-    settings: LayoutSettings
+    x_axis: str = CalculatedField()
+    y_axis: str = CalculatedField()
+    settings: LayoutSettings = CalculatedField()
+    # the project to recalculate the layout for, None if it is up to date
+    _dirty_project = None
 
     def __init__(
         self,
@@ -225,6 +248,23 @@ class Layout:
         """
         pass
 
+    def mark_dirty(self, project):
+        """
+        Marks the layout as out of date. It is recalculated for the project
+        when its fields are next read, e.g. by the build, see
+        :meth:`refresh`.
+        """
+        self._dirty_project = project
+
+    def refresh(self):
+        """
+        Recalculates the layout if it was marked dirty.
+        """
+        project = self._dirty_project
+        if project is not None:
+            self._dirty_project = None
+            self.calculate_layout(project)
+
     def toDict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
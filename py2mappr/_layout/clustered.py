@@ -35,30 +35,32 @@ class ClusteredLayout(Layout):
             project.dataFrame
         )
         self.settings["nodeImageAttr"] = attrutils.find_node_image_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodePopImageAttr"] = attrutils.find_node_image_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["labelAttr"] = attrutils.find_node_label_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["labelHoverAttr"] = attrutils.find_node_label_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodeColorAttr"] = attrutils.find_node_color_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodeSizeAttr"] = attrutils.find_node_size_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
 
         if project.network is not None:
             self.settings["edgeColorAttr"] = attrutils.find_node_color_attr(
-                project.network
+                project.network, profile=project.network_profile
             )
             self.settings["edgeSizeAttr"] = attrutils.find_node_size_attr(
-                project.network, ["source", "target"]
+                project.network,
+                ["source", "target"],
+                profile=project.network_profile,
             )
 
     def toDict(self):
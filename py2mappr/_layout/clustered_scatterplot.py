@@ -1,4 +1,4 @@
-from ._layout import Layout, LayoutSettings
+from ._layout import Layout, LayoutSettings, CalculatedField
 from ._settings import base_layout_settings
 from .._attributes import utils as attrutils
 import copy
@@ -30,8 +30,8 @@ class ClusteredScatterplotLayout(Layout):
     "clustered-scatterplot"
     """
 
-    clusterXAttr: str
-    clusterYAttr: str
+    clusterXAttr: str = CalculatedField()
+    clusterYAttr: str = CalculatedField()
 
     def __init__(
         self,
@@ -68,33 +68,35 @@ class ClusteredScatterplotLayout(Layout):
             project.dataFrame
         )
         self.settings["nodeImageAttr"] = attrutils.find_node_image_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodePopImageAttr"] = attrutils.find_node_image_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["labelAttr"] = attrutils.find_node_label_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodeClusterAttr"] = attrutils.find_node_label_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["labelHoverAttr"] = attrutils.find_node_label_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodeColorAttr"] = attrutils.find_node_color_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
         self.settings["nodeSizeAttr"] = attrutils.find_node_size_attr(
-            project.dataFrame
+            project.dataFrame, profile=project.profile
         )
 
         if project.network is not None:
             self.settings["edgeColorAttr"] = attrutils.find_node_color_attr(
-                project.network
+                project.network, profile=project.network_profile
             )
             self.settings["edgeSizeAttr"] = attrutils.find_node_size_attr(
-                project.network, ["source", "target"]
+                project.network,
+                ["source", "target"],
+                profile=project.network_profile,
             )
 
     def toDict(self):
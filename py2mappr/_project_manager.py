@@ -1,4 +1,5 @@
 import py2mappr._core as core
+from py2mappr._attributes.calculate import INFERENCE_MODE
 from pandas import DataFrame
 
 _current_project: core.OpenmapprProject = None
@@ -14,7 +15,11 @@ def has_project():
     global _current_project
     return _current_project is not None
 
-def get_project(data_frame: DataFrame = None, network_data_frame: DataFrame = None):
+def get_project(
+    data_frame: DataFrame = None,
+    network_data_frame: DataFrame = None,
+    inference: INFERENCE_MODE = "full",
+):
     """
     Returns the current project. If there is no current project, it creates a
     new project with the provided data frame.
@@ -31,6 +36,9 @@ def get_project(data_frame: DataFrame = None, network_data_frame: DataFrame = No
     current project's network data frame will be used. Should be provided if
     there is no current project.
 
+    inference: INFERENCE_MODE, optional. How the attribute types of a new
+    project are inferred, "full" or "sample". The default is "full".
+
     Returns
     -------
     `OpenmapprProject`: The current project.
@@ -54,5 +62,7 @@ def get_project(data_frame: DataFrame = None, network_data_frame: DataFrame = No
     if data_frame is None:
         raise ValueError('No data frame was provided')
 
-    _current_project = core.OpenmapprProject(data_frame, network_data_frame)
+    _current_project = core.OpenmapprProject(
+        data_frame, network_data_frame, inference=inference
+    )
     return _current_project
\ No newline at end of file
@@ -0,0 +1,66 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+
+class AttributeCoverage:
+    """
+    The missing values of the attributes of the datapoints or of the links,
+    read from the null masks of the source data frame. The mask of every
+    referenced column is computed once and shared by all the snapshots.
+
+    Parameters
+    ----------
+    df : pd.DataFrame. The data frame of the datapoints or of the links, None
+    if there are none.
+
+    sample_size : int, optional. The number of rows sampled from the data
+    frame, by default None (all the rows are checked).
+
+    seed : int, optional. The seed of the sampling, by default 0.
+    """
+
+    def __init__(self, df: pd.DataFrame, sample_size: int = None, seed=0):
+        self.population = 0 if df is None else len(df)
+        if df is not None and sample_size is not None:
+            if sample_size < len(df):
+                df = df.sample(n=sample_size, random_state=seed)
+        self._df = df
+        self.sampled = len(self) < self.population
+        self._missing: Dict[str, np.ndarray] = {}
+        self._counts: Dict[Tuple[str, ...], int] = {}
+
+    def __len__(self) -> int:
+        return 0 if self._df is None else len(self._df)
+
+    def missing(self, attr: str) -> np.ndarray:
+        """
+        Returns the mask of the rows missing the attribute, all of them if
+        the attribute is not a column.
+        """
+        if attr not in self._missing:
+            if self._df is None or attr not in self._df.columns:
+                self._missing[attr] = np.ones(len(self), dtype=bool)
+            else:
+                self._missing[attr] = self._df[attr].isna().to_numpy()
+        return self._missing[attr]
+
+    def estimate(self, count: int) -> int:
+        """
+        Scales a count of sampled rows to the whole data frame.
+        """
+        if not self.sampled:
+            return count
+        return round(count * self.population / len(self))
+
+    def count_missing(self, attrs: List[str]) -> int:
+        """
+        Returns the number of rows missing any of the attributes.
+        """
+        key = tuple(attrs)
+        if key not in self._counts:
+            mask = np.zeros(len(self), dtype=bool)
+            for attr in attrs:
+                mask |= self.missing(attr)
+            self._counts[key] = int(mask.sum())
+        return self._counts[key]
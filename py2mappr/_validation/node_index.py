@@ -0,0 +1,40 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+
+
+class NodeIndex:
+    """
+    The index of the node ids. It is built once per build and shared by the
+    builders of the datapoints and nodes, which take the ids in node order,
+    and by the validators, which check the link ends with set membership.
+
+    Parameters
+    ----------
+    ids : Iterable[str]. The ids of the nodes.
+    """
+
+    ids: set
+    order: List[str]
+    duplicates: List[str]
+
+    def __init__(self, ids: Iterable[str]):
+        self.order = list(ids)
+        counts = Counter(self.order)
+        self.ids = set(counts)
+        self.duplicates = [
+            node_id for node_id, count in counts.items() if count > 1
+        ]
+        self._count = sum(counts.values())
+
+    @classmethod
+    def from_datapoints(cls, datapoints: Iterable[Dict[str, Any]]):
+        """
+        Builds the index from the datapoints or the nodes of the build.
+        """
+        return cls(datapoint["id"] for datapoint in datapoints)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.ids
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,154 @@
+from typing import Any, Dict, List, Literal, TypedDict, Union
+import math
+from .warn import warn
+
+VALIDATION_LEVEL = Literal["off", "fast", "full"]
+SETTINGS_SCHEMA = Literal["player", "fallback"]
+
+# the share of affected rows the confidence of a sampled check refers to
+SAMPLE_PREVALENCE = 0.01
+
+
+class ValidationCheck(TypedDict):
+    """
+    A check run by the build. A sampled check only looked at `sample_size`
+    of the `population` rows, its confidence is the probability that the
+    sample contains at least one row of an issue affecting 1% of the rows.
+    """
+
+    check: str
+    population: int
+    sample_size: int
+    sampled: bool
+    confidence: float
+
+
+class ValidationIssue(TypedDict):
+    check: str
+    message: str
+    details: Dict[str, Any]
+
+
+class ValidationResults(TypedDict):
+    level: VALIDATION_LEVEL
+    checks: List[ValidationCheck]
+    issues: List[ValidationIssue]
+    skipped: List[str]
+    settings_schema: Union[SETTINGS_SCHEMA, None]
+
+
+def check_validation_level(level: VALIDATION_LEVEL):
+    """
+    Ensures the validation level is known.
+
+    Exceptions
+    ----------
+    ValueError. If the level is not one of "off", "fast" or "full".
+    """
+    if level not in ["off", "fast", "full"]:
+        raise ValueError(f"Unknown validation level: {level}")
+
+
+def sample_confidence(sample_size: int, population: int) -> float:
+    """
+    Returns the probability that `sample_size` rows drawn without
+    replacement from `population` rows contain at least one row of an issue
+    affecting `SAMPLE_PREVALENCE` of the rows.
+    """
+    if sample_size >= population:
+        return 1.0
+    affected = max(1, int(population * SAMPLE_PREVALENCE))
+    unaffected = population - affected
+    if sample_size > unaffected:
+        return 1.0
+    # the hypergeometric probability that every sampled row is unaffected
+    missed = (
+        math.lgamma(unaffected + 1)
+        - math.lgamma(unaffected - sample_size + 1)
+        - math.lgamma(population + 1)
+        + math.lgamma(population - sample_size + 1)
+    )
+    return 1.0 - math.exp(missed)
+
+
+_results: ValidationResults = None
+
+
+def start_validation(level: VALIDATION_LEVEL = "full") -> ValidationResults:
+    """
+    Starts collecting the checks and issues of a new build.
+    """
+    global _results
+    _results = {
+        "level": level,
+        "checks": [],
+        "issues": [],
+        "skipped": [],
+        "settings_schema": None,
+    }
+    return _results
+
+
+def get_validation_results() -> Union[ValidationResults, None]:
+    """
+    Returns the checks and the issues of the validation of the last build.
+    Every issue has the check that found it ("layout", "attributes",
+    "node_ids", "source_target" or "schema"), its message and its details,
+    e.g. the offending links. The build stages skipped by an incremental
+    build, whose checks did not run again, are listed in `skipped`. The
+    `settings_schema` is "fallback" when the settings were only checked
+    against the structural fallback schema, not the player schema.
+
+    Returns
+    -------
+    Union[ValidationResults, None]. The validation results, None if nothing
+    was built.
+    """
+    return _results
+
+
+def record_check(check: str, population: int, sample_size: int = None):
+    """
+    Records a check of `population` rows, sampled when `sample_size` is set
+    and smaller than the population.
+    """
+    if _results is None:
+        return
+    if sample_size is None or sample_size >= population:
+        sample_size = population
+    _results["checks"].append(
+        {
+            "check": check,
+            "population": population,
+            "sample_size": sample_size,
+            "sampled": sample_size < population,
+            "confidence": sample_confidence(sample_size, population),
+        }
+    )
+
+
+def record_skipped_stage(stage: str):
+    """
+    Records a build stage skipped as unchanged, whose checks did not run.
+    """
+    if _results is not None:
+        _results["skipped"].append(stage)
+
+
+def record_settings_schema(schema: SETTINGS_SCHEMA):
+    """
+    Records the schema the settings were validated against.
+    """
+    if _results is not None:
+        _results["settings_schema"] = schema
+
+
+def report_issue(check: str, message: str, **details: Any):
+    """
+    Prints the issue as a warning and adds it to the results of the build.
+    """
+    warn(message)
+    if _results is not None:
+        _results["issues"].append(
+            {"check": check, "message": message, "details": details}
+        )
@@ -1,5 +1,6 @@
-from typing import List, Dict, Any
-from .warn import warn
+from typing import List, Dict, Any, Union
+from .coverage import AttributeCoverage
+from .results import report_issue
 
 
 def __no_attr(path: str, attr: str, datapoint: Dict[str, Any]):
@@ -13,35 +14,73 @@ def has_no_attrs(attrs: List[str], datapoint: Dict[str, Any]):
 def validate_layout_attr(attr: str, layout_dict: Dict[str, Any]):
     layout_name = layout_dict["snapName"]
     if __no_attr("layout", attr, layout_dict):
-        warn(f"{layout_name}: {attr} is not set in layout")
+        report_issue(
+            "layout",
+            f"{layout_name}: {attr} is not set in layout",
+            layout=layout_name,
+            setting=attr,
+        )
 
 
 def validate_layout_setting(attr: str, layout_dict: Dict[str, Any]):
     layout_name = layout_dict["snapName"]
     if __no_attr("settings", attr, layout_dict["layout"]):
-        warn(f"{layout_name}: {attr} is not set in layout")
+        report_issue(
+            "layout",
+            f"{layout_name}: {attr} is not set in layout",
+            layout=layout_name,
+            setting=attr,
+        )
 
 
 def validate_node_attributes(
     layout_name: str,
     attrs: List[str],
-    datapoints: List[Dict[str, Any]],
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage],
     type: str = "datapoints",
 ):
-    missed_dp = [
-        datapoint for datapoint in datapoints if has_no_attrs(attrs, datapoint)
-    ]
-
-    if len(missed_dp) == len(datapoints):
-        warn(f"{layout_name}: Attributes {attrs} are missing for all {type}.")
-    elif len(missed_dp) > 0:
-        warn(
-            f"{layout_name}: {len(missed_dp)} {type} are missing one of {attrs} attributes."
+    if isinstance(datapoints, AttributeCoverage):
+        missed = datapoints.count_missing(attrs)
+        total = datapoints.population
+        sampled = datapoints.sampled
+        estimate = datapoints.estimate(missed)
+    else:
+        missed = len([dp for dp in datapoints if has_no_attrs(attrs, dp)])
+        total = len(datapoints)
+        sampled = False
+        estimate = missed
+
+    details = dict(
+        layout=layout_name,
+        attributes=attrs,
+        missing=estimate,
+        total=total,
+        sampled=sampled,
+    )
+    if missed == len(datapoints):
+        report_issue(
+            "attributes",
+            f"{layout_name}: Attributes {attrs} are missing for all {type}.",
+            **details,
+        )
+    elif missed > 0 and sampled:
+        report_issue(
+            "attributes",
+            f"{layout_name}: ~{estimate} {type} are missing one of {attrs} "
+            f"attributes (estimated from {len(datapoints)} sampled {type}).",
+            **details,
+        )
+    elif missed > 0:
+        report_issue(
+            "attributes",
+            f"{layout_name}: {missed} {type} are missing one of {attrs} attributes.",
+            **details,
         )
 
 
 def validate_xy_attributes(
-    layout_dict: Dict[str, Any], datapoints: List[Dict[str, Any]]
+    layout_dict: Dict[str, Any],
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage],
 ):
     layout_name = layout_dict["snapName"]
     # check x/y attributes
@@ -84,7 +123,7 @@ def validate_xy_attributes(
 
 def __validator(
     layout_dict: Dict[str, Any],
-    datapoints: List[Dict[str, Any]],
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage],
     type: str = "datapoints",
 ):
     def validate(
@@ -107,7 +146,8 @@ def __validator(
 
 
 def validate_nodes(
-    layout_dict: Dict[str, Any], datapoints: List[Dict[str, Any]]
+    layout_dict: Dict[str, Any],
+    datapoints: Union[List[Dict[str, Any]], AttributeCoverage],
 ):
     validate_xy_attributes(layout_dict, datapoints)
     node_validator = __validator(layout_dict, datapoints)
@@ -118,7 +158,10 @@ def validate_nodes(
     node_validator("nodeClusterAttr", None, "nodeClusterAttr")
 
 
-def validate_links(layout_dict: Dict[str, Any], links: List[Dict[str, Any]]):
+def validate_links(
+    layout_dict: Dict[str, Any],
+    links: Union[List[Dict[str, Any]], AttributeCoverage],
+):
     link_validator = __validator(layout_dict, links, "edges")
     link_validator("edgeColorStrat", "attr", "edgeColorAttr")
     link_validator("edgeSizeStrat", "attr", "edgeSizeAttr")
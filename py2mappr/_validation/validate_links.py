@@ -1,20 +1,153 @@
-from typing import List, Dict, Any
-from .warn import warn
+from typing import List, Dict, Any, Union
+import numpy as np
+from .node_index import NodeIndex
+from .results import record_check, report_issue
+
+# the number of offending ids listed in the warnings
+_max_reported = 10
 
 
 def any_id(datapoints: List[Dict[str, Any]], id: str):
     return any([datapoint["id"] == id for datapoint in datapoints])
 
 
-def validate_source_target(
-    links: List[Dict[str, Any]], datapoints: List[Dict[str, Any]]
-):
+def __listing(items: List[str]) -> str:
+    listed = ", ".join(items[:_max_reported])
+    if len(items) > _max_reported:
+        listed += f" and {len(items) - _max_reported} more"
+    return listed
+
+
+def validate_node_ids(index: NodeIndex) -> List[str]:
+    """
+    Reports the node ids that are used by more than one node.
+
+    Parameters
+    ----------
+    index : NodeIndex. The index of the node ids.
+
+    Returns
+    -------
+    List[str]. The duplicated node ids.
+    """
+    record_check("node_ids", len(index))
+    if len(index.duplicates) > 0:
+        report_issue(
+            "node_ids",
+            f"{len(index.duplicates)} node ids are duplicated: "
+            f"{__listing(index.duplicates)}.",
+            duplicates=index.duplicates,
+        )
+    return index.duplicates
+
+
+def validate_link_ends(
+    link_ids: List[str],
+    sources: List[str],
+    targets: List[str],
+    index: NodeIndex,
+    sample_size: int = None,
+    seed: int = 0,
+) -> List[Dict[str, str]]:
+    """
+    Reports the duplicated node ids and the links whose source or target is
+    not a node id. When `sample_size` is set, only a random sample of the
+    links is checked and the number of offending links is estimated.
+
+    Parameters
+    ----------
+    link_ids : List[str]. The ids of the links.
+
+    sources : List[str]. The source node ids of the links.
+
+    targets : List[str]. The target node ids of the links.
+
+    index : NodeIndex. The index of the node ids.
+
+    sample_size : int, optional. The number of links to check, by default
+    None (all the links are checked).
+
+    seed : int, optional. The seed of the sampling, by default 0.
+
+    Returns
+    -------
+    List[Dict[str, str]]. The offending links with their id, source and
+    target, only the sampled ones when the links are sampled.
+    """
+    validate_node_ids(index)
+
+    population = len(link_ids)
+    record_check("source_target", population, sample_size)
+    if sample_size is not None and sample_size < population:
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(population, sample_size, replace=False))
+        link_ids = [link_ids[i] for i in sample]
+        sources = [sources[i] for i in sample]
+        targets = [targets[i] for i in sample]
+
     invalid_links = [
-        link
-        for link in links
-        if not any_id(datapoints, link["source"])
-        or not any_id(datapoints, link["target"])
+        {"id": link_id, "source": source, "target": target}
+        for link_id, source, target in zip(link_ids, sources, targets)
+        if source not in index.ids or target not in index.ids
     ]
 
     if len(invalid_links) > 0:
-        warn(f"{len(invalid_links)} links have invalid source or target.")
+        sampled = len(link_ids) < population
+        count = len(invalid_links)
+        if sampled:
+            count = round(count * population / len(link_ids))
+            message = (
+                f"~{count} links have invalid source or target (estimated "
+                f"from {len(link_ids)} sampled links)."
+            )
+        else:
+            message = f"{count} links have invalid source or target."
+        listing = __listing(
+            [
+                f"{link['id']} ({link['source']} -> {link['target']})"
+                for link in invalid_links
+            ]
+        )
+        report_issue(
+            "source_target",
+            f"{message} Links with invalid source or target: {listing}",
+            links=invalid_links,
+            count=count,
+            sampled=sampled,
+        )
+
+    return invalid_links
+
+
+def validate_source_target(
+    links: List[Dict[str, Any]],
+    datapoints: Union[List[Dict[str, Any]], NodeIndex],
+) -> List[Dict[str, str]]:
+    """
+    Reports the duplicated node ids and the links whose source or target is
+    not a node id, see :func:`validate_link_ends`.
+
+    Parameters
+    ----------
+    links : List[Dict[str, Any]]. The links.
+
+    datapoints : Union[List[Dict[str, Any]], NodeIndex]. The datapoints or
+    nodes, or the index of their ids.
+
+    Returns
+    -------
+    List[Dict[str, str]]. The offending links with their id, source and
+    target.
+    """
+    index = (
+        datapoints
+        if isinstance(datapoints, NodeIndex)
+        else NodeIndex.from_datapoints(datapoints)
+    )
+    link_ids, sources, targets = [], [], []
+    for link in links:
+        link_ids.append(link["id"])
+        sources.append(link["source"])
+        targets.append(link["target"])
+
+    return validate_link_ends(link_ids, sources, targets, index)
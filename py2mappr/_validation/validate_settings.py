@@ -1,18 +1,214 @@
-from typing import Dict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+import json
+import os
 import jsonschema
 import requests
+from .results import record_check, record_settings_schema, report_issue
 from .warn import warn
 
-def validate_settings(settings: Dict):
-    # shared settings file
-    settings_url = "https://raw.githubusercontent.com/vibrant-data-labs/openmappr-player/master/settings.schema.json"
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# shared settings file
+SETTINGS_SCHEMA_URL = "https://raw.githubusercontent.com/vibrant-data-labs/openmappr-player/master/settings.schema.json"
+SCHEMA_FILE = "settings.schema.json"
+# the structural schema of the settings written by the builder, it is not the
+# schema of the player and only stands in for it until it is downloaded
+FALLBACK_SCHEMA_FILE = "fallback_settings.schema.json"
+
+_fallback_schema = Path(__file__).parent / FALLBACK_SCHEMA_FILE
+# the cache folder passed to the last refresh, used by the validations
+_cache_dir: Path = None
+# the validator is compiled once per process and cache folder
+_validator: Callable[[Dict], List[str]] = None
+_validator_dir: Path = None
+_validator_is_fallback = False
+
+
+def schema_cache_dir() -> Path:
+    """
+    Returns the folder of the cached settings schema: the folder of the last
+    :func:`refresh_settings_schema`, otherwise `PY2MAPPR_CACHE_DIR` or
+    `~/.cache/py2mappr`.
+    """
+    if _cache_dir is not None:
+        return _cache_dir
+    return Path(
+        os.environ.get("PY2MAPPR_CACHE_DIR")
+        or Path.home() / ".cache" / "py2mappr"
+    )
+
+
+def refresh_settings_schema(
+    cache_dir: Union[Path, str] = None, timeout: float = 10
+) -> bool:
+    """
+    Downloads the settings schema of the player to the cache folder. The
+    following validations use the downloaded schema, from the given cache
+    folder when it is set.
+
+    Parameters
+    ----------
+    cache_dir : Union[Path, str], optional. The cache folder, by default
+    :func:`schema_cache_dir`.
+
+    timeout : float, optional. The timeout of the download in seconds, by
+    default 10.
+
+    Returns
+    -------
+    bool. Whether the schema was downloaded, the cached or fallback schema
+    is kept otherwise.
+    """
+    global _cache_dir, _validator
+    cache_dir = Path(cache_dir or schema_cache_dir())
+    try:
+        schema = requests.get(SETTINGS_SCHEMA_URL, timeout=timeout).json()
+        jsonschema.Draft4Validator.check_schema(schema)
+    except Exception:
+        warn(f"Unable to fetch settings schema at {SETTINGS_SCHEMA_URL}")
+        return False
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_dir / SCHEMA_FILE, "w") as f:
+        json.dump(schema, f, indent=4)
+
+    _cache_dir = cache_dir
+    _validator = None
+    return True
+
+
+def load_settings_schema(cache_dir: Union[Path, str] = None) -> Dict:
+    """
+    Loads the settings schema, the cached copy of the player schema if there
+    is one, otherwise the fallback schema bundled with the package. The
+    fallback schema only checks the structure of the settings written by the
+    builder, it is not the player schema.
+
+    Parameters
+    ----------
+    cache_dir : Union[Path, str], optional. The cache folder, by default
+    :func:`schema_cache_dir`.
+
+    Returns
+    -------
+    Dict. The settings schema.
+    """
+    return __load_schema(cache_dir)[0]
+
+
+def __load_schema(cache_dir: Union[Path, str] = None) -> Tuple[Dict, bool]:
+    # the schema and whether it is the fallback schema
+    cached = Path(cache_dir or schema_cache_dir()) / SCHEMA_FILE
+    try:
+        with open(cached, "r") as f:
+            return json.load(f), False
+    except (OSError, ValueError):
+        pass
+
+    with open(_fallback_schema, "r") as f:
+        return json.load(f), True
+
+
+def __compile(schema: Dict) -> Callable[[Dict], List[str]]:
+    full_validator = jsonschema.Draft4Validator(schema)
+
+    def errors(settings: Dict) -> List[str]:
+        return [
+            f"{error.message} at {error.json_path}"
+            for error in full_validator.iter_errors(settings)
+        ]
+
+    if fastjsonschema is None:
+        return errors
+
+    # the generated validator checks the valid settings, the errors of the
+    # invalid ones are all listed by jsonschema
+    fast_validator = fastjsonschema.compile(schema)
+
+    def validate(settings: Dict) -> List[str]:
+        try:
+            fast_validator(settings)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            return errors(settings)
+
+    return validate
+
+
+def get_settings_validator(
+    cache_dir: Union[Path, str] = None,
+) -> Callable[[Dict], List[str]]:
+    """
+    Returns the settings validator, compiled on the first use. It uses the
+    code generating `fastjsonschema` when it is installed, otherwise
+    `jsonschema`.
+
+    Parameters
+    ----------
+    cache_dir : Union[Path, str], optional. The cache folder of the schema,
+    by default :func:`schema_cache_dir`.
+
+    Returns
+    -------
+    Callable[[Dict], List[str]]. Validates the settings and returns the
+    error messages.
+    """
+    global _validator, _validator_dir, _validator_is_fallback
+    cache_dir = Path(cache_dir or schema_cache_dir())
+    if _validator is None or _validator_dir != cache_dir:
+        schema, is_fallback = __load_schema(cache_dir)
+        _validator = __compile(schema)
+        _validator_dir = cache_dir
+        _validator_is_fallback = is_fallback
+    return _validator
+
+
+def uses_fallback_schema() -> bool:
+    """
+    Returns whether the last compiled validator uses the fallback schema.
+    """
+    return _validator is not None and _validator_is_fallback
+
+
+def validate_settings(settings: Dict[str, Any]) -> List[str]:
+    """
+    Validates the settings against the settings schema of the player and
+    reports the errors. No network access is made: until the player schema
+    is downloaded by :func:`refresh_settings_schema`, the settings are only
+    checked against the structural fallback schema of the builder, which is
+    reported by a warning and the `settings_schema` of the results.
+
+    Parameters
+    ----------
+    settings : Dict[str, Any]. The settings file data.
+
+    Returns
+    -------
+    List[str]. The error messages.
+    """
     try:
-        schema = requests.get(settings_url).json()
+        validator = get_settings_validator()
+    except Exception:
+        warn("Unable to load the settings schema, skipping validation")
+        return []
 
-        validator = jsonschema.Draft4Validator(schema)
+    if uses_fallback_schema():
+        record_settings_schema("fallback")
+        warn(
+            "The settings were only checked against the structural fallback "
+            "schema of py2mappr, not the player schema. Call "
+            "mappr.update_settings_schema() to validate them against the "
+            "player schema."
+        )
+    else:
+        record_settings_schema("player")
 
-        errors = validator.iter_errors(settings)
-        for error in errors:
-            warn(f"[Invalid Schema]: {error.message} at {error.json_path}")
-    except:
-        warn(f"Unable to fetch settings schema at {settings_url}, skipping validation")
+    record_check("schema", 1)
+    errors = validator(settings)
+    for error in errors:
+        report_issue("schema", f"[Invalid Schema]: {error}", error=error)
+    return errors
@@ -8,6 +8,13 @@ from py2mappr._layout.scatterplot import ScatterplotLayout
 from ._project_manager import get_project, has_project
 from ._layout import ClusteredLayout, PLOT_TYPE, Layout
 from ._builder import build_map
+from ._builder.builder import OUTPUT_PROFILE, get_build_report
+from ._builder._profiler import BuildReport
+from ._validation.results import VALIDATION_LEVEL, get_validation_results
+from ._builder._compress import COMPRESSION
+from ._builder._encoder import JSON_BACKEND
+from ._attributes.calculate import INFERENCE_MODE
+from ._validation.validate_settings import refresh_settings_schema
 import py2mappr.publish as publisher
 from pandas import DataFrame
 
@@ -18,6 +25,7 @@ def create_map(
     data_frame: DataFrame,
     network_df: DataFrame = None,
     layout_type: PLOT_TYPE = "clustered",
+    inference: INFERENCE_MODE = "full",
 ) -> Tuple[OpenmapprProject, Layout]:
     """
     Creates a new mappr project with the layout and returns the project and the
@@ -36,6 +44,12 @@ def create_map(
     layout_type: str, optional. The type of the layout to be created as the
     first layout in the project. The default is "clustered".
 
+    inference: INFERENCE_MODE, optional. How the attribute types are
+    inferred. "full" scans every row, "sample" infers the string columns from
+    a sample of the rows and scans a column only if the sample is ambiguous.
+    The choice and the confidence of every column are kept in
+    `project.attribute_inference`. The default is "full".
+
     Returns
     -------
     `Tuple[OpenmapprProject, Layout]`: The project and the created layout.
@@ -49,7 +63,7 @@ def create_map(
     >>> project.set_display_data(title="My Project")
     >>> mappr.show()
     """
-    project = get_project(data_frame, network_df)
+    project = get_project(data_frame, network_df, inference)
     project.set_debug(_debug)
     layout = create_layout(data_frame, layout_type)
     return project, layout
@@ -156,7 +170,21 @@ def show(PORT=8080, out_folder: Path = "data_out", detach: List[Layout] = []):
     publisher.run([publisher.local(out_folder, PORT=PORT)])
 
 
-def build(out_folder: Path = "data_out", detach: List[Layout] = []):
+def build(
+    out_folder: Path = "data_out",
+    detach: List[Layout] = [],
+    workers: int = 1,
+    output_profile: OUTPUT_PROFILE = "pretty",
+    precompress: List[COMPRESSION] = [],
+    shard_size: int = None,
+    incremental: bool = False,
+    profile: bool = False,
+    profile_path: Path = None,
+    validation: VALIDATION_LEVEL = "full",
+    md_cache_dir: Path = None,
+    json_backend: JSON_BACKEND = "json",
+    validation_sample_size: int = 10000,
+) -> BuildReport:
     """
     Builds the current project.
 
@@ -168,6 +196,53 @@ def build(out_folder: Path = "data_out", detach: List[Layout] = []):
     detach: List[Layout], optional. The list of layouts to be detached from the
     project. The default is empty list.
 
+    workers: int, optional. The number of processes used to render the
+    markdown text attributes. The default is 1.
+
+    output_profile: OUTPUT_PROFILE, optional. The json formatting of the data
+    files, "pretty" (indented) or "compact" (minified). The default is
+    "pretty".
+
+    precompress: List[COMPRESSION], optional. The content encodings ("gzip",
+    "br") of the precompressed copies written next to the data files. The
+    default is empty list.
+
+    shard_size: int, optional. The number of datapoints and links in every
+    shard file. When set, the datapoints and links are split into the shard
+    files listed in `nodes.json` and `links.json`. The default is None.
+
+    incremental: bool, optional. Whether to skip rewriting the files whose
+    inputs are unchanged since the previous build. The default is False.
+
+    profile: bool, optional. Whether to measure the wall time, cpu time, RSS
+    change and output bytes of every build stage. The default is False.
+
+    profile_path: Path, optional. The json file to write the stage report to,
+    setting it turns on the profiling. The report is written again with the
+    "publish" stage when the build is published. The default is None.
+
+    validation: VALIDATION_LEVEL, optional. "full" to check all the
+    datapoints and links, "fast" to check a sample of them and estimate the
+    issue counts, "off" to skip the validation. The checks and the issues
+    are returned by :func:`get_validation_results`. The default is "full".
+
+    md_cache_dir: Path, optional. The folder the rendered markdown is kept in
+    between builds, so that the unchanged texts are not rendered again. The
+    default is None, the rendered markdown is only cached in memory.
+
+    json_backend: JSON_BACKEND, optional. The json encoder of the data files,
+    "json" (standard library), "orjson" (faster, with a different output for
+    NaN, non-ASCII text and some floats) or "auto" (orjson when it is
+    installed). The default is "json".
+
+    validation_sample_size: int, optional. The number of datapoints and links
+    checked by the "fast" validation. The default is 10000.
+
+    Returns
+    -------
+    BuildReport. The stage report of the build, None if the build is not
+    profiled.
+
     Examples
     --------
     Building the current project:
@@ -176,8 +251,25 @@ def build(out_folder: Path = "data_out", detach: List[Layout] = []):
     >>> mappr.build()
     """
     project = get_project()
-    build_map(project, out_folder=out_folder, start=False, detach=detach)
+    build_map(
+        project,
+        out_folder=out_folder,
+        start=False,
+        detach=detach,
+        workers=workers,
+        output_profile=output_profile,
+        precompress=precompress,
+        shard_size=shard_size,
+        incremental=incremental,
+        profile=profile,
+        profile_path=profile_path,
+        validation=validation,
+        md_cache_dir=md_cache_dir,
+        json_backend=json_backend,
+        validation_sample_size=validation_sample_size,
+    )
     publisher.set_player_directory(out_folder)
+    return get_build_report()
 
 
 def set_debug(debug: bool = True):
@@ -225,3 +317,25 @@ def launch_publish(s3_bucket: str):
     path = build_map(project, start=False)
     publisher.set_player_directory(path)
     publisher.run([publisher.s3(s3_bucket, path)])
+
+
+def update_settings_schema() -> bool:
+    """
+    Downloads the latest settings schema of the player. The builds validate
+    the settings against the downloaded copy once there is one, otherwise
+    only against the fallback schema bundled with py2mappr, which checks the
+    structure of the settings written by the builder and is not the player
+    schema. The builds never access the network.
+
+    Returns
+    -------
+    bool. Whether the schema was downloaded.
+
+    Examples
+    --------
+    Updating the settings schema before building:
+
+    >>> mappr.update_settings_schema()
+    >>> mappr.build()
+    """
+    return refresh_settings_schema()
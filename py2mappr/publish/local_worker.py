@@ -4,6 +4,37 @@ import socketserver
 import http.server
 from pathlib import Path
 
+# precompressed copies written by the builder, in the order of preference
+_precompressed = [("br", ".br"), ("gzip", ".gz")]
+
+
+class PrecompressedHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves the precompressed copy of the requested file (`<file>.br` or
+    `<file>.gz`) as it is, when it exists and the client accepts its encoding.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        accepted = [
+            encoding.split(";")[0].strip()
+            for encoding in self.headers.get("Accept-Encoding", "").split(",")
+        ]
+        for encoding, suffix in _precompressed:
+            if encoding not in accepted or not os.path.isfile(path + suffix):
+                continue
+
+            f = open(path + suffix, "rb")
+            self.send_response(200)
+            self.send_header("Content-type", self.guess_type(path))
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(os.fstat(f.fileno())[6]))
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return f
+
+        return super().send_head()
+
 
 def local_worker(web_dir: Path, PORT=8080):
     # change to project directory where index.html and data folder are
@@ -12,7 +43,7 @@ def local_worker(web_dir: Path, PORT=8080):
     # open new tab in browswer
     webbrowser.open_new_tab("http://localhost:" + str(PORT))
 
-    Handler = http.server.SimpleHTTPRequestHandler
+    Handler = PrecompressedHandler
     with socketserver.TCPServer(("", PORT), Handler) as httpd:
         print(
             "\nServing locally at port",
@@ -2,6 +2,7 @@ from typing import Any, Callable, Dict, List
 import pathlib as pl
 from .._project_manager import get_project
 from .._builder import build_map
+from .._builder._profiler import get_profiler, profile_stage
 
 __directory: pl.Path = None
 
@@ -118,7 +119,11 @@ def run(workers: List[Callable], path: pl.Path = "data_out"):
         }
     )
     for worker in workers:
-        res = worker(pass_data)
+        with profile_stage("publish"):
+            res = worker(pass_data)
         pass_data = {**pass_data, **res} if res is not None else pass_data
 
+    if get_profiler() is not None:
+        get_profiler().save()
+
     __directory = None
@@ -71,15 +71,27 @@ def s3_worker(path: Path, bucket_name: str):
     data_path = str(path)
     for subdir, _, files in os.walk(path):
         for file in files:
+            # hidden files, e.g. the build manifest, are never published
+            if file.startswith("."):
+                continue
+
+            ext = file.split(".")[-1]
+            # s3 does not negotiate the content encoding, so the gzip copy is
+            # uploaded in place of its source file and brotli is skipped
+            if ext in ["gz", "br"]:
+                continue
+
             full_path = os.path.join(subdir, file)
-            with open(full_path, "rb") as data:
-                ext = full_path.split(".")[-1]
-                object_key = (
-                    full_path[len(data_path) + 1 :]
-                    if subdir == data_path
-                    else "%s/%s"
-                    % (os.path.basename(subdir), os.path.basename(full_path))
-                )
+            extra_args = {}
+            upload_path = full_path
+            if os.path.isfile(full_path + ".gz"):
+                upload_path = full_path + ".gz"
+                extra_args = {"ContentEncoding": "gzip"}
+
+            with open(upload_path, "rb") as data:
+                object_key = Path(
+                    os.path.relpath(full_path, data_path)
+                ).as_posix()
 
                 if has_index and ("index.html" in str(full_path)):
                     print("index.html found")
@@ -97,6 +109,7 @@ def s3_worker(path: Path, bucket_name: str):
                     Body=data,
                     ACL="public-read",
                     ContentType=_file_mapping[ext],
+                    **extra_args,
                 )
 
     print(
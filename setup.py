@@ -22,7 +22,7 @@ setup(name='py2mappr',
       author='ericberlow',
       author_email='ericberlow@gmail.com',
       license='MIT',
-      packages=find_packages(),
+      packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
       install_requires=[
           'numpy',
           'pandas',
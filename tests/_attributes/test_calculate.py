@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+from py2mappr._attributes.calculate import (
+    calculate_attr_types,
+    calculate_render_type,
+    count_distinct_tags,
+    infer_attributes,
+    stratified_sample,
+)
+
+
+def test_attr_types():
+    df = pd.DataFrame(
+        {
+            "year": [1990, 2000, 2010],
+            "score": [0.5, np.nan, 1.5],
+            "tags": ["a", None, "b|c"],
+            "mixed": [1, "x", ["y|z"]],
+            "name": ["a", "b", "c"],
+        }
+    )
+
+    assert calculate_attr_types(df) == {
+        "year": "year",
+        "score": "float",
+        "tags": "liststring",
+        "mixed": "liststring",
+        "name": "string",
+    }
+
+
+def test_render_types_count_distinct_tags():
+    df = pd.DataFrame(
+        {
+            "many": [f"tag{i}|common" for i in range(200)],
+            "some": [f"tag{i % 50}" for i in range(200)],
+            "few": [f"tag{i % 5}" for i in range(200)],
+        }
+    )
+
+    render_types = calculate_render_type(df, calculate_attr_types(df))
+
+    assert render_types == {
+        "many": "tag-cloud",
+        "some": "wide-tag-cloud",
+        "few": "horizontal-bars",
+    }
+
+
+def test_sampled_inference_escalates_ambiguous_columns():
+    n = 50000
+    sparse = np.array([f"tag{i % 20}" for i in range(n)], dtype=object)
+    sparse[:30] = [f"unique{i}" for i in range(30)]
+    df = pd.DataFrame(
+        {
+            "score": np.linspace(0, 1, n),
+            "category": [f"tag{i % 5}" for i in range(n)],
+            "label": [f"Node {i}" for i in range(n)],
+            "sparse": sparse,
+        }
+    )
+
+    sampled = infer_attributes(df, "sample", sample_size=1000)
+    full = infer_attributes(df)
+
+    for column in ["score", "category", "label"]:
+        assert sampled[column]["attrType"] == full[column]["attrType"]
+        assert sampled[column]["renderType"] == full[column]["renderType"]
+        assert not sampled[column]["escalated"]
+        assert sampled[column]["sample_size"] == 1000
+    # the sample sees too many tags once, so the column is scanned
+    assert sampled["sparse"]["escalated"]
+    assert sampled["sparse"]["renderType"] == "wide-tag-cloud"
+    assert sampled["category"]["confidence"] > 0.99
+    assert full["label"]["confidence"] == 1.0
+
+
+def test_sampled_inference_finds_rare_list_values():
+    n = 100000
+    tags = np.array([f"tag{i % 5}" for i in range(n)], dtype=object)
+    df = pd.DataFrame({"tags": tags})
+    # fewer than 1% of the rows are lists, and the sample misses all of them
+    sampled_rows = set(stratified_sample(df, 1000).index)
+    missed = [i for i in range(n) if i not in sampled_rows][n // 2 :]
+    df.loc[missed[:50], "tags"] = "tag1|tag2"
+
+    sampled = infer_attributes(df, "sample", sample_size=1000)
+
+    assert sampled["tags"]["attrType"] == "liststring"
+    assert (
+        sampled["tags"]["attrType"] == infer_attributes(df)["tags"]["attrType"]
+    )
+
+
+def test_distinct_tags_stop_at_the_limit():
+    words = pd.Series([f"word{i}|word{i + 1}" for i in range(100000)])
+
+    # the count stops within the first chunk of cells
+    assert 100 < count_distinct_tags(words, 100) < 1000
+    assert count_distinct_tags(words[:30]) == 31
+    assert count_distinct_tags(words) == 100001
+
+
+def test_parallel_inference_matches_the_serial_inference():
+    df = pd.DataFrame(
+        {
+            "year": [1990, 2000, 2010, 2020],
+            "score": [0.5, np.nan, 1.5, 2.5],
+            "tags": ["a", None, "b|c", "d"],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+
+    serial = infer_attributes(df)
+
+    assert infer_attributes(df, workers=2) == serial
+    assert infer_attributes(df, workers=2, backend="process") == serial
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from py2mappr._attributes.profile import FrameProfile
+from py2mappr._attributes.utils import (
+    find_node_color_attr,
+    find_node_label_attr,
+)
+
+
+def test_set_frame_keeps_the_statistics_of_unchanged_columns():
+    df = pd.DataFrame(
+        {"a": [1, 2, 2], "b": ["x", None, "y"], "c": [0.5, np.nan, 1.0]}
+    )
+    profile = FrameProfile(df)
+
+    assert find_node_color_attr(df, profile) == "a"
+    assert profile["b"].null_count == 1
+
+    df["b"] = ["x", "y", "z"]
+    df["d"] = [1, 1, 1]
+    dropped = profile.set_frame(df)
+
+    assert dropped == ["b"]
+    assert profile["a"].is_profiled and profile["c"].is_profiled
+    assert profile["b"].null_count == 0
+    assert find_node_color_attr(df, profile) == "d"
+
+
+def test_memoized_results_last_until_the_columns_change():
+    df = pd.DataFrame({"name": ["a", None], "title": ["b", "c"]})
+    profile = FrameProfile(df)
+
+    assert find_node_label_attr(df, profile) == "title"
+    assert profile.memo(("find_node_label_attr",), lambda: "other") == "title"
+
+    profile.set_frame(df.copy())
+    assert profile.memo(("find_node_label_attr",), lambda: "other") == "title"
+
+    df = df.assign(name=["a", "b"], title=[None, "c"])
+    profile.set_frame(df)
+    assert find_node_label_attr(df, profile) == "name"
+
+
+def test_memoized_results_are_dropped_unless_the_columns_are_verified():
+    df = pd.DataFrame({"v": pd.array([1, None], "Int64"), "w": [1, 2]})
+    profile = FrameProfile(df)
+    profile.memo("key", lambda: "first")
+
+    profile.set_frame(df.copy())
+    assert profile.memo("key", lambda: "second") == "first"
+
+    profile.set_frame(df.assign(v=pd.array([2, None], "Int64")))
+    assert profile.memo("key", lambda: "second") == "second"
+
+    # the same data frame modified in place cannot be verified
+    profile.df["w"] = [3, 4]
+    profile.set_frame(profile.df)
+    assert profile.memo("key", lambda: "third") == "third"
@@ -41,3 +41,37 @@ def test_string_default_not_converted_from_md():
 
     expected = "This is a **test**."
     assert expected == result[0]["attr"]["description"]
+
+
+def test_liststring_and_missing_values():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "tags": ["a | b", None],
+            "score": [0.5, float("nan")],
+        }
+    )
+    dpAttribTypes = {"id": "integer", "tags": "liststring", "score": "float"}
+    dpRenderTypes = {
+        "id": "histogram",
+        "tags": "tag-cloud",
+        "score": "histogram",
+    }
+
+    result = build_datapoints(df, dpAttribTypes, dpRenderTypes)
+
+    assert result[0] == {
+        "id": "1",
+        "attr": {"id": 1, "tags": ["a", "b"], "score": 0.5},
+    }
+    assert result[1] == {"id": "2", "attr": {"id": 2, "tags": "", "score": ""}}
+
+
+def test_excluded_attrs_not_converted_from_md():
+    df = pd.DataFrame({"id": ["test"], "label": ["**label**"]})
+    dpAttribTypes = {"id": "string", "label": "string"}
+    dpRenderTypes = {"id": "default", "label": "text"}
+
+    result = build_datapoints(df, dpAttribTypes, dpRenderTypes, ["label"])
+
+    assert "**label**" == result[0]["attr"]["label"]
@@ -0,0 +1,178 @@
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py2mappr._builder.build_network import build_links, build_nodes
+
+
+def _baseline_build_links(
+    df_links: pd.DataFrame, attr_map: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    # the links built row by row, before the column-wise builder
+    links = []
+    for idx, link in df_links.iterrows():
+        attrs = dict(link)
+        source_key = next(
+            k for k in ["source", "Source", "from", "From"] if k in attrs
+        )
+        target_key = next(
+            k for k in ["target", "Target", "to", "To"] if k in attrs
+        )
+        links.append(
+            {
+                "id": f"{idx}",
+                "source": f"{int(attrs[source_key])}",
+                "target": f"{int(attrs[target_key])}",
+                "isDirectional": attrs.get(
+                    attr_map.get("isDirectional", ""), False
+                ),
+                "attr": {
+                    "OriginalLabel": f"{idx}",
+                    **{
+                        key: value
+                        for key, value in attrs.items()
+                        if key.lower()
+                        not in ["id", "source", "target", "isdirectional"]
+                    },
+                },
+            }
+        )
+    return links
+
+
+def _baseline_build_nodes(
+    df_datapoints: pd.DataFrame, attr_map: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    # the nodes built row by row, before the column-wise builder
+    return [
+        {
+            "dataPointId": f'{node["id"]}',
+            "id": f'{node["id"]}',
+            "attr": {
+                "OriginalLabel": node.get("label")
+                or node.get("id")
+                or node.get("OriginalLabel")
+                or "Node",
+                "OriginalX": node.get(attr_map.get("OriginalX", ""), 0),
+                "OriginalY": node.get(attr_map.get("OriginalY", ""), 0),
+            },
+        }
+        for _, node in df_datapoints.iterrows()
+    ]
+
+
+def _assert_same_nodes(df_datapoints: pd.DataFrame, attr_map: Dict[str, str]):
+    assert json.dumps(build_nodes(df_datapoints, attr_map)) == json.dumps(
+        _baseline_build_nodes(df_datapoints, attr_map)
+    )
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        ["a", "", None, np.nan, "e", "f"],
+        [1.5, 0.0, np.nan, 0.0, 2.0, 0.0],
+        [1, 0, 0, 0, 2, 0],
+        [True, False, False, True, False, False],
+    ],
+)
+def test_nodes_match_the_row_by_row_nodes(labels):
+    df_datapoints = pd.DataFrame(
+        {
+            "id": [1, 0, 0, 3, 0, 5],
+            "label": labels,
+            "OriginalLabel": ["o1", "o2", "", "o4", None, "o6"],
+            "x": [0.5, 1.0, np.nan, 2.0, 3.0, 4.0],
+            "y": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    coordinates = {"OriginalX": "x", "OriginalY": "y"}
+
+    _assert_same_nodes(df_datapoints, {})
+    _assert_same_nodes(df_datapoints, coordinates)
+    _assert_same_nodes(df_datapoints, {"OriginalX": "missing"})
+    _assert_same_nodes(df_datapoints.drop(columns=["label"]), coordinates)
+    _assert_same_nodes(
+        df_datapoints.drop(columns=["label", "OriginalLabel"]), {}
+    )
+    _assert_same_nodes(df_datapoints[["id", "x", "y"]], coordinates)
+
+
+def test_node_ids_and_titles_of_string_ids():
+    df_datapoints = pd.DataFrame({"id": ["a", "", "c"], "name": [1, 2, 3]})
+
+    nodes = build_nodes(df_datapoints, {})
+
+    _assert_same_nodes(df_datapoints, {})
+    assert [node["attr"]["OriginalLabel"] for node in nodes] == [
+        "a",
+        "Node",
+        "c",
+    ]
+
+
+def _assert_same_links(df_links: pd.DataFrame, attr_map: Dict[str, str]):
+    assert json.dumps(build_links(df_links, attr_map)) == json.dumps(
+        _baseline_build_links(df_links, attr_map)
+    )
+
+
+@pytest.mark.parametrize(
+    "sources",
+    [
+        [0, 1, 2],
+        ["0", "1", "2"],
+        [0.0, 1.5, 2.0],
+        np.array([0, 2**63, 2**64 - 1], dtype=np.uint64),
+        [0.0, 1e19, 2.0],
+    ],
+)
+def test_links_match_the_row_by_row_links(sources):
+    df_links = pd.DataFrame(
+        {
+            "source": sources,
+            "target": [1, 2, 0],
+            "weight": [0.5, np.nan, 2.0],
+            "kind": ["a", None, "b"],
+            "directed": [True, False, True],
+        },
+        index=[10, 11, 12],
+    )
+
+    _assert_same_links(df_links, {})
+    _assert_same_links(df_links, {"isDirectional": "directed"})
+    _assert_same_links(df_links[["source", "target"]], {})
+    _assert_same_links(df_links[["source", "target", "weight"]], {})
+
+
+def test_unsigned_ids_beyond_the_int64_range():
+    ids = np.array([0, 2**63, 2**64 - 1], dtype=np.uint64)
+    df_links = pd.DataFrame({"source": ids, "target": ids[::-1]})
+
+    _assert_same_links(df_links, {})
+    assert build_links(df_links, {})[2]["source"] == f"{2**64 - 1}"
+
+
+def test_duplicated_columns_are_rejected():
+    df_links = pd.DataFrame(
+        [[0, 1, "a", "b"], [1, 0, "c", "d"]],
+        columns=["source", "target", "kind", "kind"],
+    )
+
+    # the row by row links failed on the series of the duplicated values
+    with pytest.raises(TypeError):
+        json.dumps(_baseline_build_links(df_links, {}))
+    with pytest.raises(ValueError, match="Duplicated: \\['kind'\\]"):
+        build_links(df_links, {})
+
+
+def test_nan_link_ends_fail_like_the_row_by_row_links():
+    df_links = pd.DataFrame({"source": [0, np.nan], "target": [1, 0]})
+
+    with pytest.raises(ValueError):
+        _baseline_build_links(df_links, {})
+    with pytest.raises(ValueError):
+        build_links(df_links, {})
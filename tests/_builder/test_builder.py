@@ -0,0 +1,122 @@
+import json
+
+import pandas as pd
+import pytest
+
+import py2mappr._builder.builder as builder
+from py2mappr._builder._manifest import MANIFEST_FILE, load_manifest
+from py2mappr._builder.builder import build_map
+from py2mappr._core.project import OpenmapprProject
+from py2mappr._layout.clustered import ClusteredLayout
+from py2mappr._validation.results import get_validation_results
+
+
+@pytest.fixture
+def project():
+    nodes = pd.DataFrame(
+        {
+            "id": [0, 1, 2],
+            "label": ["a", "b", "c"],
+            "group": ["x", "x", "y"],
+        }
+    )
+    links = pd.DataFrame({"source": [0, 1], "target": [1, 2]})
+    project = OpenmapprProject(nodes, links)
+    project.snapshots = [ClusteredLayout(project)]
+    return project
+
+
+def test_incremental_build_skips_the_unchanged_stages(project, tmp_path):
+    build_map(project, tmp_path, incremental=True)
+    written = {
+        name: (tmp_path / "data" / name).stat().st_mtime_ns
+        for name in ["nodes.json", "links.json"]
+    }
+
+    build_map(project, tmp_path, incremental=True)
+    assert get_validation_results()["skipped"] == ["links", "settings"]
+    for name, mtime in written.items():
+        assert (tmp_path / "data" / name).stat().st_mtime_ns == mtime
+
+    project.set_network(pd.DataFrame({"source": [0], "target": [2]}))
+    build_map(project, tmp_path, incremental=True)
+
+    assert get_validation_results()["skipped"] == []
+    with open(tmp_path / "data" / "links.json", "r") as f:
+        assert len(json.load(f)) == 1
+    assert set(load_manifest(tmp_path)) == {
+        "nodes",
+        "links",
+        "settings",
+        "index",
+    }
+
+
+def test_failed_stage_is_dropped_from_the_manifest(
+    project, tmp_path, monkeypatch
+):
+    build_map(project, tmp_path, incremental=True)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(builder, "__write_network_file", fail)
+    project.set_network(pd.DataFrame({"source": [0], "target": [2]}))
+    with pytest.raises(RuntimeError):
+        build_map(project, tmp_path, incremental=True)
+
+    with open(tmp_path / MANIFEST_FILE, "r") as f:
+        assert "links" not in json.load(f)
+
+
+def test_missing_shards_and_copies_are_rebuilt(project, tmp_path):
+    options = {"shard_size": 2, "precompress": ["gzip"], "incremental": True}
+    build_map(project, tmp_path, **options)
+    (tmp_path / "data" / "links.json.gz").unlink()
+    (tmp_path / "data" / "nodes" / "00001.json").unlink()
+
+    build_map(project, tmp_path, **options)
+
+    assert get_validation_results()["skipped"] == ["settings"]
+    assert (tmp_path / "data" / "links.json.gz").exists()
+    assert (tmp_path / "data" / "nodes" / "00001.json").exists()
+    assert "data/nodes/00001.json.gz" in (
+        load_manifest(tmp_path)["nodes"]["files"]
+    )
+
+
+def test_only_incremental_builds_fingerprint_the_inputs(
+    project, tmp_path, monkeypatch
+):
+    build_map(project, tmp_path, incremental=True)
+    calls = []
+    monkeypatch.setattr(
+        builder, "hash_frame", lambda df: calls.append(1) or "hash"
+    )
+
+    build_map(project, tmp_path)
+
+    assert calls == []
+    assert not (tmp_path / MANIFEST_FILE).exists()
+
+
+def test_node_ids_are_indexed_once_per_build(project, tmp_path, monkeypatch):
+    calls = []
+    node_ids = builder.node_ids
+    monkeypatch.setattr(
+        builder, "node_ids", lambda df: calls.append(1) or node_ids(df)
+    )
+
+    build_map(project, tmp_path)
+
+    assert len(calls) == 1
+
+
+def test_invalid_shard_size_fails_before_writing(project, tmp_path):
+    build_map(project, tmp_path, shard_size=2)
+    written = sorted(tmp_path.rglob("*"))
+
+    with pytest.raises(ValueError):
+        build_map(project, tmp_path, shard_size=0)
+
+    assert sorted(tmp_path.rglob("*")) == written
@@ -0,0 +1,32 @@
+import gzip
+
+import pytest
+
+from py2mappr._builder._compress import check_compression, write_precompressed
+
+
+def test_write_precompressed_gzip(tmp_path):
+    path = tmp_path / "nodes.json"
+    path.write_text('{"datapoints":[]}')
+
+    write_precompressed(path, ["gzip"])
+
+    assert (
+        gzip.decompress((tmp_path / "nodes.json.gz").read_bytes())
+        == path.read_bytes()
+    )
+
+
+def test_write_precompressed_removes_stale_copies(tmp_path):
+    path = tmp_path / "nodes.json"
+    path.write_text("{}")
+    write_precompressed(path, ["gzip"])
+
+    write_precompressed(path, [])
+
+    assert not (tmp_path / "nodes.json.gz").exists()
+
+
+def test_check_compression_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        check_compression(["zip"])
@@ -0,0 +1,44 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py2mappr._builder._encoder import (
+    OrjsonEncoder,
+    StdlibJsonEncoder,
+    get_encoder,
+    orjson,
+)
+
+document = {
+    "id": np.int64(3),
+    "weight": np.float64(0.5),
+    "flags": np.array([1, 2]),
+    "date": pd.Timestamp("2020-01-02"),
+    "nested": [{"a": [1, {}]}, []],
+}
+
+
+def test_stdlib_encoder_serializes_numpy_and_datetimes():
+    encoded = StdlibJsonEncoder(indent=4).encode(document)
+
+    assert json.loads(encoded)["date"] == "2020-01-02T00:00:00"
+    assert json.loads(encoded)["flags"] == [1, 2]
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_orjson_encoder_matches_stdlib(indent):
+    separators = (",", ":") if indent is None else None
+
+    expected = StdlibJsonEncoder(indent, separators).encode(document)
+
+    assert OrjsonEncoder(indent).encode(document) == expected
+
+
+def test_get_encoder_falls_back_to_stdlib():
+    # orjson is opt-in, its output differs from the standard library
+    assert isinstance(get_encoder(), StdlibJsonEncoder)
+    assert isinstance(get_encoder(backend="json"), StdlibJsonEncoder)
+    assert isinstance(get_encoder(4, (", ", ": ")), StdlibJsonEncoder)
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from py2mappr._builder._manifest import (
+    fingerprint,
+    hash_frame,
+    is_stage_unchanged,
+    load_manifest,
+    save_manifest,
+    stage_files,
+)
+
+
+def test_hash_frame_tracks_values_and_columns():
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    assert hash_frame(df) == hash_frame(df.copy())
+    assert hash_frame(df) != hash_frame(df.assign(name=["a", "c"]))
+    assert hash_frame(df) != hash_frame(df.rename(columns={"name": "title"}))
+
+
+def test_fingerprint_is_none_for_unhashable_frames():
+    df = pd.DataFrame({"id": [1], "tags": [["a", "b"]]})
+
+    assert hash_frame(df) is None
+    assert fingerprint("abc", hash_frame(df)) is None
+
+
+def test_manifest_round_trip(tmp_path):
+    assert load_manifest(tmp_path) == {}
+
+    save_manifest(tmp_path, {"nodes": {"fingerprint": "abc", "files": []}})
+
+    assert load_manifest(tmp_path) == {
+        "nodes": {"fingerprint": "abc", "files": []}
+    }
+
+
+def test_manifests_of_older_versions_are_dropped(tmp_path):
+    save_manifest(tmp_path, {"nodes": "abc"})
+
+    assert load_manifest(tmp_path) == {}
+
+
+def test_stage_is_changed_when_a_written_file_is_missing(tmp_path):
+    (tmp_path / "nodes.json").write_text("{}")
+    (tmp_path / "nodes").mkdir()
+    (tmp_path / "nodes" / "00000.json").write_text("[]")
+    manifest = {
+        "nodes": {
+            "fingerprint": "abc",
+            "files": stage_files(
+                tmp_path,
+                tmp_path / "nodes.json",
+                tmp_path / "nodes.json.gz",
+                tmp_path / "nodes",
+            ),
+        }
+    }
+
+    assert manifest["nodes"]["files"] == ["nodes.json", "nodes/00000.json"]
+    assert is_stage_unchanged(tmp_path, manifest, "nodes", "abc")
+    assert not is_stage_unchanged(tmp_path, manifest, "nodes", "def")
+
+    (tmp_path / "nodes" / "00000.json").unlink()
+
+    assert not is_stage_unchanged(tmp_path, manifest, "nodes", "abc")
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+
+import py2mappr._builder._profiler as _profiler
+from py2mappr._builder._profiler import (
+    profile_stage,
+    profile_stream,
+    start_profiler,
+    stop_profiler,
+)
+from py2mappr._builder._stream import RecordStream
+
+
+def test_nested_stages_are_excluded_from_the_parent(tmp_path):
+    profiler = start_profiler(tmp_path, tmp_path / "report.json")
+    try:
+        with profile_stage("settings"):
+            with profile_stage("validation"):
+                time.sleep(0.05)
+        profiler.save()
+    finally:
+        stop_profiler()
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    stages = {stage["stage"]: stage for stage in report["stages"]}
+
+    assert stages["validation"]["wall_time"] >= 0.05
+    assert stages["settings"]["wall_time"] < 0.05
+    assert report["wall_time"] >= 0.05
+
+
+def test_stream_records_are_timed_per_stage(tmp_path, monkeypatch):
+    def slow_records():
+        for i in range(3):
+            time.sleep(0.01)
+            yield {"id": i}
+
+    monkeypatch.setattr(_profiler, "PROFILE_BATCH_SIZE", 2)
+    profiler = start_profiler(tmp_path)
+    try:
+        stream = profile_stream(RecordStream(slow_records, 3), "nodes")
+        with profile_stage("links"):
+            records = list(stream)
+    finally:
+        stop_profiler()
+
+    stages = {stage["stage"]: stage for stage in profiler.report()["stages"]}
+
+    assert records == [{"id": 0}, {"id": 1}, {"id": 2}]
+    # the records are timed in batches of two
+    assert stages["nodes"]["calls"] == 2
+    assert stages["nodes"]["wall_time"] >= 0.03
+    assert stages["links"]["wall_time"] < 0.03
+
+
+def test_profiling_is_a_noop_when_inactive():
+    stream = RecordStream(lambda: iter([{"id": 0}]), 1)
+
+    with profile_stage("nodes"):
+        pass
+
+    assert profile_stream(stream, "nodes") is stream
+
+
+def test_later_stages_report_their_own_rss_change(tmp_path):
+    if not os.path.exists("/proc/self/statm"):
+        pytest.skip("the current RSS is only read on linux")
+
+    profiler = start_profiler(tmp_path)
+    try:
+        with profile_stage("heavy"):
+            heavy = np.ones(64 * 1024 * 1024, dtype=np.uint8)
+        del heavy
+        with profile_stage("light"):
+            light = np.ones(16 * 1024 * 1024, dtype=np.uint8)
+    finally:
+        stop_profiler()
+
+    stages = {stage["stage"]: stage for stage in profiler.report()["stages"]}
+
+    assert light.sum() > 0
+    assert stages["heavy"]["rss_delta"] >= 32 * 1024 * 1024
+    assert stages["light"]["rss_delta"] >= 8 * 1024 * 1024
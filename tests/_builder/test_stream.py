@@ -0,0 +1,117 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+import py2mappr._builder._stream as stream_module
+from py2mappr._builder._stream import RecordStream, dump_json, write_shards
+from py2mappr._builder.build_dataset import build_datapoints
+from py2mappr._builder.build_network import build_links, build_nodes
+
+
+def _records():
+    return RecordStream(
+        lambda: (
+            {"id": f"{idx}", "attr": {"tags": ["a", "b"]}} for idx in range(3)
+        ),
+        3,
+    )
+
+
+def test_dump_json_matches_json_dump():
+    data = [
+        {
+            "id": "",
+            "networkInfo": {},
+            "nodes": _records(),
+            "links": RecordStream(lambda: iter([]), 0),
+        }
+    ]
+    expected = [
+        {"id": "", "networkInfo": {}, "nodes": list(_records()), "links": []}
+    ]
+
+    for indent in [4, None]:
+        out = io.StringIO()
+        dump_json(data, out, indent=indent, backend="json")
+
+        assert out.getvalue() == json.dumps(expected, indent=indent)
+
+
+def test_stream_records_are_not_searched_for_streams(monkeypatch):
+    searched = []
+    has_stream = stream_module._has_stream
+    monkeypatch.setattr(
+        stream_module,
+        "_has_stream",
+        lambda obj: searched.append(obj) or has_stream(obj),
+    )
+
+    dump_json({"nodes": _records()}, io.StringIO(), backend="json")
+
+    # only the document and its stream are searched, not the records
+    assert len(searched) == 2
+    assert isinstance(searched[1], RecordStream)
+
+
+def test_record_stream_is_reiterable():
+    records = _records()
+
+    assert len(records) == 3
+    assert list(records) == list(records)
+
+
+def test_write_shards(tmp_path):
+    records = RecordStream(lambda: ({"id": f"{idx}"} for idx in range(5)), 5)
+
+    manifest = write_shards(records, tmp_path, "nodes", 2, backend="json")
+
+    assert manifest["count"] == 5
+    assert [shard["count"] for shard in manifest["shards"]] == [2, 2, 1]
+    assert [shard["offset"] for shard in manifest["shards"]] == [0, 2, 4]
+    last = manifest["shards"][-1]
+    assert json.loads((tmp_path / last["file"]).read_text()) == [{"id": "4"}]
+    assert last["bytes"] == (tmp_path / last["file"]).stat().st_size
+
+
+def test_write_shards_removes_previous_shards(tmp_path):
+    write_shards([{"id": "0"}], tmp_path, "nodes", 1)
+
+    assert write_shards([{"id": "0"}], tmp_path, "nodes") is None
+    assert not (tmp_path / "nodes").exists()
+
+
+def test_invalid_shard_size_keeps_the_previous_shards(tmp_path):
+    write_shards([{"id": "0"}], tmp_path, "nodes", 1)
+
+    with pytest.raises(ValueError):
+        write_shards([{"id": "0"}], tmp_path, "nodes", 0)
+
+    assert (tmp_path / "nodes" / "00000.json").exists()
+
+
+def test_chunked_streams_build_the_same_records(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "id": range(5),
+            "source": [0, 1, 2, 3, 4],
+            "target": [1, 2, 3, 4, 0],
+            "label": ["a", "", None, "d", "e"],
+            "text": ["**a**", "b", None, "d", "e"],
+        }
+    )
+    types = {key: "string" for key in df.columns}
+    render_types = {**{key: "default" for key in df.columns}, "text": "text"}
+
+    def build():
+        return (
+            build_datapoints(df, types, render_types),
+            build_nodes(df, {}),
+            build_links(df, {}),
+        )
+
+    expected = build()
+    monkeypatch.setattr(stream_module, "STREAM_CHUNK_SIZE", 2)
+
+    assert build() == expected
@@ -0,0 +1,54 @@
+from py2mappr._builder import _utils
+from py2mappr._builder._utils import (
+    load_md_cache,
+    md_to_html,
+    md_to_html_many,
+    save_md_cache,
+)
+
+
+def test_md_to_html_many_renders_distinct_values_once(monkeypatch):
+    rendered = []
+    convert = _utils._get_md_renderer().convert
+
+    def counting_convert(md):
+        rendered.append(md)
+        return convert(md)
+
+    _utils._md_cache.clear()
+    monkeypatch.setattr(_utils._get_md_renderer(), "convert", counting_convert)
+
+    result = md_to_html_many(["**a**", "**a**", None, "b"])
+
+    assert result == [
+        "<p><strong>a</strong></p>",
+        "<p><strong>a</strong></p>",
+        "",
+        "<p>b</p>",
+    ]
+    assert rendered == ["**a**", "b"]
+
+
+def test_md_cache_is_restored_from_disk(tmp_path):
+    _utils._md_cache.clear()
+    md_to_html("*cached*")
+    save_md_cache(tmp_path)
+
+    _utils._md_cache.clear()
+    load_md_cache(tmp_path)
+
+    assert (
+        _utils._md_cache[_utils._md_hash("*cached*")]
+        == "<p><em>cached</em></p>"
+    )
+
+
+def test_md_to_html_many_in_process_pool(monkeypatch):
+    _utils._md_cache.clear()
+    monkeypatch.setattr(_utils, "MD_PARALLEL_THRESHOLD", 0)
+    values = [f"**{idx % 7}**" for idx in range(50)] + [None]
+
+    result = md_to_html_many(values, workers=2)
+
+    assert result == [md_to_html(val) for val in values]
+    assert len(_utils._md_cache) == 7
@@ -0,0 +1,144 @@
+import json
+
+import pandas as pd
+import pytest
+
+from py2mappr._builder.build_dataset import build_attr_descriptor
+from py2mappr._core.config import default_attr_config
+from py2mappr._core.project import OpenmapprProject
+from py2mappr._layout.clustered import ClusteredLayout
+
+
+def test_layouts_and_network_attributes_are_recalculated_lazily():
+    nodes = pd.DataFrame({"id": [0, 1], "label": ["a", "b"], "size": [1, 2]})
+    links = pd.DataFrame({"source": [0], "target": [1], "weight": [0.5]})
+    project = OpenmapprProject(nodes)
+    project.snapshots = []
+    layout = ClusteredLayout(project)
+    project.snapshots.append(layout)
+
+    calls = []
+    calculate_layout = layout.calculate_layout
+    layout.calculate_layout = lambda p: calls.append(calculate_layout(p))
+
+    project.set_data(nodes.assign(title=["c", None]))
+    project.set_network(links)
+
+    assert calls == []
+    assert project._network_attributes is None
+
+    assert layout.settings["edgeSizeAttr"] == "weight"
+    assert layout.settings["labelAttr"] == "label"
+    assert len(calls) == 1
+    assert project.network_attributes["weight"]["attrType"] == "float"
+
+
+def test_set_data_only_infers_new_and_changed_columns():
+    nodes = pd.DataFrame(
+        {"id": [0, 1], "tags": ["a", "b"], "kind": ["x", "y"]}
+    )
+    project = OpenmapprProject(nodes)
+    project.snapshots = []
+    project.update_attributes(attr_descriptions={"tags": "The tags"})
+    project.attributes["kind"]["renderType"] = "text"
+
+    project.set_data(
+        nodes.assign(tags=["a|b", "c"], kind=["z", "y"], score=[0.5, 1.5])
+    )
+
+    assert list(project.attributes) == ["id", "tags", "kind", "score"]
+    assert project.attributes["tags"]["attrType"] == "liststring"
+    assert project.attributes["tags"]["tooltip"] == "The tags"
+    # the changed render type is kept
+    assert project.attributes["kind"]["renderType"] == "text"
+    assert project.attributes["score"]["attrType"] == "float"
+    assert project.attribute_inference["score"]["attrType"] == "float"
+
+
+def test_attributes_store_only_the_overridden_fields():
+    nodes = pd.DataFrame({"id": [0, 1], "year": [1990, 2000]})
+    project = OpenmapprProject(nodes)
+    attribute = project.attributes["year"]
+
+    attribute["visible"] = False
+    attribute["metadata"]["descr"] = "The year"
+
+    assert set(attribute.overrides) == {
+        "id",
+        "title",
+        "attrType",
+        "renderType",
+        "visible",
+        "metadata",
+    }
+    assert default_attr_config["metadata"]["descr"] == ""
+    assert build_attr_descriptor("year", attribute) == {
+        **default_attr_config,
+        "id": "year",
+        "title": "year",
+        "attrType": "year",
+        "renderType": "histogram",
+        "visible": False,
+        "metadata": {"descr": "The year", "maxLabel": "", "minLabel": ""},
+    }
+    assert json.dumps(attribute.to_dict()) == json.dumps(dict(attribute))
+
+
+def test_attribute_descriptors_never_share_the_default_metadata():
+    descriptor = build_attr_descriptor("year", None)
+    descriptor["metadata"]["descr"] = "The year"
+
+    assert default_attr_config["metadata"]["descr"] == ""
+    assert build_attr_descriptor("year", None)["metadata"]["descr"] == ""
+
+
+def test_set_data_infers_the_changed_extension_dtype_columns_again():
+    nodes = pd.DataFrame(
+        {"id": range(400), "v": pd.array([1, 2, 3, None] * 100, "Int64")}
+    )
+    project = OpenmapprProject(nodes)
+    assert project.attributes["v"]["renderType"] == "horizontal-bars"
+
+    nodes = nodes.assign(v=pd.array([*range(399), None], "Int64"))
+    project.set_data(nodes)
+
+    assert project.attributes["v"]["renderType"] == "tag-cloud"
+    assert project.profile["v"].is_unchanged(nodes["v"])
+    assert not project.profile["v"].is_unchanged(nodes["v"] + 1)
+
+
+def test_attribute_dicts_never_share_the_default_metadata():
+    nodes = pd.DataFrame({"id": [0, 1], "year": [1990, 2000]})
+    project = OpenmapprProject(nodes)
+    attribute = project.attributes["year"]
+
+    attribute.to_dict()["metadata"]["descr"] = "The year"
+    dict(attribute.items())["metadata"]["maxLabel"] = "2000"
+    for value in attribute.values():
+        if isinstance(value, dict):
+            value["minLabel"] = "1990"
+
+    assert default_attr_config["metadata"] == {
+        "descr": "",
+        "maxLabel": "",
+        "minLabel": "",
+    }
+    assert project.attributes["id"]["metadata"]["descr"] == ""
+
+
+def test_attribute_fields_are_reset_to_their_defaults():
+    nodes = pd.DataFrame({"id": [0, 1], "year": [1990, 2000]})
+    attribute = OpenmapprProject(nodes).attributes["year"]
+    attribute["visible"] = False
+
+    assert attribute.pop("visible") is False
+    assert attribute["visible"] is True
+    assert attribute.pop("tooltip") == ""
+    assert attribute.pop("missing", None) is None
+
+    attribute.clear()
+
+    assert attribute.overrides == {}
+    with pytest.raises(KeyError):
+        attribute.popitem()
+    assert attribute.to_dict() == default_attr_config
@@ -0,0 +1,55 @@
+import pytest
+
+import py2mappr._validation.results as results_module
+from py2mappr._validation.node_index import NodeIndex
+from py2mappr._validation.results import (
+    check_validation_level,
+    sample_confidence,
+    start_validation,
+)
+from py2mappr._validation.validate_links import validate_link_ends
+
+
+@pytest.fixture(autouse=True)
+def reset_results(monkeypatch):
+    monkeypatch.setattr(results_module, "_results", None)
+
+
+def test_collects_checks_and_issues():
+    results = start_validation("full")
+    index = NodeIndex(["1", "2"])
+
+    validate_link_ends(["0", "1"], ["1", "1"], ["2", "9"], index)
+
+    assert [check["check"] for check in results["checks"]] == [
+        "node_ids",
+        "source_target",
+    ]
+    assert results["issues"][0]["check"] == "source_target"
+    assert results["issues"][0]["details"]["links"] == [
+        {"id": "1", "source": "1", "target": "9"}
+    ]
+
+
+def test_sampled_link_validation_estimates_the_count():
+    results = start_validation("fast")
+    n = 10000
+    ids = [f"{i}" for i in range(n)]
+    # every other link points to a missing node
+    targets = [f"{i}" if i % 2 else "missing" for i in range(n)]
+
+    invalid = validate_link_ends(ids, ids, targets, NodeIndex(ids), 1000)
+
+    check = results["checks"][-1]
+    assert check["sampled"] and check["sample_size"] == 1000
+    assert check["confidence"] > 0.99
+    assert 0 < len(invalid) < 1000
+    assert abs(results["issues"][0]["details"]["count"] - n // 2) < 1000
+
+
+def test_sample_confidence_and_levels():
+    assert sample_confidence(100, 100) == 1.0
+    assert sample_confidence(10, 100000) < sample_confidence(1000, 100000)
+
+    with pytest.raises(ValueError):
+        check_validation_level("quick")
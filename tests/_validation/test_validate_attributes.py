@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from py2mappr._validation.coverage import AttributeCoverage
+from py2mappr._validation.validate_attributes import validate_node_attributes
+
+
+def test_coverage_counts_rows_missing_any_attribute():
+    df = pd.DataFrame(
+        {"x": [1.0, np.nan, 3.0, 4.0], "y": [1.0, 2.0, None, 4.0]}
+    )
+    coverage = AttributeCoverage(df)
+
+    assert coverage.count_missing(["x"]) == 1
+    assert coverage.count_missing(["x", "y"]) == 2
+    assert coverage.count_missing(["z"]) == 4
+    assert coverage.missing("x") is coverage.missing("x")
+
+
+def test_warns_with_the_coverage_of_the_data_frame(capsys):
+    coverage = AttributeCoverage(pd.DataFrame({"x": [1.0, np.nan]}))
+
+    validate_node_attributes("Layout", ["x"], coverage)
+    validate_node_attributes("Layout", ["z"], coverage)
+
+    output = capsys.readouterr().out
+    assert "1 datapoints are missing one of ['x'] attributes." in output
+    assert "Layout: Attributes ['z'] are missing for all datapoints." in output
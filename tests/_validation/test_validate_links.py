@@ -0,0 +1,35 @@
+from py2mappr._validation.node_index import NodeIndex
+from py2mappr._validation.validate_links import validate_source_target
+
+
+def test_reports_offending_links_and_duplicate_ids(capsys):
+    datapoints = [{"id": "1"}, {"id": "2"}, {"id": "2"}]
+    links = [
+        {"id": "0", "source": "1", "target": "2"},
+        {"id": "1", "source": "1", "target": "9"},
+        {"id": "2", "source": "7", "target": "2"},
+    ]
+
+    invalid = validate_source_target(links, datapoints)
+
+    assert invalid == [
+        {"id": "1", "source": "1", "target": "9"},
+        {"id": "2", "source": "7", "target": "2"},
+    ]
+    output = capsys.readouterr().out
+    assert "1 node ids are duplicated: 2." in output
+    assert "2 links have invalid source or target." in output
+    assert "1 (1 -> 9), 2 (7 -> 2)" in output
+
+
+def test_accepts_a_shared_node_index():
+    index = NodeIndex(["1", "2"])
+
+    assert len(index) == 2
+    assert "1" in index
+    assert (
+        validate_source_target(
+            [{"id": "0", "source": "1", "target": "2"}], index
+        )
+        == []
+    )
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import py2mappr._validation.validate_settings as validate_settings_module
+from py2mappr._validation.results import (
+    get_validation_results,
+    start_validation,
+)
+from py2mappr._validation.validate_settings import (
+    get_settings_validator,
+    load_settings_schema,
+    refresh_settings_schema,
+    validate_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def schema_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PY2MAPPR_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(validate_settings_module, "_validator", None)
+    monkeypatch.setattr(validate_settings_module, "_cache_dir", None)
+    return tmp_path
+
+
+def _serve_schema(monkeypatch, schema):
+    class Response:
+        def json(self):
+            return schema
+
+    monkeypatch.setattr(
+        validate_settings_module.requests,
+        "get",
+        lambda url, timeout: Response(),
+    )
+
+
+def test_validates_with_the_fallback_schema_offline(monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("the validation must not access the network")
+
+    monkeypatch.setattr(validate_settings_module.requests, "get", no_network)
+
+    errors = validate_settings({"dataset": {"ref": "id"}, "snapshots": []})
+
+    assert "'settings' is a required property at $" in errors
+    assert len(errors) == 3
+
+
+def test_refresh_caches_the_downloaded_schema(schema_cache, monkeypatch):
+    schema = {"type": "object", "required": ["dataset"]}
+    _serve_schema(monkeypatch, schema)
+    start_validation()
+
+    assert refresh_settings_schema()
+    assert json.loads((schema_cache / "settings.schema.json").read_text()) == (
+        schema
+    )
+    assert load_settings_schema() == schema
+    assert validate_settings({"dataset": {}}) == []
+    assert get_validation_results()["settings_schema"] == "player"
+
+
+def test_the_fallback_schema_is_not_the_player_schema():
+    schema = load_settings_schema()
+
+    assert schema["title"] == "py2mappr fallback settings schema"
+    assert "NOT the openmappr-player schema" in schema["description"]
+
+
+def test_reports_the_use_of_the_fallback_schema(capsys):
+    start_validation()
+
+    validate_settings({"dataset": {"ref": "id"}, "snapshots": []})
+
+    assert get_validation_results()["settings_schema"] == "fallback"
+    assert "fallback schema" in capsys.readouterr().out
+
+
+def test_refresh_to_a_custom_cache_dir_is_used(tmp_path, monkeypatch):
+    _serve_schema(monkeypatch, {"type": "object", "required": ["player"]})
+    cache_dir = tmp_path / "custom"
+
+    assert refresh_settings_schema(cache_dir=cache_dir)
+    assert (cache_dir / "settings.schema.json").exists()
+    assert get_settings_validator()({"dataset": {}}) == [
+        "'player' is a required property at $"
+    ]
+    assert get_settings_validator(tmp_path)({"dataset": {}}) != [
+        "'player' is a required property at $"
+    ]
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from benchmarks import generate_map, run_scale
+
+
+def test_generated_map_is_reproducible():
+    nodes, links = generate_map(500, seed=7)
+    same_nodes, same_links = generate_map(500, seed=7)
+
+    pd.testing.assert_frame_equal(nodes, same_nodes)
+    pd.testing.assert_frame_equal(links, same_links)
+    assert (links["source"] != links["target"]).all()
+    assert links["source"].isin(nodes["id"]).all()
+
+
+def test_run_scale_times_the_build_stages(tmp_path):
+    result = run_scale(200, repeat=1, out_dir=tmp_path)
+
+    assert result["nodes"] == 200
+    assert "create_map" in result["timings"]
+    assert "stage:datapoints" in result["timings"]
+    assert "stage:validation" in result["timings"]
+    assert result["output_bytes"]["datapoints"] > 0
@@ -0,0 +1,23 @@
+import py2mappr.map as map_module
+
+
+def test_build_passes_the_build_options(monkeypatch):
+    calls = []
+    monkeypatch.setattr(map_module, "get_project", lambda: "project")
+    monkeypatch.setattr(
+        map_module, "build_map", lambda *args, **kwargs: calls.append(kwargs)
+    )
+    monkeypatch.setattr(
+        map_module.publisher, "set_player_directory", lambda path: None
+    )
+
+    map_module.build(
+        "out",
+        md_cache_dir="md_cache",
+        json_backend="orjson",
+        validation_sample_size=500,
+    )
+
+    assert calls[0]["md_cache_dir"] == "md_cache"
+    assert calls[0]["json_backend"] == "orjson"
+    assert calls[0]["validation_sample_size"] == 500